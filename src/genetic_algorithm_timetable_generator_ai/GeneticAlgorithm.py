@@ -1,13 +1,25 @@
 import numpy as np
-import math
 import random
-from subject import Subject
-from timetable import Timetable
-from mock_data import subjects, period_subjects
+import time
+from .subject import Subject
+from .population import Population
+from .catalog import Catalog
+from .fitness import FitnessEvaluator
+from .constraints import SlotGaps
+from .cache import FitnessCache
+from .crossover import Crossover
+from .mutation import Mutation
+from .selection import select
+from .local_search import LocalSearch
+from .stopping import StoppingCriteria
+from .observers import GenerationRecord, CallbackObserver
 
 class GeneticAlgorithm:
     def __init__(self, population_size, mutation_rate, crossover_rate, elitism_count = None,
-                 selection_method='roulette', tournament_size=None):
+                 selection_method='roulette', tournament_size=None, catalog=None,
+                 workers=None, seed=None, debug=False, constraints=None, cache_size=4096,
+                 crossover_method='row_swap', mutation_method='swap', mutation_swaps=1,
+                 local_search=None, local_search_top_k=2, local_search_iterations=20, stopping=None):
         """
         Inicializa os parâmetros do algoritmo genético.
 
@@ -15,9 +27,23 @@ class GeneticAlgorithm:
         :param mutation_rate: Taxa de mutação.
         :param crossover_rate: Taxa de cruzamento.
         :param elitism_count: Número de indivíduos a serem selecionados para a próxima geração.
-        :param selection_method: Método de seleção (roulette ou tournament).
+        :param selection_method: Método de seleção (roulette, sus, tournament, rank ou truncation).
         :param tournament_size: Tamanho do torneio (se selection_method for tournament).
-        :param crossover_type: Tipo de cruzamento (single_point ou double_point).
+        :param catalog: Catálogo compilado das disciplinas (usa os dados mockados se omitido).
+        :param workers: Número de processos para avaliar a aptidão em paralelo (None ou 1 = serial).
+        :param seed: Semente dos geradores aleatórios, para execuções reprodutíveis.
+        :param debug: Confere a aptidão incremental (mutação e busca local) com a avaliação completa.
+        :param constraints: Registro de restrições da função de aptidão (ConstraintRegistry);
+                            por padrão, conflitos, gaps e aulas consecutivas.
+        :param cache_size: Número de grades no cache LRU da aptidão (0 ou None desativa o cache).
+        :param crossover_method: Tipo de cruzamento (row_swap, uniform_row ou two_point).
+        :param mutation_method: Tipo de mutação (swap, day_block ou conflict).
+        :param mutation_swaps: Número de trocas em cada linha de período sorteada para mutação.
+        :param local_search: Busca local aplicada aos melhores indivíduos a cada geração
+                             (None, hill_climbing ou tabu).
+        :param local_search_top_k: Número de melhores indivíduos refinados pela busca local.
+        :param local_search_iterations: Número máximo de trocas da busca local por indivíduo.
+        :param stopping: Critérios de parada antecipada (StoppingCriteria).
         :param max_known_value: Valor máximo conhecido da função, nem sempre é conhecido.
         """
         self.population_size = population_size
@@ -30,16 +56,46 @@ class GeneticAlgorithm:
         self.best_fitness = None
         self.current_population = None
         self.stop = None # Callback para parar o algoritmo
+        self.stopping = stopping
+        self.stop_reason = None  # Motivo da parada da última execução (ver StoppingCriteria)
+        self.workers = workers
+        self.seed = seed
+        self.debug = debug
+        self.cache_size = cache_size
+        self.crossover_method = crossover_method
+        self.crossover_operator = Crossover(crossover_method, crossover_rate)
+        self.mutation_method = mutation_method
+        self.mutation_swaps = mutation_swaps
+        self.mutation_operator = Mutation(mutation_method, mutation_rate, mutation_swaps)
+        self.local_search = local_search
+        self.local_search_top_k = local_search_top_k
+        self.local_search_iterations = local_search_iterations
+        self.local_search_operator = None
+        if local_search:
+            self.local_search_operator = LocalSearch(local_search, local_search_top_k, local_search_iterations)
+        self.parallel_evaluator = None
+        self.rng = np.random.default_rng(seed)
+        self.timings = {}  # Tempo gasto em cada fase da última geração
+        self.generation = 0  # Última geração concluída
+        self.elapsed = 0.0  # Tempo de execução até a última geração concluída, em segundos
+        self.evaluations = 0  # Número de indivíduos avaliados desde o início da execução
         
+        # Catálogo compilado, construído uma única vez por execução
+        if catalog is None:
+            from .mock_data import subjects, period_subjects
+            catalog = Catalog(subjects, period_subjects)
+        self.catalog = catalog
+
         # Dimensões da grade horária
-        self.num_periods = 6  # Número de períodos
-        self.num_days = 5     # Número de dias na semana
-        self.num_slots = 4    # Número de aulas por dia
+        self.num_periods = self.catalog.num_periods  # Número de períodos
+        self.grid = self.catalog.grid
+        self.num_days = self.grid.num_days    # Número de dias na semana
+        self.num_slots = self.grid.num_slots  # Número de aulas por dia
         self.total_slots = self.num_days * self.num_slots
         
         # Informações sobre as disciplinas
-        self.subjects = subjects
-        self.period_subjects = period_subjects
+        self.subjects = self.catalog.subjects
+        self.period_subjects = self.catalog.period_subjects
         
         # Criar disciplinas vazias para cada período
         self.empty_slots = {
@@ -47,133 +103,187 @@ class GeneticAlgorithm:
             for period in range(1, self.num_periods + 1)
         }
 
+        # Avaliador vetorizado da aptidão de toda a população
+        self.evaluator = FitnessEvaluator(self.catalog, self.num_days, self.num_slots, constraints)
+        self.constraints = self.evaluator.registry
+
+        # Cache da aptidão de grades já avaliadas (cópias geradas pela seleção e pelo elitismo)
+        self.fitness_cache = FitnessCache(cache_size) if cache_size else None
+
+    def get_parameters(self):
+        """
+        Retorna os parâmetros do algoritmo (os argumentos do construtor, exceto
+        o catálogo e o número de processos), por exemplo para checkpoints.
+        """
+        return {
+            "population_size": self.population_size,
+            "mutation_rate": self.mutation_rate,
+            "crossover_rate": self.crossover_rate,
+            "elitism_count": self.elitism_count,
+            "selection_method": self.selection_method,
+            "tournament_size": self.tournament_size,
+            "seed": self.seed,
+            "debug": self.debug,
+            "cache_size": self.cache_size,
+            "crossover_method": self.crossover_method,
+            "mutation_method": self.mutation_method,
+            "mutation_swaps": self.mutation_swaps,
+            "local_search": self.local_search,
+            "local_search_top_k": self.local_search_top_k,
+            "local_search_iterations": self.local_search_iterations,
+        }
+
     def initialize_population(self):
         """
         Cria a população inicial de indivíduos.
+
+        Cada linha de período é uma permutação aleatória do multiconjunto de
+        aulas do período (cada disciplina repetida conforme sua carga horária,
+        completada com horários vagos), então todo indivíduo cumpre exatamente a
+        carga horária. As permutações de toda a população vêm de uma única
+        chamada ao gerador aleatório.
         """
         if not all([self.subjects, self.period_subjects]):
             raise ValueError("As informações de disciplinas devem ser definidas antes de inicializar a população")
 
-        population = np.array([])
-        
-        for _ in range(self.population_size):
-            timetable = Timetable(self.num_periods, self.num_days, self.num_slots)
-            
-            # Para cada período
-            for period in range(self.num_periods):
-                # Obtém as disciplinas deste período
-                period_subjects = self.period_subjects[period + 1]  # +1 porque os períodos começam em 1
-                
-                # Para cada disciplina do período
-                for subject_id in period_subjects:
-                    subject = next(s for s in self.subjects if s.id == subject_id) # Next é usado para pegar o primeiro elemento da lista que corresponde ao id da disciplina
-                    
-                    # Distribui as aulas da disciplina ao longo da semana
-                    remaining_classes = subject.workload
-                    
-                    while remaining_classes > 0:
-                        # Escolhe aleatoriamente um dia e horário
-                        day = random.randint(0, self.num_days - 1)
-                        slot = random.randint(0, self.num_slots - 1)
-                        
-                        # Se o horário estiver vazio
-                        if timetable.is_slot_empty(period, day, slot):
-                            timetable.set_subject_at(period, day, slot, subject.id)
-                            remaining_classes -= 1
-                
-                # Preenche os horários restantes com disciplinas vazias
-                empty_slots = timetable.count_empty_slots(period)
-                for _ in range(empty_slots):
-                    day = random.randint(0, self.num_days - 1)
-                    slot = random.randint(0, self.num_slots - 1)
-                    if timetable.is_slot_empty(period, day, slot):
-                        timetable.set_subject_at(period, day, slot, self.empty_slots[period + 1].id)
-            
-            population = np.append(population, timetable)
-        
+        population = Population.empty(self.population_size, self.num_periods, self.num_days,
+                                      self.num_slots, self.catalog.max_id)
+        population.genes[:] = self.base_schedule()
+        self.rng.permuted(population.genes, axis=-1, out=population.genes)
+
         return population
 
+    def base_schedule(self):
+        """
+        Retorna a grade (num_periods, total_slots) com as aulas de cada período em
+        ordem, seguidas dos horários vagos.
+        """
+        schedule = np.zeros((self.num_periods, self.total_slots), dtype=np.int64)
+
+        for period in range(self.num_periods):
+            # Obtém as disciplinas deste período (+1 porque os períodos começam em 1)
+            period_subjects = np.asarray(self.period_subjects.get(period + 1, []), dtype=np.int64)
+            classes = np.repeat(period_subjects, self.catalog.workload[period_subjects])
+
+            if len(classes) > self.total_slots:
+                raise ValueError(
+                    f"A carga horária do período {period + 1} ({len(classes)} aulas) "
+                    f"excede o número de horários ({self.total_slots})"
+                )
+
+            # O restante da linha fica com disciplinas vazias
+            schedule[period, :len(classes)] = classes
+            schedule[period, len(classes):] = self.empty_slots[period + 1].id
+
+        return schedule
+
     def fitness_function(self):
         """
         Função real a ser maximizada.
+
+        Usa a aptidão em cache de cada indivíduo e só avalia os indivíduos cuja
+        grade mudou desde a última avaliação. Entre esses, as grades que já
+        estão no cache de aptidão (ou repetidas) não são avaliadas de novo.
         """
-        fitness_values = []
-        
-        for timetable in self.current_population:
-            conflicts = self.count_conflicts(timetable)
-            gaps = self.count_gaps(timetable)
-            consecutive = self.count_consecutive_classes(timetable)
-            
-            fitness = 500 - 20 * conflicts - 5 * gaps + 10 * consecutive
-            fitness_values.append(fitness)
-        
-        return np.array(fitness_values)
+        population = self.current_population
+        stale = population.stale()
+
+        if len(stale):
+            if self.parallel_evaluator is not None:
+                evaluate = self.parallel_evaluator.evaluate
+            else:
+                evaluate = self.evaluator.evaluate
+
+            # Os avaliadores recebem os genes e os índices, sem cópias intermediárias
+            if self.fitness_cache is not None:
+                population.fitness[stale], evaluated = self.fitness_cache.evaluate(population.genes, evaluate, stale)
+            else:
+                population.fitness[stale], evaluated = evaluate(population.genes, stale), len(stale)
+            population.evaluated[stale] = True
+            self.evaluations += evaluated
+
+        return population.fitness.copy()
+
+    def constraint_breakdown(self, timetable=None):
+        """
+        Contribuição de cada regra ativa para a aptidão de um indivíduo
+        (por padrão, o melhor indivíduo encontrado).
+
+        :return: Dicionário nome da regra → {"count", "weight", "score", "hard"}.
+        """
+        if timetable is None:
+            timetable = self.best_individual
+        return self.evaluator.breakdown(timetable.schedule)
+
+    def individual_fitness(self, timetable):
+        """
+        Calcula a aptidão de um único indivíduo, célula a célula.
+        Serve de referência para o avaliador vetorizado.
+
+        Usa a base e os pesos do registro de restrições; conflitos, gaps e aulas
+        consecutivas são contados célula a célula, e as demais regras ativas
+        (que não têm versão de referência) são contadas pelo próprio registro.
+        """
+        registry = self.constraints
+        fitness = (registry.base
+                   + registry.weight("conflicts") * self.count_conflicts(timetable)
+                   + registry.weight("gaps") * self.count_gaps(timetable)
+                   + registry.weight("consecutive") * self.count_consecutive_classes(timetable))
+
+        others = [constraint for constraint in registry.active()
+                  if constraint.name not in ("conflicts", "gaps", "consecutive")]
+        if others:
+            context = self.evaluator.context(timetable.schedule[np.newaxis])
+            fitness += sum(constraint.weight * int(constraint.count(context)[0]) for constraint in others)
+
+        return fitness
 
     def count_conflicts(self, timetable):
         """
         Conta o número de conflitos entre os horários dos professores.
+
+        Em cada horário, cada aula além da primeira do mesmo professor conta
+        como um conflito.
         """
         conflicts = 0
+        teacher = self.catalog.teacher
+        is_empty = self.catalog.is_empty
         
-        for period in range(self.num_periods):
-            for day in range(self.num_days):
-                for slot in range(self.num_slots):
+        for day in range(self.num_days):
+            for slot in range(self.num_slots):
+                # Quantas aulas cada professor tem neste horário, somando todos os períodos
+                occupancy = {}
+                for period in range(self.num_periods):
                     subject_id = timetable.get_subject_at(period, day, slot)
-                    if subject_id == 0:  # Ignora slots vazios
-                        continue
-                        
-                    subject = next(s for s in self.subjects if s.id == subject_id)
-                    if subject.is_empty_slot:
+                    if is_empty[subject_id]:  # Ignora slots vazios
                         continue
-                    
-                    # Verifica se o mesmo professor está dando aula em outro período no mesmo horário
-                    for other_period in range(self.num_periods):
-                        if other_period == period:
-                            continue
-                            
-                        other_subject_id = timetable.get_subject_at(other_period, day, slot)
-                        if other_subject_id == 0:
-                            continue
-                            
-                        other_subject = next(s for s in self.subjects if s.id == other_subject_id)
-                        if other_subject.is_empty_slot:
-                            continue
-                            
-                        if subject.teacher == other_subject.teacher:
-                            conflicts += 1
+                    occupancy[teacher[subject_id]] = occupancy.get(teacher[subject_id], 0) + 1
+
+                conflicts += sum(count - 1 for count in occupancy.values())
         
         return conflicts
 
     def count_gaps(self, timetable):
         """
-        Conta o número de gaps entre as aulas com penalizações e bônus específicos.
+        Conta o número de gaps entre as aulas com penalizações e bônus específicos
+        (as regras da grade do catálogo, ver Grid).
         """
         score = 0
+        rule = self.constraints["gaps"] if "gaps" in self.constraints else SlotGaps(0)
+        slot_weights, pair_weights = rule.weights(self.grid)
         
         for period in range(self.num_periods):
             for day in range(self.num_days):
-                # Verifica slots 1-2 juntos
-                if (timetable.is_slot_empty(period, day, 0) and 
-                    timetable.is_slot_empty(period, day, 1)):
-                    score += 15  # Bônus grande para vagos 1-2
-                
-                # Verifica slots 3-4 juntos
-                if (timetable.is_slot_empty(period, day, 2) and 
-                    timetable.is_slot_empty(period, day, 3)):
-                    score += 15  # Bônus grande para vagos 3-4
-                
-                # Verifica slots 2-3 juntos
-                if (timetable.is_slot_empty(period, day, 1) and 
-                    timetable.is_slot_empty(period, day, 2)):
-                    score -= 20  # Penalidade forte para vagos 2-3
+                # Verifica os pares de horários vagos juntos (ex.: 1-2 e 3-4 com bônus, 2-3 com penalidade)
+                for (first, second), weight in pair_weights.items():
+                    if (timetable.is_slot_empty(period, day, first) and
+                        timetable.is_slot_empty(period, day, second)):
+                        score += weight
                 
                 # Verifica slots individuais
                 for slot in range(self.num_slots):
                     if timetable.is_slot_empty(period, day, slot):
-                        if slot in [0, 3]:  # Slots 1 ou 4
-                            score += 5  # Pequeno bônus
-                        elif slot in [1, 2]:  # Slots 2 ou 3
-                            score -= 10  # Penalidade
+                        score += slot_weights[slot]
         
         return -score  # Retorna negativo porque queremos maximizar o fitness
 
@@ -182,6 +292,7 @@ class GeneticAlgorithm:
         Conta o número de aulas consecutivas da mesma disciplina.
         """
         consecutive = 0
+        is_empty = self.catalog.is_empty
         
         for period in range(self.num_periods):
             for day in range(self.num_days):
@@ -190,36 +301,44 @@ class GeneticAlgorithm:
                 
                 for slot in range(self.num_slots):
                     subject_id = timetable.get_subject_at(period, day, slot)
-                    if subject_id == 0:
-                        continue
-                        
-                    subject = next(s for s in self.subjects if s.id == subject_id)
-                    if subject.is_empty_slot:
+                    if is_empty[subject_id]:
                         continue
                     
-                    if subject.id == current_subject:
+                    if subject_id == current_subject:
                         current_count += 1
                         if current_count > 1:
                             consecutive += 1
                     else:
-                        current_subject = subject.id
+                        current_subject = subject_id
                         current_count = 1
         
         return consecutive
 
+    def check_fitness(self, timetable):
+        """
+        Confere a aptidão em cache de um indivíduo com a avaliação completa.
+        """
+        if timetable.fitness is None:
+            return
+        expected = self.evaluator.evaluate(timetable.schedule[np.newaxis])[0]
+        if timetable.fitness != expected:
+            raise AssertionError(
+                f"Aptidão incremental ({timetable.fitness}) diferente da avaliação completa ({expected})"
+            )
+
     def _get_day_and_slot(self, slot_index):
         """
-        Converte um índice de slot (0-19) em dia (0-4) e horário (0-3)
+        Converte um índice de slot (0 a total_slots - 1) em dia e horário
         """
-        day = slot_index // 4
-        time_slot = slot_index % 4
+        day = slot_index // self.num_slots
+        time_slot = slot_index % self.num_slots
         return day, time_slot
 
     def _get_slot_index(self, day, time_slot):
         """
-        Converte dia (0-4) e horário (0-3) em índice de slot (0-19)
+        Converte dia e horário em índice de slot (0 a total_slots - 1)
         """
-        return day * 4 + time_slot
+        return day * self.num_slots + time_slot
 
     def fitness(self):
         """
@@ -229,7 +348,7 @@ class GeneticAlgorithm:
         fitness_values = self.fitness_function()
         # Índice do melhor indivíduo
         best_idx = np.argmax(fitness_values)
-        self.best_individual = self.current_population[best_idx]
+        self.best_individual = self.current_population[best_idx].copy()
         self.best_fitness = fitness_values[best_idx]
 
         return fitness_values
@@ -238,158 +357,258 @@ class GeneticAlgorithm:
     def selection(self, fitness_values):
         """
         Seleciona os indivíduos para reprodução, com base no método definido.
-        """
-
-        # Seleciona o método de seleção
-        if self.selection_method == 'roulette':
-            # Seleciona os indivíduos para reprodução
-            self.current_population = self.roulette_selection(fitness_values)
-        elif self.selection_method == 'tournament':
-            # Seleciona os indivíduos para reprodução
-            self.current_population = self.tournament_selection(fitness_values)
 
-    def roulette_selection(self, fitness_values):
+        :return: Índices dos pais selecionados na população atual (ver selection.select).
         """
-        Implementa a seleção por roleta.
+        options = {}
+        if self.selection_method == 'tournament':
+            options["size"] = self.tournament_size
+        return select(self.selection_method, fitness_values, self.population_size, self.rng, **options)
+
+    def crossover(self, parents=None):
         """
+        Realiza o cruzamento entre pares de pais, em lote sobre o tensor da
+        população (ver Crossover).
 
-        # Calcula a probabilidade de cada indivíduo
-        probabilities = fitness_values / np.sum(fitness_values)
-        # Seleciona os indivíduos para reprodução
-        selected_individuals = np.random.choice(len(self.current_population), size=self.population_size, p=probabilities)
-        # Retorna os indivíduos selecionados
-        return self.current_population[selected_individuals]
+        :param parents: Índices dos pais selecionados (por padrão, toda a população).
+        """
+        self.crossover_operator.rate = self.crossover_rate
+        self.crossover_operator.apply(self.current_population, self.rng, parents)
 
-    def tournament_selection(self, fitness_values):
+    def mutation(self):
         """
-        Implementa a seleção por torneio.
+        Aplica a mutação em lote em toda a população (ver Mutation). Com as
+        regras locais (conflitos, gaps e aulas consecutivas), a aptidão dos
+        indivíduos alterados é atualizada só nos horários e dias trocados; com
+        outras regras, eles são reavaliados na próxima chamada de fitness().
         """
-        selected = []
-
-        for _ in range(self.population_size):
-            # Sorteia os indivíduos aleatórios da população de acordo com o tamanho do torneio
-            participants_indices = np.random.choice(len(self.current_population), self.tournament_size, replace=False)
-            participants_fitness = fitness_values[participants_indices]
-            
-            # Seleciona o melhor
-            winner_indice = participants_indices[np.argmax(participants_fitness)]
-            selected.append(self.current_population[winner_indice])
+        self.mutation_operator.rate = self.mutation_rate
+        mutated = self.mutation_operator.apply(self.current_population, self.rng, self.catalog, self.evaluator)
 
-        return np.array(selected)
+        if self.debug:
+            for index in mutated:
+                self.check_fitness(self.current_population[index])
 
-    def crossover(self):
-        """
-        Realiza o cruzamento entre dois pais (one-point ou two-point).
+    def start(self):
         """
+        Prepara uma nova execução: semeia os geradores aleatórios e cria a
+        população inicial.
 
-        # TODO : Adaptar o crossover
-        np.random.shuffle(self.current_population)
-        children = []
-        n = len(self.current_population)
-        i = 0
-        while i < n - 1: # Parar antes do último se for ímpar
-            parent1 = self.current_population[i]
-            parent2 = self.current_population[i+1]
+        :return: Aptidão da população inicial.
+        """
+        if self.seed is not None:
+            random.seed(self.seed)
+            np.random.seed(self.seed)
+            self.rng = np.random.default_rng(self.seed)
+
+        self.evaluations = 0
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+        self.current_population = self.initialize_population()
+        return self.fitness()
 
-            if random.random() < self.crossover_rate:
-    
-                child1 = parent1
-                child2 = parent2
-                
-                print(f"Parent1: {parent1}")
+    def step(self):
+        """
+        Executa uma geração: seleção, cruzamento, mutação e elitismo.
+        O tempo gasto em cada fase fica em self.timings.
 
-                periods = parent1.num_periods
+        :return: Aptidão da nova população.
+        """
+        timings = {}
+        elite_individuals = None
 
-                rows_to_swap = random.sample(range(periods), periods//2)
+        # Calcula a aptidão de cada indivíduo, 
+        fitness_values = self.fitness()
+
+        # Elitismo: mantém os melhores indivíduos da geração anterior
+        if self.elitism_count and self.elitism_count > 0:
+            elite_indices = np.argsort(fitness_values)[-self.elitism_count:]
+            elite_individuals = self.current_population.take(elite_indices)
+
+        # Faz a seleção, crossover e mutação
+        started = time.perf_counter()
+        parents = self.selection(fitness_values)
+        timings["selection"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.crossover(parents)
+        timings["crossover"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.mutation()
+        timings["mutation"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if elite_individuals is not None:
+            new_fitness_values = self.fitness_function()
+            worst_indices = np.argsort(new_fitness_values)[:self.elitism_count]
+            self.current_population.replace(worst_indices, elite_individuals)
+
+        fitness_values = self.fitness()
+        timings["fitness"] = time.perf_counter() - started
+
+        # Fase memética: busca local nos melhores indivíduos
+        if self.local_search_operator is not None:
+            started = time.perf_counter()
+            refined = self.local_search_operator.apply(self.current_population, self.evaluator, self.rng)
+            if self.debug:
+                for index in refined:
+                    self.check_fitness(self.current_population[index])
+            fitness_values = self.fitness()
+            timings["local_search"] = time.perf_counter() - started
 
-                for row in rows_to_swap:
-                    child1.schedule[row] = parent2.schedule[row]
-                    child2.schedule[row] = parent1.schedule[row]
+        self.timings = timings
+        return fitness_values
 
-                children.extend([child1, child2])
-            else:
-                children.extend([parent1, parent2])
-            i += 2
-        self.current_population = np.array(children)
+    def diversity(self):
+        """
+        Fração média de genes da população diferentes dos genes do melhor indivíduo.
+        """
+        genes = self.current_population.genes
+        if len(genes) == 0:
+            return 0.0
+        return float(np.mean(genes != self.best_individual.schedule))
 
-        if n % 2 == 1:
-            children.append(self.current_population[-1])
-        self.current_population = np.array(children)
+    def best_individuals(self, count):
+        """
+        Retorna cópias dos melhores indivíduos da população atual, do melhor
+        para o pior.
+        """
+        fitness_values = self.fitness_function()
+        best_indices = np.argsort(fitness_values)[::-1][:count]
+        return [self.current_population[idx].copy() for idx in best_indices]
 
-    def mutation(self):
+    def replace_worst(self, individuals):
         """
-        Aplica a mutação no indivíduo.
+        Substitui os piores indivíduos da população atual por cópias dos
+        indivíduos recebidos (por exemplo, migrantes de outra ilha).
         """
+        if len(individuals) == 0:
+            return self.fitness()
 
-        # TODO : Adaptar a mutação
+        fitness_values = self.fitness_function()
+        worst_indices = np.argsort(fitness_values)[:len(individuals)]
+        for individual, idx in zip(individuals, worst_indices):
+            self.current_population[idx] = individual
 
-        for idx, individual in enumerate(self.current_population):
-            for i in range(individual.num_periods):
-                if random.random() < self.mutation_rate:
+        return self.fitness()
 
-                    # Seleciona duas colunas aleatórias
-                    columns_to_swap = random.sample(range(individual.total_slots), 2)
-                        
-                    # Troca as colunas
-                    individual_copy =  individual.schedule[i, columns_to_swap[0]]
-                    individual.schedule[i, columns_to_swap[0]] = individual.schedule[i, columns_to_swap[1]]
-                    individual.schedule[i, columns_to_swap[1]] = individual_copy
+    def evolve(self, generations, resume=False):
+        """
+        Executa o algoritmo genético geração a geração.
+
+        É um gerador: cria a população inicial e produz um GenerationRecord para
+        ela (geração 0) e para cada geração seguinte. Não faz nenhuma saída;
+        logs, gráficos e checkpoints ficam a cargo de quem consome os registros
+        (ver run e observers).
+
+        A execução termina ao atingir o número de gerações, quando o callback
+        stop pede a parada ou quando um dos critérios de stopping é atendido; o
+        motivo fica em self.stop_reason.
+
+        :param generations: Número máximo de gerações.
+        :param resume: Continua a partir do estado atual (por exemplo, restaurado
+                       de um checkpoint) em vez de criar uma nova população. O
+                       primeiro registro é o da última geração concluída; o
+                       tempo de execução e o acompanhamento dos critérios de
+                       parada continuam de onde pararam.
+        """
+        if self.workers and self.workers > 1:
+            from .parallel import ParallelEvaluator
+            self.parallel_evaluator = ParallelEvaluator(self.evaluator, self.workers, self.population_size)
+        self.stop_reason = None
+        if self.stopping is not None and not resume:
+            self.stopping.reset()
+        try:
+            started = time.perf_counter()
+
+            if resume:
+                # O tempo de execução continua a contar de onde parou
+                run_started = started - self.elapsed
+                fitness_values = self.fitness()
+                self.timings = {"resume": time.perf_counter() - started}
+            else:
+                run_started = started
+                fitness_values = self.start()
+                self.generation = 0
+                self.timings = {"init": time.perf_counter() - started}
+            record = self._record(self.generation, fitness_values, run_started)
+            yield record
+            self.stop_reason = self._check_stop(record)
+
+            generation = self.generation + 1
+            while self.stop_reason is None:
+                if generation > generations:
+                    self.stop_reason = StoppingCriteria.MAX_GENERATIONS
+                    break
 
-                    self.current_population[idx] = individual
-                        
+                if self.stop and self.stop():
+                    self.stop_reason = StoppingCriteria.STOPPED
                     break
 
-    def run(self, generations, update_callback=None):
+                fitness_values = self.step()
+                self.generation = generation
+                record = self._record(generation, fitness_values, run_started)
+                yield record
+                self.stop_reason = self._check_stop(record)
+                generation += 1
+        finally:
+            if self.parallel_evaluator is not None:
+                self.parallel_evaluator.close()
+                self.parallel_evaluator = None
+
+    def _check_stop(self, record):
+        """
+        Motivo de parada antecipada depois da geração do registro (ou None).
+        """
+        if self.stopping is None:
+            return None
+        return self.stopping.check(self, record)
+
+    def _record(self, generation, fitness_values, run_started):
+        """
+        Monta o GenerationRecord da população atual.
+        """
+        self.elapsed = time.perf_counter() - run_started
+        return GenerationRecord(
+            generation=generation,
+            best_fitness=self.best_fitness,
+            mean_fitness=float(np.mean(fitness_values)),
+            worst_fitness=fitness_values.min(),
+            diversity=self.diversity(),
+            timings=self.timings,
+            elapsed=self.elapsed,
+            best_individual=self.best_individual
+        )
+
+    def run(self, generations, update_callback=None, observers=None, resume=False):
         """
         Executa o algoritmo genético por um número definido de gerações.
         
         :param generations: Número de gerações a serem executadas.
+        :param update_callback: Função chamada a cada geração com
+                                (generation, best_individual, best_fitness).
+        :param observers: Lista de observadores (ver observers.Observer).
+        :param resume: Continua a partir do estado atual (ver evolve).
         :return: O melhor indivíduo encontrado.
         """
-        elite_individuals = None
-        self.current_population = self.initialize_population()
-        print(f"População inicial: {self.current_population}")
-        print(f"Aptidão da população inicial: {self.fitness()}")
-        for _ in range(generations):
-
-            if self.stop and self.stop():
-                break
-
-            print(f"Geração {_ + 1}")
-            
-            # Calcula a aptidão de cada indivíduo, 
-            fitness_values = self.fitness()
-            print(f"Aptidão da população: {fitness_values}")
-
-            # Elitismo: mantém os melhores indivíduos da geração anterior
-            if self.elitism_count and self.elitism_count > 0:
-                print(f"Elitismo: {self.elitism_count}")
-                elite_indices = np.argsort(fitness_values)[-self.elitism_count:]
-                print(f"Índices dos indivíduos elitistas: {elite_indices}")
-                elite_individuals = self.current_population[elite_indices]
-
-            # Faz a seleção, crossover e mutação
-            self.selection(fitness_values)
-            self.crossover() 
-            self.mutation()
-
-            if elite_individuals is not None:
-                new_fitness_values = self.fitness_function()
-                worst_indices = np.argsort(new_fitness_values)[:self.elitism_count]
-                for i, idx in enumerate(worst_indices):
-                    self.current_population[idx] = elite_individuals[i]
-
-            # Atualiza a população com os melhores indivíduos
-
-            print(f"População após a mutação e elitismo: {self.current_population}")
-
-            self.fitness()
-
-            if update_callback:
-                update_callback(
-                    generation=_ + 1,
-                    best_individual=self.best_individual,
-                    best_fitness=self.best_fitness
-                )
-
-        return self.best_individual, self.best_fitness
\ No newline at end of file
+        observers = list(observers or [])
+        if update_callback:
+            observers.append(CallbackObserver(update_callback))
+
+        record = None
+        starting = True
+        for record in self.evolve(generations, resume=resume):
+            # O primeiro registro descreve a população de partida
+            if starting:
+                starting = False
+                for observer in observers:
+                    observer.on_start(self)
+                continue
+            for observer in observers:
+                observer.on_generation(record)
+
+        for observer in observers:
+            observer.on_finish(self, record)
+
+        return self.best_individual, self.best_fitness
@@ -0,0 +1,335 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+from . import kernels
+from .catalog import Catalog, group_by_period
+from .grid import Grid
+from .GeneticAlgorithm import GeneticAlgorithm
+from .mock_data import subjects, period_subjects
+from .subject import Subject
+
+PHASES = ("init", "fitness", "selection", "crossover", "mutation", "local_search")
+
+def scaled_catalog(scale):
+    """
+    Gera um catálogo com scale vezes mais disciplinas e períodos que o mockado.
+
+    Cada cópia repete os períodos e as disciplinas do catálogo mockado; cópias
+    vizinhas (0-1, 2-3, ...) compartilham os professores, para que continue
+    havendo conflitos entre períodos.
+    """
+    if scale == 1:
+        return Catalog(subjects, period_subjects)
+
+    num_periods = max(period_subjects)
+    max_id = max(subject.id for subject in subjects)
+
+    scaled_subjects = []
+    scaled_period_subjects = {}
+    for copy in range(scale):
+        for subject in subjects:
+            scaled_subjects.append(Subject(
+                subject.id + copy * max_id,
+                subject.name,
+                f"{subject.teacher} ({copy // 2})",
+                subject.workload,
+                subject.period + copy * num_periods
+            ))
+        for period, ids in period_subjects.items():
+            scaled_period_subjects[period + copy * num_periods] = [
+                subject_id + copy * max_id for subject_id in ids
+            ]
+
+    return Catalog(scaled_subjects, scaled_period_subjects)
+
+def grid_catalog(num_periods, num_days, num_slots, subjects_per_period=6, occupancy=0.8, seed=0):
+    """
+    Gera um catálogo sintético para uma grade num_periods x num_days x num_slots.
+
+    Cada período tem subjects_per_period disciplinas que ocupam, juntas,
+    cerca de occupancy dos horários da semana; os professores são
+    compartilhados por períodos vizinhos, para que haja conflitos.
+    """
+    rng = np.random.default_rng(seed)
+    grid = Grid(num_days, num_slots)
+    classes = max(subjects_per_period, int(grid.total_slots * occupancy))
+    num_teachers = max(1, num_periods * subjects_per_period // 2)
+
+    subjects = []
+    for period in range(1, num_periods + 1):
+        # Divide as aulas do período entre as disciplinas (carga mínima de 1)
+        cuts = np.sort(rng.choice(np.arange(1, classes), size=subjects_per_period - 1, replace=False))
+        workloads = np.diff(np.concatenate([[0], cuts, [classes]]))
+        for workload in workloads:
+            subject_id = len(subjects) + 1
+            teacher = int(rng.integers(num_teachers))
+            subjects.append(Subject(subject_id, f"Disciplina {subject_id}", f"Professor {teacher}",
+                                    int(workload), period))
+
+    return Catalog(subjects, group_by_period(subjects), grid)
+
+def grid_scaling(shapes, generations, parameters, seed=0):
+    """
+    Mede o tempo por geração e a memória em grades de tamanhos diferentes.
+
+    :param shapes: Lista de tuplas (num_periods, num_days, num_slots).
+    :return: Lista com as métricas de cada grade, incluindo o tempo e a
+             memória por célula (que devem ficar aproximadamente constantes
+             se o custo crescer linearmente com o tamanho da grade).
+    """
+    results = []
+    for num_periods, num_days, num_slots in shapes:
+        catalog = grid_catalog(num_periods, num_days, num_slots, seed=seed)
+        cells = num_periods * num_days * num_slots
+
+        ga = GeneticAlgorithm(catalog=catalog, seed=seed, **parameters)
+        seconds = []
+        for record in ga.evolve(generations):
+            if record.generation > 0:
+                seconds.append(sum(record.timings.values()))
+
+        seconds_per_generation = float(np.median(seconds)) if seconds else None
+        peak = peak_memory(catalog, seed, min(generations, 3), parameters)
+        results.append({
+            "periods": num_periods,
+            "days": num_days,
+            "slots": num_slots,
+            "cells": cells,
+            "seconds_per_generation": seconds_per_generation,
+            "microseconds_per_cell": seconds_per_generation * 1e6 / cells if seconds else None,
+            "population_bytes": ga.current_population.nbytes,
+            "peak_memory_bytes": peak,
+            "peak_bytes_per_cell": peak / cells,
+            "best_fitness": float(ga.best_fitness),
+        })
+    return results
+
+def worker_scaling(workers_list, scale, population_size, repeat=5, seed=0):
+    """
+    Mede a vazão da avaliação da aptidão com diferentes números de processos.
+
+    Avalia repeat vezes uma população aleatória de population_size
+    indivíduos do catálogo na escala informada (workers=1 é a avaliação serial).
+
+    :param workers_list: Números de processos a medir (ex.: [1, 2, 4, 8]).
+    :return: Lista com as avaliações por segundo e o ganho em relação a workers=1.
+    """
+    from .parallel import ParallelEvaluator
+
+    catalog = scaled_catalog(scale)
+    ga = GeneticAlgorithm(population_size, 0.0, 0.0, catalog=catalog, seed=seed)
+    genes = ga.initialize_population().genes
+
+    results = []
+    for workers in workers_list:
+        evaluator = ga.evaluator if workers == 1 else ParallelEvaluator(ga.evaluator, workers, population_size)
+        try:
+            evaluator.evaluate(genes)  # Aquecimento (cria o pool e o segmento de memória compartilhada)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                evaluator.evaluate(genes)
+            seconds = (time.perf_counter() - started) / repeat
+        finally:
+            if workers != 1:
+                evaluator.close()
+        results.append({
+            "workers": workers,
+            "seconds_per_evaluation": seconds,
+            "evaluations_per_second": population_size / seconds,
+        })
+
+    serial = next((result for result in results if result["workers"] == 1), results[0])
+    for result in results:
+        result["speedup"] = serial["seconds_per_evaluation"] / result["seconds_per_evaluation"]
+    return {"scale": scale, "population_size": population_size, "cpus": os.cpu_count(), "runs": results}
+
+def run_case(catalog, seed, generations, parameters):
+    """
+    Executa o algoritmo genético sem interface e mede o desempenho.
+
+    :return: Dicionário com as métricas da execução.
+    """
+    ga = GeneticAlgorithm(catalog=catalog, seed=seed, **parameters)
+
+    phases = dict.fromkeys(PHASES, 0.0)
+    history = []
+    started = time.perf_counter()
+    for record in ga.evolve(generations):
+        for phase, seconds in record.timings.items():
+            phases[phase] = phases.get(phase, 0.0) + seconds
+        history.append(float(record.best_fitness))
+    elapsed = time.perf_counter() - started
+
+    evolution = elapsed - phases["init"]
+    return {
+        "seed": seed,
+        "generations": ga.generation,
+        "seconds": elapsed,
+        "generations_per_second": ga.generation / evolution if evolution > 0 else None,
+        "evaluations": ga.evaluations,
+        "evaluations_per_second": ga.evaluations / elapsed if elapsed > 0 else None,
+        "phases": phases,
+        "fitness_cache": ga.fitness_cache.statistics() if ga.fitness_cache is not None else None,
+        "peak_memory_bytes": peak_memory(catalog, seed, min(generations, 3), parameters),
+        "best_fitness": history[-1],
+        "best_fitness_history": history,
+    }
+
+def peak_memory(catalog, seed, generations, parameters):
+    """
+    Pico de memória alocada (tracemalloc) em uma execução curta.
+
+    É medido em uma execução separada, porque o tracemalloc deixa as
+    alocações mais lentas e distorceria os tempos.
+    """
+    tracemalloc.start()
+    try:
+        ga = GeneticAlgorithm(catalog=catalog, seed=seed, **parameters)
+        for _ in ga.evolve(generations):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import numpy
+numpy_loaded = time.perf_counter()
+import genetic_algorithm_timetable_generator_ai.GeneticAlgorithm
+finished = time.perf_counter()
+print(json.dumps({
+    "numpy_seconds": numpy_loaded - started,
+    "engine_seconds": finished - numpy_loaded,
+    "total_seconds": finished - started,
+    "gui_modules": sorted(name for name in ("tkinter", "matplotlib", "mock_data") if any(
+        module == name or module.startswith(name + ".") or module.endswith("." + name)
+        for module in sys.modules
+    )),
+}))
+"""
+
+def import_time(repeat=5):
+    """
+    Mede o tempo de importação do motor (GeneticAlgorithm) em processos novos.
+
+    Guarda o menor tempo entre as repetições e a lista de módulos de interface,
+    gráfico ou dados mockados carregados junto com o motor (deve ficar vazia).
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = {**os.environ, "PYTHONPATH": package_root}
+
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", IMPORT_PROBE], capture_output=True,
+                                text=True, env=environment, check=True)
+        samples.append(json.loads(result.stdout))
+
+    best = min(samples, key=lambda sample: sample["total_seconds"])
+    return best
+
+def git_revision():
+    """
+    Commit atual do repositório, se disponível.
+    """
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def run_benchmark(scales, seeds, generations, parameters):
+    """
+    Executa todas as combinações de escala e semente.
+
+    :return: Dicionário com os metadados e os resultados, pronto para JSON.
+    """
+    cases = []
+    for scale in scales:
+        catalog = scaled_catalog(scale)
+        runs = [run_case(catalog, seed, generations, parameters) for seed in seeds]
+        cases.append({
+            "scale": scale,
+            "subjects": len(catalog),
+            "periods": catalog.num_periods,
+            "runs": runs,
+            "mean_generations_per_second": float(np.mean([run["generations_per_second"] for run in runs])),
+            "mean_evaluations_per_second": float(np.mean([run["evaluations_per_second"] for run in runs])),
+            "mean_best_fitness": float(np.mean([run["best_fitness"] for run in runs])),
+        })
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "fitness_backend": kernels.BACKEND,
+        "generations": generations,
+        "parameters": parameters,
+        "import": import_time(),
+        "cases": cases,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do algoritmo genético (vazão e qualidade da solução)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Escalas do catálogo (1, 10, 100, ...)")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2], help="Sementes de cada execução")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--population-size", type=int, default=100)
+    parser.add_argument("--mutation-rate", type=float, default=0.2)
+    parser.add_argument("--crossover-rate", type=float, default=0.85)
+    parser.add_argument("--elitism-count", type=int, default=2)
+    parser.add_argument("--selection-method", default="tournament")
+    parser.add_argument("--tournament-size", type=int, default=3)
+    parser.add_argument("--grid-scaling", nargs="*", metavar="PxDxS",
+                        help="Mede o custo por geração em grades períodos x dias x aulas "
+                             "(ex.: 6x5x4 50x6x10 200x6x10)")
+    parser.add_argument("--worker-scaling", type=int, nargs="*", metavar="WORKERS",
+                        help="Mede a avaliação paralela com esses números de processos (padrão: 1 2 4 8)")
+    parser.add_argument("--output", default="benchmark.json", help="Arquivo JSON com os resultados")
+    args = parser.parse_args(argv)
+
+    parameters = {
+        "population_size": args.population_size,
+        "mutation_rate": args.mutation_rate,
+        "crossover_rate": args.crossover_rate,
+        "elitism_count": args.elitism_count,
+        "selection_method": args.selection_method,
+        "tournament_size": args.tournament_size,
+    }
+    results = run_benchmark(args.scales, args.seeds, args.generations, parameters)
+    if args.grid_scaling is not None:
+        shapes = [tuple(int(value) for value in shape.split("x")) for shape in args.grid_scaling or
+                  ["6x5x4", "50x6x10", "100x6x10", "200x6x10"]]
+        results["grid_scaling"] = grid_scaling(shapes, args.generations, parameters)
+    if args.worker_scaling is not None:
+        results["worker_scaling"] = worker_scaling(args.worker_scaling or [1, 2, 4, 8], max(args.scales),
+                                                   max(args.population_size, 400))
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    print(f"Kernels de aptidão: {results['fitness_backend']}")
+    print(f"Importação do motor: {results['import']['engine_seconds'] * 1000:.1f} ms "
+          f"(+ {results['import']['numpy_seconds'] * 1000:.1f} ms do numpy)")
+    for case in results["cases"]:
+        print(f"Escala {case['scale']:>4}: {case['mean_generations_per_second']:.1f} gerações/s, "
+              f"{case['mean_evaluations_per_second']:.0f} avaliações/s, "
+              f"melhor aptidão média {case['mean_best_fitness']:.1f}")
+    for case in results.get("grid_scaling", []):
+        print(f"Grade {case['periods']}x{case['days']}x{case['slots']}: "
+              f"{case['seconds_per_generation'] * 1000:.1f} ms/geração "
+              f"({case['microseconds_per_cell']:.2f} µs/célula), "
+              f"pico de memória {case['peak_bytes_per_cell']:.0f} B/célula")
+    for case in results.get("worker_scaling", {}).get("runs", []):
+        print(f"{case['workers']} processo(s): {case['evaluations_per_second']:.0f} avaliações/s "
+              f"({case['speedup']:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+import numpy as np
+
+class FitnessCache:
+    def __init__(self, max_size=4096):
+        """
+        Cache LRU da aptidão de grades horárias já avaliadas.
+
+        A chave é o conteúdo (bytes) da grade: o dicionário usa o hash desses
+        bytes e compara o conteúdo em caso de colisão, então uma grade nunca
+        recebe a aptidão de outra. Quando o cache enche, a grade usada há mais
+        tempo é descartada.
+
+        :param max_size: Número máximo de grades guardadas.
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def evaluate(self, genes, evaluate, rows=None):
+        """
+        Retorna a aptidão de cada grade do tensor, avaliando só as que não estão
+        no cache.
+
+        Grades repetidas dentro do próprio tensor são avaliadas uma única vez.
+
+        :param genes: Tensor (quantidade, num_periods, total_slots).
+        :param evaluate: Função que avalia as linhas informadas de um tensor de
+                         grades, evaluate(genes, rows) (ex.: FitnessEvaluator.evaluate).
+        :param rows: Índices das grades a consultar (por padrão, todas).
+        :return: Vetor com a aptidão de cada grade consultada e o número de grades avaliadas.
+        """
+        if rows is None:
+            rows = np.arange(len(genes))
+        fitness = np.empty(len(rows), dtype=np.int64)
+        missing = {}  # Grade ausente do cache → posições no resultado
+
+        for index, row in enumerate(rows):
+            key = genes[row].tobytes()
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                fitness[index] = value
+                self.hits += 1
+            elif key in missing:
+                missing[key].append(index)
+                self.hits += 1
+            else:
+                missing[key] = [index]
+                self.misses += 1
+
+        if missing:
+            first = [rows[positions[0]] for positions in missing.values()]
+            values = evaluate(genes, np.asarray(first))
+            for (key, positions), value in zip(missing.items(), values):
+                fitness[positions] = value
+                self.put(key, int(value))
+
+        return fitness, len(missing)
+
+    def put(self, key, value):
+        """
+        Guarda a aptidão de uma grade, descartando a menos usada se o cache estiver cheio.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Esvazia o cache (necessário se as regras da função de aptidão mudarem).
+        """
+        self.entries.clear()
+
+    def statistics(self):
+        """
+        Contadores de acertos e falhas do cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.entries),
+        }
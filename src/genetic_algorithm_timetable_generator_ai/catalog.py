@@ -0,0 +1,249 @@
+import csv
+import hashlib
+import json
+import os
+import numpy as np
+from .grid import Grid
+from .subject import Subject
+
+# Versão do formato do cache compilado (muda quando o layout dos arrays muda)
+CACHE_VERSION = 1
+
+# Campos de cada disciplina nos arquivos CSV/JSON, na ordem do construtor de Subject
+FIELDS = ("id", "name", "teacher", "workload", "period")
+
+def group_by_period(subjects):
+    """
+    Monta o dicionário período → lista de ids das disciplinas em uma única
+    passada pela lista, com os períodos em ordem crescente.
+    """
+    period_subjects = {}
+    for subject in subjects:
+        period_subjects.setdefault(subject.period, []).append(subject.id)
+    return dict(sorted(period_subjects.items()))
+
+def file_hash(path):
+    """
+    Hash (SHA-256) do conteúdo de um arquivo.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_records(path):
+    """
+    Lê as disciplinas de um arquivo CSV (com cabeçalho id,name,teacher,workload,period)
+    ou JSON ({"subjects": [...]} ou uma lista de objetos com esses campos).
+
+    :return: Array estruturado com um registro por disciplina e o dicionário
+             da grade (chave "grid" do JSON) ou None.
+    """
+    grid = None
+    if path.lower().endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as file:
+            reader = csv.DictReader(file)
+            missing = [field for field in FIELDS if field not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"{path}: colunas ausentes: {', '.join(missing)}")
+            rows = [(row, f"linha {line}") for line, row in enumerate(reader, start=2)]
+    else:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        items = data["subjects"] if isinstance(data, dict) else data
+        if isinstance(data, dict):
+            grid = data.get("grid")
+        rows = [(item, f"disciplina {index}") for index, item in enumerate(items)]
+
+    records = []
+    for row, where in rows:
+        try:
+            records.append((int(row["id"]), str(row["name"]).strip(), str(row["teacher"]).strip(),
+                            int(row["workload"]), int(row["period"])))
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"{path}, {where}: registro inválido ({error!r})") from None
+
+    name_length = max((len(record[1]) for record in records), default=1)
+    teacher_length = max((len(record[2]) for record in records), default=1)
+    dtype = [("id", np.int64), ("name", f"U{max(name_length, 1)}"), ("teacher", f"U{max(teacher_length, 1)}"),
+             ("workload", np.int64), ("period", np.int64)]
+    return np.array(records, dtype=dtype), grid
+
+def validate_records(records, total_slots=None):
+    """
+    Confere os registros das disciplinas e levanta ValueError com todos os
+    problemas encontrados: ids repetidos ou não positivos, nome ou professor
+    vazios, carga horária ou período não positivos e períodos cuja carga
+    horária total excede o número de horários da grade.
+
+    :param records: Array estruturado (ver read_records).
+    :param total_slots: Número de horários da grade (None para não conferir a carga por período).
+    """
+    problems = []
+
+    ids, counts = np.unique(records["id"], return_counts=True)
+    if np.any(counts > 1):
+        problems.append(f"ids repetidos: {ids[counts > 1].tolist()[:10]}")
+    for field, label in (("id", "ids"), ("workload", "cargas horárias"), ("period", "períodos")):
+        invalid = records["id"][records[field] <= 0]
+        if len(invalid):
+            problems.append(f"{label} não positivos nas disciplinas {invalid.tolist()[:10]}")
+    for field, label in (("name", "nome"), ("teacher", "professor")):
+        invalid = records["id"][records[field] == ""]
+        if len(invalid):
+            problems.append(f"{label} vazio nas disciplinas {invalid.tolist()[:10]}")
+
+    if total_slots is not None:
+        problems.extend(workload_problems(records, total_slots))
+
+    if problems:
+        raise ValueError("Catálogo inválido: " + "; ".join(problems))
+
+def workload_problems(records, total_slots):
+    """
+    Períodos cuja carga horária total excede o número de horários da grade.
+    """
+    if len(records) == 0:
+        return []
+    periods = np.maximum(records["period"], 0)
+    workload = np.bincount(periods, weights=np.maximum(records["workload"], 0)).astype(np.int64)
+    return [
+        f"a carga horária do período {period} ({workload[period]} aulas) "
+        f"excede o número de horários ({total_slots})"
+        for period in np.flatnonzero(workload > total_slots)[:10]
+    ]
+
+class Catalog:
+    def __init__(self, subjects, period_subjects, grid=None):
+        """
+        Catálogo compilado de disciplinas, construído uma única vez por execução.
+
+        Guarda tabelas densas indexadas pelo id da disciplina, para que os trechos
+        críticos consultem professor, carga horária e período sem percorrer a lista
+        de disciplinas.
+
+        :param subjects: Lista de disciplinas (objetos Subject).
+        :param period_subjects: Dicionário período → lista de ids das disciplinas.
+        :param grid: Dimensões da grade e regras dos horários vagos (Grid);
+                     por padrão, 5 dias com 4 aulas.
+        """
+        self.grid = grid if grid is not None else Grid()
+        self.subjects = list(subjects)
+        self.period_subjects = period_subjects
+        self.num_periods = max(period_subjects, default=0)
+
+        # Índice numérico de cada professor (ordem de aparição no catálogo)
+        self.teachers = []
+        teacher_index = {}
+        for subject in self.subjects:
+            if not subject.is_empty_slot and subject.teacher not in teacher_index:
+                teacher_index[subject.teacher] = len(self.teachers)
+                self.teachers.append(subject.teacher)
+        self.num_teachers = len(self.teachers)
+
+        # Tabelas densas indexadas pelo id da disciplina (o id 0 é o horário vago)
+        size = max((subject.id for subject in self.subjects), default=0) + 1
+        self.max_id = size - 1
+        self.teacher = np.full(size, -1, dtype=np.int64)
+        self.workload = np.zeros(size, dtype=np.int64)
+        self.period = np.zeros(size, dtype=np.int64)
+        self.is_empty = np.zeros(size, dtype=bool)
+        self.is_empty[0] = True
+        self._by_id = [None] * size
+
+        for subject in self.subjects:
+            self._by_id[subject.id] = subject
+            self.workload[subject.id] = subject.workload
+            self.period[subject.id] = subject.period
+            self.is_empty[subject.id] = subject.is_empty_slot
+            if not subject.is_empty_slot:
+                self.teacher[subject.id] = teacher_index[subject.teacher]
+
+    @classmethod
+    def from_records(cls, records, grid=None):
+        """
+        Cria o catálogo a partir do array estruturado das disciplinas (ver read_records).
+        """
+        columns = [records[field].tolist() for field in FIELDS]
+        subjects = [Subject(*fields) for fields in zip(*columns)]
+        return cls(subjects, group_by_period(subjects), grid)
+
+    @classmethod
+    def load(cls, path, total_slots=None, cache_dir=None, grid=None):
+        """
+        Carrega e valida um catálogo de um arquivo CSV ou JSON.
+
+        A grade vem do parâmetro grid, da chave "grid" do JSON (ver
+        Grid.from_dict) ou, se nenhum dos dois existir, é a padrão (5 x 4).
+
+        Com cache_dir, os registros validados são gravados em um .npy (que pode
+        ser mapeado em memória) cujo nome inclui o hash do arquivo de origem;
+        nas execuções seguintes com o mesmo arquivo, a leitura e a conversão do
+        CSV/JSON são puladas. Um arquivo alterado gera um novo hash e,
+        portanto, uma nova compilação.
+
+        :param path: Arquivo CSV (id,name,teacher,workload,period) ou JSON.
+        :param total_slots: Número de horários da grade, para conferir a carga de
+                            cada período (por padrão, o da grade do catálogo).
+        :param cache_dir: Diretório do cache compilado (None desativa o cache).
+        :param grid: Grade (Grid) que substitui a do arquivo.
+        """
+        records = None
+        stored_grid = None
+        cache_path = None
+        if cache_dir is not None:
+            name = os.path.splitext(os.path.basename(path))[0]
+            cache_path = os.path.join(cache_dir, f"{name}.v{CACHE_VERSION}.{file_hash(path)[:16]}.npy")
+            if os.path.exists(cache_path):
+                records = np.load(cache_path, mmap_mode="r")
+                if os.path.exists(f"{cache_path}.grid.json"):
+                    with open(f"{cache_path}.grid.json", encoding="utf-8") as file:
+                        stored_grid = json.load(file)
+
+        parsed = records is None
+        if parsed:
+            records, stored_grid = read_records(path)
+
+        if grid is None:
+            grid = Grid.from_dict(stored_grid) if stored_grid is not None else Grid()
+        if total_slots is None:
+            total_slots = grid.total_slots
+
+        if parsed:
+            validate_records(records, total_slots)
+            if cache_path is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                temporary = f"{cache_path}.tmp"
+                with open(temporary, "wb") as file:
+                    np.save(file, records)
+                if stored_grid is not None:
+                    with open(f"{cache_path}.grid.json", "w", encoding="utf-8") as file:
+                        json.dump(stored_grid, file)
+                os.replace(temporary, cache_path)
+        else:
+            # A carga por período depende da grade, então é conferida mesmo com o cache
+            problems = workload_problems(records, total_slots)
+            if problems:
+                raise ValueError("Catálogo inválido: " + "; ".join(problems))
+
+        return cls.from_records(records, grid)
+
+    @classmethod
+    def from_json(cls, path):
+        """
+        Carrega um catálogo de um arquivo JSON no formato
+        {"subjects": [{"id": 1, "name": "...", "teacher": "...", "workload": 8, "period": 1}, ...]}.
+        """
+        return cls.load(path)
+
+    def get(self, subject_id):
+        """
+        Retorna a disciplina com o id informado, ou None se ela não existir.
+        """
+        if 0 <= subject_id < len(self._by_id):
+            return self._by_id[subject_id]
+        return None
+
+    def __len__(self):
+        return len(self.subjects)
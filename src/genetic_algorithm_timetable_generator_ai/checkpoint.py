@@ -0,0 +1,195 @@
+import json
+import os
+import random
+import threading
+import numpy as np
+from .catalog import Catalog
+from .GeneticAlgorithm import GeneticAlgorithm
+from .grid import Grid
+from .observers import Observer
+from .population import Population
+from .subject import Subject
+
+FORMAT_VERSION = 1
+
+def capture(ga):
+    """
+    Copia o estado de uma execução para um dicionário de arrays.
+
+    Tudo é copiado, então o dicionário pode ser gravado em outra thread
+    enquanto o algoritmo continua evoluindo a população.
+    """
+    population = ga.current_population
+    python_state = random.getstate()
+    numpy_state = np.random.get_state()
+
+    rng_states = {
+        "random": [python_state[0], list(python_state[1]), python_state[2]],
+        "numpy": [numpy_state[0], numpy_state[1].tolist(), *numpy_state[2:]],
+        "generator": ga.rng.bit_generator.state,
+    }
+    catalog = {
+        "subjects": [
+            [subject.id, subject.name, subject.teacher, subject.workload, subject.period]
+            for subject in ga.catalog.subjects
+        ],
+        "period_subjects": {str(period): ids for period, ids in ga.catalog.period_subjects.items()},
+        "grid": ga.catalog.grid.as_dict(),
+    }
+
+    return {
+        "format_version": np.array(FORMAT_VERSION),
+        "generation": np.array(ga.generation),
+        "genes": population.genes.copy(),
+        "fitness": population.fitness.copy(),
+        "evaluated": population.evaluated.copy(),
+        "num_days": np.array(population.num_days),
+        "num_slots": np.array(population.num_slots),
+        "elapsed": np.array(ga.elapsed),
+        "stopping": np.array(json.dumps(ga.stopping.state() if ga.stopping is not None else None)),
+        "parameters": np.array(json.dumps(ga.get_parameters())),
+        "rng_states": np.array(json.dumps(rng_states)),
+        "catalog": np.array(json.dumps(catalog)),
+    }
+
+def write(path, arrays):
+    """
+    Grava os arrays de um checkpoint em um .npz sem compressão.
+
+    O arquivo é escrito com outro nome e depois renomeado, para que um
+    checkpoint interrompido no meio nunca substitua o anterior.
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        np.savez(file, **arrays)
+    os.replace(temporary, path)
+
+def save_checkpoint(path, ga):
+    """
+    Grava o estado atual da execução do algoritmo genético.
+
+    :param path: Arquivo de destino (.npz).
+    :param ga: GeneticAlgorithm em execução.
+    """
+    write(path, capture(ga))
+
+def load_checkpoint(path, catalog=None, workers=None, constraints=None, stopping=None):
+    """
+    Recria um GeneticAlgorithm a partir de um checkpoint, pronto para
+    continuar com run(..., resume=True).
+
+    :param path: Arquivo do checkpoint (.npz).
+    :param catalog: Catálogo a usar (por padrão, o gravado no checkpoint).
+    :param workers: Número de processos para avaliar a aptidão.
+    :param constraints: Registro de restrições da função de aptidão (as regras
+                        não são gravadas no checkpoint; por padrão, as originais).
+    :param stopping: Critérios de parada antecipada da execução continuada
+                     (StoppingCriteria); o acompanhamento da estagnação é
+                     restaurado do checkpoint.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["format_version"]) != FORMAT_VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {int(data['format_version'])}")
+
+        parameters = json.loads(str(data["parameters"]))
+        rng_states = json.loads(str(data["rng_states"]))
+
+        if catalog is None:
+            stored = json.loads(str(data["catalog"]))
+            catalog = Catalog(
+                [Subject(*fields) for fields in stored["subjects"]],
+                {int(period): ids for period, ids in stored["period_subjects"].items()},
+                Grid.from_dict(stored["grid"]) if "grid" in stored else None
+            )
+
+        ga = GeneticAlgorithm(catalog=catalog, workers=workers, constraints=constraints,
+                              stopping=stopping, **parameters)
+        ga.generation = int(data["generation"])
+        ga.current_population = Population(
+            data["genes"].copy(), int(data["num_days"]), int(data["num_slots"]),
+            fitness=data["fitness"].copy(), evaluated=data["evaluated"].copy()
+        )
+        ga.fitness()
+
+        if "elapsed" in data:
+            ga.elapsed = float(data["elapsed"])
+        stopping_state = json.loads(str(data["stopping"])) if "stopping" in data else None
+        if stopping is not None and stopping_state is not None:
+            stopping.restore(stopping_state)
+
+    version, state, gauss_next = rng_states["random"]
+    random.setstate((version, tuple(state), gauss_next))
+    name, keys, position, has_gauss, cached_gaussian = rng_states["numpy"]
+    np.random.set_state((name, np.array(keys, dtype=np.uint32), position, has_gauss, cached_gaussian))
+    ga.rng.bit_generator.state = rng_states["generator"]
+
+    return ga
+
+def resume(path, generations, update_callback=None, observers=None, catalog=None, workers=None,
+           constraints=None, stopping=None):
+    """
+    Continua uma execução a partir de um checkpoint até a geração informada.
+
+    A execução continuada reproduz exatamente a execução original, porque o
+    checkpoint guarda a população, a aptidão em cache, o estado dos
+    geradores aleatórios (random, np.random e o Generator do algoritmo), o
+    tempo de execução e o acompanhamento dos critérios de parada.
+
+    :param path: Arquivo do checkpoint (.npz).
+    :param generations: Número total de gerações (incluindo as já executadas).
+    :return: O melhor indivíduo encontrado e sua aptidão.
+    """
+    ga = load_checkpoint(path, catalog=catalog, workers=workers, constraints=constraints, stopping=stopping)
+    return ga.run(generations, update_callback=update_callback, observers=observers, resume=True)
+
+class CheckpointObserver(Observer):
+    def __init__(self, path, every=10, background=True):
+        """
+        Grava checkpoints periódicos durante GeneticAlgorithm.run.
+
+        O estado é copiado no laço das gerações e gravado em uma thread
+        separada, então a gravação não atrasa as gerações seguintes. No máximo
+        uma gravação fica pendente: se a anterior ainda não terminou, o laço
+        espera por ela antes de iniciar a próxima.
+
+        :param path: Arquivo do checkpoint (.npz), sobrescrito a cada gravação.
+        :param every: Intervalo, em gerações, entre os checkpoints.
+        :param background: Grava em uma thread separada.
+        """
+        self.path = path
+        self.every = every
+        self.background = background
+        self.ga = None
+        self._writer = None
+
+    def on_start(self, ga):
+        self.ga = ga
+
+    def on_generation(self, record):
+        if record.generation % self.every == 0:
+            self.save()
+
+    def on_finish(self, ga, record):
+        if record is not None and record.generation % self.every != 0:
+            self.save()
+        self.wait()
+
+    def save(self):
+        """
+        Grava um checkpoint do estado atual.
+        """
+        arrays = capture(self.ga)
+        self.wait()
+        if self.background:
+            self._writer = threading.Thread(target=write, args=(self.path, arrays), daemon=True)
+            self._writer.start()
+        else:
+            write(self.path, arrays)
+
+    def wait(self):
+        """
+        Espera a gravação pendente terminar.
+        """
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
@@ -0,0 +1,184 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from .catalog import Catalog
+from .GeneticAlgorithm import GeneticAlgorithm
+from .stopping import StoppingCriteria
+
+def load_catalog(path=None, cache_dir=None):
+    """
+    Carrega o catálogo de disciplinas de um arquivo CSV/JSON ou, se nenhum
+    arquivo for informado, usa os dados mockados.
+
+    :param cache_dir: Diretório do cache compilado do catálogo (ver Catalog.load).
+    """
+    if path is not None:
+        return Catalog.load(path, cache_dir=cache_dir)
+
+    from .mock_data import subjects, period_subjects
+    return Catalog(subjects, period_subjects)
+
+def run_one(task):
+    """
+    Executa o algoritmo genético com um conjunto de parâmetros e uma semente.
+
+    :param task: Tupla (catalog, parameters, seed, generations, stopping).
+    :return: Dicionário com o melhor horário e as estatísticas da execução.
+    """
+    catalog, parameters, seed, generations, stopping = task
+    ga = GeneticAlgorithm(catalog=catalog, seed=seed, stopping=stopping, **parameters)
+
+    started = time.perf_counter()
+    history = [float(record.best_fitness) for record in ga.evolve(generations)]
+    elapsed = time.perf_counter() - started
+
+    return {
+        "parameters": parameters,
+        "seed": seed,
+        "generations": ga.generation,
+        "stop_reason": ga.stop_reason,
+        "seconds": elapsed,
+        "evaluations": ga.evaluations,
+        "best_fitness": float(ga.best_fitness),
+        "best_fitness_history": history,
+        "best_schedule": ga.best_individual.schedule.tolist(),
+        "constraints": ga.constraint_breakdown(),
+        "num_days": ga.num_days,
+        "num_slots": ga.num_slots,
+        "day_names": ga.grid.day_names,
+    }
+
+# Estatísticas de cada execução repetidas em todas as linhas do CSV
+RUN_FIELDS = ["run", "parameter_set", "seed", "generations", "stop_reason", "seconds", "evaluations", "best_fitness"]
+
+def timetable_rows(result, catalog):
+    """
+    Linhas (uma por aula) do melhor horário de uma execução, precedidas
+    das estatísticas da execução (RUN_FIELDS).
+    """
+    num_slots = result["num_slots"]
+    run = {field: result[field] for field in RUN_FIELDS}
+    for period, row in enumerate(result["best_schedule"]):
+        for slot_index, subject_id in enumerate(row):
+            subject = catalog.get(subject_id) if subject_id != 0 else None
+            day, slot = divmod(slot_index, num_slots)
+            yield {
+                **run,
+                "period": period + 1,
+                "day": result["day_names"][day],
+                "slot": slot + 1,
+                "subject_id": subject_id,
+                "subject": subject.name if subject else "VAGO",
+                "teacher": subject.teacher if subject else "",
+            }
+
+def write_json(results, file):
+    json.dump(results, file, indent=2, ensure_ascii=False)
+
+def write_csv(results, catalog, file):
+    fields = RUN_FIELDS + ["period", "day", "slot", "subject_id", "subject", "teacher"]
+    writer = csv.DictWriter(file, fieldnames=fields)
+    writer.writeheader()
+    for result in results:
+        writer.writerows(timetable_rows(result, catalog))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gera grades horárias com o algoritmo genético, sem interface gráfica"
+    )
+    parser.add_argument("--catalog", help="Arquivo CSV ou JSON com as disciplinas (usa os dados mockados se omitido)")
+    parser.add_argument("--catalog-cache", help="Diretório do cache compilado do catálogo")
+    parser.add_argument("--generations", type=int, default=100, help="Número de gerações")
+    parser.add_argument("--population-size", type=int, default=100)
+    parser.add_argument("--mutation-rate", type=float, default=0.2)
+    parser.add_argument("--crossover-rate", type=float, default=0.85)
+    parser.add_argument("--crossover-method", choices=["row_swap", "uniform_row", "two_point"], default="row_swap")
+    parser.add_argument("--mutation-method", choices=["swap", "day_block", "conflict"], default="swap")
+    parser.add_argument("--mutation-swaps", type=int, default=1, help="Trocas em cada linha sorteada para mutação")
+    parser.add_argument("--local-search", choices=["hill_climbing", "tabu"], help="Busca local nos melhores indivíduos")
+    parser.add_argument("--local-search-top-k", type=int, default=2)
+    parser.add_argument("--local-search-iterations", type=int, default=20)
+    parser.add_argument("--elitism-count", type=int, default=2)
+    parser.add_argument("--selection-method", choices=["roulette", "sus", "tournament", "rank", "truncation"], default="tournament")
+    parser.add_argument("--tournament-size", type=int, default=3)
+    parser.add_argument("--stagnation", type=int, help="Para após N gerações sem melhora da melhor aptidão")
+    parser.add_argument("--target-fitness", type=float, help="Para ao atingir a aptidão alvo")
+    parser.add_argument("--stop-when-feasible", action="store_true",
+                        help="Para quando o melhor horário não viola nenhuma restrição forte")
+    parser.add_argument("--time-limit", type=float, help="Tempo máximo de cada execução, em segundos")
+    parser.add_argument("--min-diversity", type=float, help="Para quando a diversidade da população cai abaixo do limite")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[None], help="Uma execução por semente")
+    parser.add_argument("--sweep", help="Arquivo JSON com uma lista de conjuntos de parâmetros; "
+                                        "cada conjunto substitui os parâmetros da linha de comando")
+    parser.add_argument("--jobs", type=int, default=1, help="Número de execuções simultâneas (processos)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", help="Arquivo de saída (stdout se omitido)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    catalog = load_catalog(args.catalog, args.catalog_cache)
+
+    base = {
+        "population_size": args.population_size,
+        "mutation_rate": args.mutation_rate,
+        "crossover_rate": args.crossover_rate,
+        "crossover_method": args.crossover_method,
+        "mutation_method": args.mutation_method,
+        "mutation_swaps": args.mutation_swaps,
+        "local_search": args.local_search,
+        "local_search_top_k": args.local_search_top_k,
+        "local_search_iterations": args.local_search_iterations,
+        "elitism_count": args.elitism_count,
+        "selection_method": args.selection_method,
+        "tournament_size": args.tournament_size,
+    }
+    parameter_sets = [base]
+    if args.sweep:
+        with open(args.sweep, encoding="utf-8") as file:
+            parameter_sets = [{**base, **overrides} for overrides in json.load(file)]
+
+    stopping = StoppingCriteria(
+        stagnation=args.stagnation,
+        target_fitness=args.target_fitness,
+        stop_when_feasible=args.stop_when_feasible,
+        time_limit=args.time_limit,
+        min_diversity=args.min_diversity,
+    )
+
+    tasks = [
+        (catalog, parameters, seed, args.generations, stopping)
+        for parameters in parameter_sets
+        for seed in args.seeds
+    ]
+    # Índice de cada execução e do seu conjunto de parâmetros (na ordem do --sweep)
+    indices = [
+        (parameter_set, seed_index)
+        for parameter_set in range(len(parameter_sets))
+        for seed_index in range(len(args.seeds))
+    ]
+
+    if args.jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(run_one, tasks))
+    else:
+        results = [run_one(task) for task in tasks]
+    for run, (result, (parameter_set, _)) in enumerate(zip(results, indices)):
+        result["run"] = run
+        result["parameter_set"] = parameter_set
+
+    file = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            write_csv(results, catalog, file)
+        else:
+            write_json(results, file)
+    finally:
+        if args.output:
+            file.close()
+
+if __name__ == "__main__":
+    main()
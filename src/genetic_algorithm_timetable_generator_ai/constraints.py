@@ -0,0 +1,387 @@
+import numpy as np
+from . import kernels
+from .occupancy import SwapCellCosts, SwapCounts, excess, occupancy
+
+class EvaluationContext:
+    def __init__(self, population, catalog, num_days, num_slots):
+        """
+        Dados intermediários de uma avaliação da população, compartilhados por
+        todas as restrições.
+
+        Cada intermediário (professor de cada célula, ocupação dos professores
+        por horário, ...) é calculado uma única vez por avaliação, na primeira
+        restrição que precisar dele.
+
+        :param population: Tensor (tamanho_da_população, num_periods, total_slots).
+        :param catalog: Catálogo compilado das disciplinas (Catalog).
+        :param num_days: Número de dias na semana.
+        :param num_slots: Número de aulas por dia.
+        """
+        self.population = population
+        self.catalog = catalog
+        self.num_days = num_days
+        self.num_slots = num_slots
+        self.total_slots = num_days * num_slots
+        self.size = len(population)
+        self._cache = {}
+
+    def cached(self, key, compute):
+        """
+        Retorna o intermediário key, calculando-o com compute() na primeira vez.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def days(self):
+        """
+        Visão (tamanho, num_periods * num_days, num_slots): uma linha por dia de cada período.
+        """
+        return self.population.reshape(self.size, -1, self.num_slots)
+
+    @property
+    def teachers(self):
+        """
+        Índice do professor de cada célula (-1 para horários vagos).
+        """
+        return self.cached("teachers", lambda: self.catalog.teacher[self.population])
+
+    @property
+    def teacher_occupancy(self):
+        """
+        Número de aulas de cada professor em cada horário: (tamanho, total_slots, num_teachers).
+        """
+        return self.cached("teacher_occupancy", lambda: occupancy(
+            self.teachers, self.catalog.num_teachers
+        ))
+
+def integer_weight(value, description):
+    """
+    Converte um peso para int, aceitando floats sem parte fracionária.
+
+    A aptidão é inteira (int64) em toda a execução, então pesos fracionários
+    não são aceitos.
+
+    :param description: Descrição do peso para a mensagem de erro.
+    """
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, float, np.integer, np.floating)):
+        raise ValueError(f"{description} deve ser um número inteiro, recebido {value!r}")
+    if not float(value).is_integer():
+        raise ValueError(f"{description} deve ser um número inteiro, recebido {value!r}")
+    return int(value)
+
+class Constraint:
+    name = None
+    hard = False  # Restrições fortes precisam ser zeradas numa grade válida
+
+    def __init__(self, weight):
+        """
+        Regra da função de aptidão.
+
+        Cada regra conta, para todos os indivíduos de uma vez, quantas vezes
+        ela ocorre; a aptidão soma weight * contagem de cada regra ativa.
+
+        :param weight: Peso inteiro da regra (negativo para penalidades).
+        """
+        self.weight = weight
+        self.active = True
+
+    @property
+    def weight(self):
+        return self._weight
+
+    @weight.setter
+    def weight(self, value):
+        self._weight = integer_weight(value, f"O peso da regra {self.name}")
+
+    def count(self, context):
+        """
+        Contagem da regra para cada indivíduo (vetor de inteiros).
+
+        :param context: EvaluationContext da avaliação.
+        """
+        raise NotImplementedError
+
+    def swap_index(self, context, schedule):
+        """
+        Índice incremental opcional da regra para a busca local: calcula a
+        variação da contagem em trocas de dois horários de uma linha de
+        período, sem reavaliar a grade inteira.
+
+        O índice tem deltas(period, first, second), vetorizado nas trocas;
+        swap(period, first, second), chamado antes de cada troca aplicada; e
+        bins, o grupo de cada horário (uma troca só altera as variações das
+        trocas que envolvem os mesmos grupos).
+
+        :param context: EvaluationContext da grade.
+        :param schedule: Grade (num_periods, total_slots), alterada pela busca local.
+        :return: O índice, ou None se a regra não tem (a busca local avalia
+                 as vizinhas por completo).
+        """
+        return None
+
+class TeacherConflicts(Constraint):
+    name = "conflicts"
+    hard = True
+
+    def count(self, context):
+        """
+        Cada aula além da primeira do mesmo professor no mesmo horário conta
+        como um conflito.
+        """
+        return np.sum(excess(context.teacher_occupancy), axis=(1, 2))
+
+class SlotGaps(Constraint):
+    name = "gaps"
+
+    def __init__(self, weight, slot_weights=None, slot_pair_weights=None):
+        """
+        Pontua os horários vagos de cada dia: bônus/penalidade por horário vago
+        em cada posição do dia e por pares de horários vagos no mesmo dia.
+
+        :param slot_weights: Bônus/penalidade por posição (por padrão, os da grade do catálogo).
+        :param slot_pair_weights: Dicionário (horário, horário) → bônus/penalidade
+                                  (por padrão, os da grade do catálogo).
+        """
+        super().__init__(weight)
+        self.slot_weights = slot_weights
+        self.slot_pair_weights = slot_pair_weights
+
+    def weights(self, grid):
+        """
+        Regras efetivas dos horários vagos para a grade informada (Grid).
+        """
+        slot_weights = self.slot_weights if self.slot_weights is not None else grid.slot_weights
+        pair_weights = self.slot_pair_weights if self.slot_pair_weights is not None else grid.slot_pair_weights
+        return slot_weights, pair_weights
+
+    def count(self, context):
+        """
+        Pontuação de gaps entre as aulas, negativa porque queremos maximizar o fitness.
+        """
+        return -gap_score(context.days, *self.weights(context.catalog.grid))
+
+class ConsecutiveClasses(Constraint):
+    name = "consecutive"
+
+    def count(self, context):
+        """
+        Aulas consecutivas da mesma disciplina (ignorando horários vagos).
+        """
+        return consecutive_classes(context.days, context.catalog.is_empty)
+
+class TeacherUnavailability(Constraint):
+    name = "teacher_unavailability"
+    hard = True
+
+    def __init__(self, weight, unavailable):
+        """
+        Penaliza aulas em horários nos quais o professor não está disponível.
+
+        :param unavailable: Dicionário nome do professor → índices dos horários
+                            (0 a total_slots - 1) indisponíveis.
+        """
+        super().__init__(weight)
+        self.unavailable = unavailable
+
+    def count(self, context):
+        mask = context.cached(("unavailable", id(self)), lambda: self._mask(context))
+        return np.einsum("nst,st->n", context.teacher_occupancy, mask)
+
+    def swap_index(self, context, schedule):
+        mask = context.cached(("unavailable", id(self)), lambda: self._mask(context))
+        return SwapCellCosts(context.catalog.teacher, schedule, np.ascontiguousarray(mask.T))
+
+    def _mask(self, context):
+        """
+        Matriz (total_slots, num_teachers) com 1 nos horários indisponíveis.
+        """
+        mask = np.zeros((context.total_slots, context.catalog.num_teachers), dtype=np.int64)
+        for teacher, slots in self.unavailable.items():
+            if teacher in context.catalog.teachers:
+                mask[list(slots), context.catalog.teachers.index(teacher)] = 1
+        return mask
+
+class MaxDailyClasses(Constraint):
+    name = "max_daily_classes"
+
+    def __init__(self, weight, limit):
+        """
+        Penaliza cada aula de um professor além do limite diário.
+
+        :param limit: Número máximo de aulas de um professor por dia.
+        """
+        super().__init__(weight)
+        self.limit = limit
+
+    def count(self, context):
+        counts = context.teacher_occupancy
+        per_day = counts.reshape(context.size, context.num_days, context.num_slots, -1).sum(axis=2)
+        return np.sum(np.maximum(per_day - self.limit, 0), axis=(1, 2))
+
+    def swap_index(self, context, schedule):
+        days = np.arange(context.total_slots) // context.num_slots
+        return SwapCounts(context.catalog.teacher, schedule, days, context.num_days, self.limit)
+
+class RoomCapacity(Constraint):
+    name = "room_capacity"
+    hard = True
+
+    def __init__(self, weight, rooms, capacity):
+        """
+        Penaliza horários com mais aulas de um tipo de sala do que salas disponíveis.
+
+        :param rooms: Dicionário id da disciplina → tipo de sala (ex.: "laboratório").
+        :param capacity: Dicionário tipo de sala → número de salas disponíveis.
+        """
+        super().__init__(weight)
+        self.rooms = rooms
+        self.capacity = capacity
+
+    def count(self, context):
+        room_of, capacity = context.cached(("rooms", id(self)), lambda: self._tables(context))
+        counts = occupancy(room_of[context.population], len(capacity))
+        return np.sum(np.maximum(counts - capacity, 0), axis=(1, 2))
+
+    def swap_index(self, context, schedule):
+        room_of, capacity = context.cached(("rooms", id(self)), lambda: self._tables(context))
+        return SwapCounts(room_of, schedule, np.arange(context.total_slots), context.total_slots, capacity)
+
+    def _tables(self, context):
+        """
+        Tabela id da disciplina → índice do tipo de sala e vetor de capacidades.
+        """
+        room_types = list(self.capacity)
+        room_of = np.full(len(context.catalog.teacher), -1, dtype=np.int64)
+        for subject_id, room in self.rooms.items():
+            room_of[subject_id] = room_types.index(room)
+        return room_of, np.array([self.capacity[room] for room in room_types], dtype=np.int64)
+
+def gap_score(days, slot_weights, pair_weights):
+    """
+    Pontuação dos horários vagos de um tensor (tamanho, dias, num_slots).
+
+    Usa o kernel compilado (kernels.py) quando o Numba está disponível.
+    """
+    if kernels.BACKEND == "numba":
+        return kernels.gap_score(days, slot_weights, pair_weights)
+    return numpy_gap_score(days, slot_weights, pair_weights)
+
+def numpy_gap_score(days, slot_weights, pair_weights):
+    """
+    Versão vetorizada (NumPy) de gap_score.
+    """
+    empty = days == 0
+
+    score = np.zeros(len(days), dtype=np.int64)
+    for (first, second), weight in pair_weights.items():
+        both_empty = empty[..., first] & empty[..., second]
+        score += weight * np.sum(both_empty, axis=1)
+
+    per_slot = np.sum(empty, axis=1)
+    score += per_slot @ np.asarray(slot_weights, dtype=np.int64)
+
+    return score
+
+def consecutive_classes(days, is_empty):
+    """
+    Número de aulas consecutivas de um tensor (tamanho, dias, num_slots).
+
+    Horários vagos são ignorados: uma aula é consecutiva quando a aula anterior
+    não vaga do mesmo dia é da mesma disciplina. Usa o kernel compilado
+    (kernels.py) quando o Numba está disponível.
+    """
+    if kernels.BACKEND == "numba":
+        return kernels.consecutive_classes(days, is_empty)
+    return numpy_consecutive_classes(days, is_empty)
+
+def numpy_consecutive_classes(days, is_empty):
+    """
+    Versão vetorizada (NumPy) de consecutive_classes.
+    """
+    num_slots = days.shape[-1]
+    occupied = ~is_empty[days]
+
+    # Posição da última aula não vaga até cada horário (-1 se não houver)
+    positions = np.where(occupied, np.arange(num_slots), -1)
+    last_occupied = np.maximum.accumulate(positions, axis=-1)
+
+    # Última aula não vaga antes de cada horário
+    previous = np.full_like(last_occupied, -1)
+    previous[..., 1:] = last_occupied[..., :-1]
+    previous_subject = np.take_along_axis(days, np.maximum(previous, 0), axis=-1)
+
+    consecutive = occupied & (previous >= 0) & (previous_subject == days)
+    return np.sum(consecutive, axis=(1, 2))
+
+class ConstraintRegistry:
+    def __init__(self, constraints=None, base=500):
+        """
+        Conjunto de regras da função de aptidão.
+
+        A aptidão de cada indivíduo é base + soma(peso * contagem) das regras
+        ativas, calculada em uma única passada sobre o tensor da população: os
+        intermediários comuns ficam no EvaluationContext e são reaproveitados
+        por todas as regras.
+
+        :param constraints: Regras iniciais (Constraint).
+        :param base: Aptidão (inteira) de uma grade sem nenhuma ocorrência das regras.
+        """
+        self.base = integer_weight(base, "A aptidão base")
+        self._constraints = {}
+        for constraint in constraints or []:
+            self.register(constraint)
+
+    @classmethod
+    def default(cls):
+        """
+        Regras originais: 500 - 20 * conflitos - 5 * gaps + 10 * aulas consecutivas.
+        """
+        return cls([TeacherConflicts(-20), SlotGaps(-5), ConsecutiveClasses(10)])
+
+    def register(self, constraint):
+        """
+        Adiciona uma regra (substituindo a regra de mesmo nome, se houver).
+        """
+        self._constraints[constraint.name] = constraint
+        return constraint
+
+    def remove(self, name):
+        """
+        Remove a regra com o nome informado.
+        """
+        del self._constraints[name]
+
+    def __getitem__(self, name):
+        return self._constraints[name]
+
+    def __contains__(self, name):
+        return name in self._constraints
+
+    def __iter__(self):
+        return iter(self._constraints.values())
+
+    def active(self):
+        """
+        Regras ativas, na ordem em que foram registradas.
+        """
+        return [constraint for constraint in self._constraints.values() if constraint.active]
+
+    def weight(self, name):
+        """
+        Peso efetivo da regra (0 se ela não existe ou está desativada).
+        """
+        constraint = self._constraints.get(name)
+        if constraint is None or not constraint.active:
+            return 0
+        return constraint.weight
+
+    def evaluate(self, context):
+        """
+        Aptidão de cada indivíduo do contexto.
+        """
+        fitness = np.full(context.size, self.base, dtype=np.int64)
+        for constraint in self.active():
+            fitness += constraint.weight * constraint.count(context)
+        return fitness
@@ -0,0 +1,104 @@
+import numpy as np
+
+def row_swap_mask(rng, pairs, num_periods):
+    """
+    Troca exatamente metade das linhas (períodos), escolhidas ao acaso para cada par.
+    """
+    keys = rng.random((pairs, num_periods))
+    ranks = np.argsort(np.argsort(keys, axis=1), axis=1)
+    return ranks < num_periods // 2
+
+def uniform_row_mask(rng, pairs, num_periods):
+    """
+    Cada linha (período) vem de um dos pais com probabilidade 1/2.
+    """
+    return rng.random((pairs, num_periods)) < 0.5
+
+def two_point_mask(rng, pairs, num_periods):
+    """
+    Troca o bloco contíguo de períodos entre dois pontos de corte sorteados.
+
+    Os cortes ficam entre linhas de período, nunca dentro de uma linha: cada
+    linha continua sendo uma permutação das aulas do período, então a carga
+    horária dos filhos é sempre válida.
+    """
+    cuts = np.sort(rng.integers(0, num_periods + 1, size=(pairs, 2)), axis=1)
+    periods = np.arange(num_periods)
+    return (periods >= cuts[:, :1]) & (periods < cuts[:, 1:])
+
+OPERATORS = {
+    "row_swap": row_swap_mask,
+    "uniform_row": uniform_row_mask,
+    "two_point": two_point_mask,
+}
+
+class Crossover:
+    def __init__(self, method="row_swap", rate=1.0):
+        """
+        Cruzamento de toda a população de uma vez, sobre o tensor dos genes.
+
+        Os pais selecionados são embaralhados e agrupados em pares consecutivos. Para cada par
+        que cruza, o operador sorteia uma máscara (par, período) que diz quais
+        linhas cada filho herda do outro pai. Os filhos são escritos, por
+        indexação, no buffer reserva da população, que depois troca de lugar
+        com os genes atuais: os pais nunca são alterados e nenhum filho
+        compartilha memória com outro indivíduo.
+
+        :param method: Operador de cruzamento (row_swap, uniform_row ou two_point).
+        :param rate: Probabilidade de cada par cruzar.
+        """
+        if method not in OPERATORS:
+            raise ValueError(f"Método de cruzamento desconhecido: {method}")
+        self.method = method
+        self.rate = rate
+
+    def source_rows(self, rng, parents, num_periods):
+        """
+        Índice, em genes.reshape(-1, total_slots), da linha de origem de cada
+        linha de cada filho.
+
+        :param parents: Índices dos pais selecionados (um filho por pai).
+        :return: Índices (len(parents), num_periods), a ordem dos pais e a
+                 máscara dos filhos gerados por cruzamento.
+        """
+        size = len(parents)
+        order = parents[rng.permutation(size)]
+        pairs = size // 2
+        first, second = order[0:2 * pairs:2], order[1:2 * pairs:2]
+
+        crossed = rng.random(pairs) < self.rate
+        mask = OPERATORS[self.method](rng, pairs, num_periods) & crossed[:, np.newaxis]
+
+        source = np.repeat(order[:, np.newaxis].astype(np.intp), num_periods, axis=1)
+        source[0:2 * pairs:2] = np.where(mask, second[:, np.newaxis], first[:, np.newaxis])
+        source[1:2 * pairs:2] = np.where(mask, first[:, np.newaxis], second[:, np.newaxis])
+        source *= num_periods
+        source += np.arange(num_periods)
+
+        children = np.zeros(size, dtype=bool)
+        children[0:2 * pairs:2] = mask.any(axis=1)
+        children[1:2 * pairs:2] = children[0:2 * pairs:2]
+        return source, order, children
+
+    def apply(self, population, rng, parents=None):
+        """
+        Substitui os genes da população pelos filhos dos pais selecionados
+        (com número ímpar de pais, o último pai embaralhado passa sem cruzar).
+
+        Os pais são lidos direto dos genes atuais pelos índices, sem copiar a
+        população selecionada antes do cruzamento.
+
+        :param population: Population atual.
+        :param rng: Gerador aleatório (np.random.Generator).
+        :param parents: Índices dos pais selecionados (por padrão, todos os indivíduos).
+        """
+        _, num_periods, total_slots = population.genes.shape
+        if parents is None:
+            parents = np.arange(len(population))
+        source, order, children = self.source_rows(rng, np.asarray(parents), num_periods)
+
+        rows = population.genes.reshape(-1, total_slots)
+        buffer = population.spare(len(order))
+        np.take(rows, source.ravel(), axis=0, out=buffer.reshape(-1, total_slots))
+
+        population.commit(population.fitness[order], population.evaluated[order] & ~children)
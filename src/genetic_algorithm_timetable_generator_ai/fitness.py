@@ -0,0 +1,126 @@
+import numpy as np
+from .constraints import ConstraintRegistry, EvaluationContext, SlotGaps, consecutive_classes, gap_score
+
+class FitnessEvaluator:
+    # Regras cuja variação numa troca de horários é calculada localmente
+    # (só nos horários e dias alterados); as demais exigem avaliação completa
+    LOCAL_CONSTRAINTS = ("conflicts", "gaps", "consecutive")
+
+    def __init__(self, catalog, num_days, num_slots, registry=None):
+        """
+        Avalia a aptidão de uma população inteira de uma só vez.
+
+        A população é representada por um tensor de inteiros com formato
+        (tamanho_da_população, num_periods, total_slots), onde cada célula guarda
+        o id da disciplina (0 para horário vago). A aptidão é a soma ponderada
+        das regras ativas do registro de restrições.
+
+        :param catalog: Catálogo compilado das disciplinas (Catalog).
+        :param num_days: Número de dias na semana.
+        :param num_slots: Número de aulas por dia.
+        :param registry: Registro de restrições (ConstraintRegistry); por padrão,
+                         as regras originais (conflitos, gaps e aulas consecutivas).
+        """
+        self.catalog = catalog
+        self.num_days = num_days
+        self.num_slots = num_slots
+        self.total_slots = num_days * num_slots
+        self.registry = registry if registry is not None else ConstraintRegistry.default()
+
+    def context(self, population):
+        """
+        Contexto de avaliação (intermediários compartilhados) de um tensor da população.
+        """
+        return EvaluationContext(np.asarray(population), self.catalog, self.num_days, self.num_slots)
+
+    def evaluate(self, population, rows=None):
+        """
+        Calcula a aptidão de cada indivíduo do tensor da população.
+
+        :param population: Tensor (tamanho_da_população, num_periods, total_slots).
+        :param rows: Índices dos indivíduos a avaliar (por padrão, todos).
+        :return: Vetor com a aptidão de cada indivíduo avaliado.
+        """
+        if rows is not None:
+            population = population[rows]
+        return self.registry.evaluate(self.context(population))
+
+    def breakdown(self, schedule):
+        """
+        Contribuição de cada regra ativa para a aptidão de uma grade horária.
+
+        :param schedule: Grade horária (num_periods, total_slots) de um indivíduo.
+        :return: Dicionário nome da regra → {"count", "weight", "score", "hard"}.
+        """
+        context = self.context(np.asarray(schedule)[np.newaxis])
+        result = {}
+        for constraint in self.registry.active():
+            count = int(constraint.count(context)[0])
+            result[constraint.name] = {
+                "count": count,
+                "weight": constraint.weight,
+                "score": constraint.weight * count,
+                "hard": constraint.hard,
+            }
+        return result
+
+    def hard_violations(self, schedule):
+        """
+        Número de violações das restrições fortes ativas em uma grade horária.
+        """
+        context = self.context(np.asarray(schedule)[np.newaxis])
+        return sum(int(constraint.count(context)[0]) for constraint in self.registry.active() if constraint.hard)
+
+    @property
+    def incremental(self):
+        """
+        Indica se todas as regras ativas podem ser recalculadas localmente (ver local_fitness).
+        """
+        return all(constraint.name in self.LOCAL_CONSTRAINTS for constraint in self.registry.active())
+
+    def local_fitness(self, genes, columns, blocks):
+        """
+        Parcela da aptidão de cada indivíduo que depende apenas dos horários e
+        dos dias informados: conflitos de professores nas colunas (horários)
+        e gaps e aulas consecutivas nos dias de cada período.
+
+        A variação da aptidão depois de trocas que só mexem nessas células é a
+        diferença entre esta parcela depois e antes das trocas.
+
+        :param genes: Tensor (tamanho, num_periods, total_slots).
+        :param columns: Pares (indivíduo, horário) sem repetição, como dois vetores.
+        :param blocks: Trios (indivíduo, período, dia) sem repetição, como três vetores.
+        :return: Vetor com a parcela de cada indivíduo do tensor.
+        """
+        individual, column = columns
+        teachers = np.sort(self.catalog.teacher[genes[individual, :, column]], axis=1)
+        # Cada repetição de um professor no mesmo horário é um conflito
+        conflicts = np.sum((teachers[:, 1:] == teachers[:, :-1]) & (teachers[:, 1:] >= 0), axis=1)
+        fitness = np.bincount(individual, weights=self.registry.weight("conflicts") * conflicts,
+                              minlength=len(genes))
+
+        block_individual, period, day = blocks
+        cells = day[:, np.newaxis] * self.num_slots + np.arange(self.num_slots)
+        scores = self.day_scores(genes[block_individual[:, np.newaxis], period[:, np.newaxis], cells])
+        fitness += np.bincount(block_individual, weights=scores, minlength=len(genes))
+
+        return fitness.astype(np.int64)
+
+    def day_scores(self, blocks):
+        """
+        Parcela da aptidão (gaps e aulas consecutivas) de cada dia isolado.
+
+        :param blocks: Tensor (quantidade, num_slots) com os horários de um dia de um período.
+        :return: Vetor com a pontuação ponderada de cada dia.
+        """
+        days = np.asarray(blocks)[:, np.newaxis]
+        gaps = -self._gap_score(days)
+        consecutive = consecutive_classes(days, self.catalog.is_empty)
+        return self.registry.weight("gaps") * gaps + self.registry.weight("consecutive") * consecutive
+
+    def _gap_score(self, days):
+        """
+        Pontuação dos horários vagos de um tensor (tamanho, dias, num_slots).
+        """
+        rule = self.registry["gaps"] if "gaps" in self.registry else SlotGaps(0)
+        return gap_score(days, *rule.weights(self.catalog.grid))
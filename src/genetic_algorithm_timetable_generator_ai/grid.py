@@ -0,0 +1,113 @@
+from .constraints import integer_weight
+
+DAY_NAMES = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
+
+# Horários do turno da noite da grade original (4 aulas por dia)
+EVENING_TIMES = ["19h00 à 19h50", "19h50 à 20h40", "20h50 à 21h40", "21h40 à 22h30"]
+
+class Grid:
+    def __init__(self, num_days=5, num_slots=4, slot_weights=None, slot_pair_weights=None,
+                 day_names=None, slot_names=None):
+        """
+        Dimensões da grade horária e regras de pontuação dos horários vagos.
+
+        Sem regras explícitas, as regras são derivadas do número de aulas por
+        dia, generalizando as da grade original de 4 aulas: vagos no primeiro
+        ou no último horário do dia ganham um bônus, vagos no meio do dia são
+        penalizados; dois vagos seguidos no começo ou no fim do dia ganham um
+        bônus maior, e dois vagos seguidos no meio do dia, uma penalidade
+        forte. Com 4 aulas por dia, as regras são exatamente as originais.
+
+        :param num_days: Número de dias na semana.
+        :param num_slots: Número de aulas por dia.
+        :param slot_weights: Bônus/penalidade (inteiros) por horário vago em cada posição do dia.
+        :param slot_pair_weights: Dicionário (horário, horário) → bônus/penalidade (inteiro)
+                                  quando os dois horários do mesmo dia estão vagos.
+        :param day_names: Nome de cada dia (para exibição).
+        :param slot_names: Nome de cada horário do dia (para exibição).
+        """
+        if num_days < 1 or num_slots < 1:
+            raise ValueError(f"Grade inválida: {num_days} dias x {num_slots} aulas por dia")
+        self.num_days = num_days
+        self.num_slots = num_slots
+        self.total_slots = num_days * num_slots
+
+        if slot_weights is None:
+            slot_weights = self.default_slot_weights(num_slots)
+        if slot_pair_weights is None:
+            slot_pair_weights = self.default_slot_pair_weights(num_slots)
+        if len(slot_weights) != num_slots:
+            raise ValueError(f"slot_weights deve ter {num_slots} valores")
+        if any(not 0 <= slot < num_slots for pair in slot_pair_weights for slot in pair):
+            raise ValueError(f"slot_pair_weights tem horários fora de 0..{num_slots - 1}")
+        # A pontuação dos vagos entra na aptidão inteira: pesos fracionários não são aceitos
+        self.slot_weights = tuple(integer_weight(weight, f"slot_weights[{slot}]")
+                                  for slot, weight in enumerate(slot_weights))
+        self.slot_pair_weights = {pair: integer_weight(weight, f"slot_pair_weights{tuple(pair)}")
+                                  for pair, weight in dict(slot_pair_weights).items()}
+
+        if day_names is None:
+            day_names = [DAY_NAMES[day] if day < len(DAY_NAMES) else f"Dia {day + 1}" for day in range(num_days)]
+        if slot_names is None:
+            slot_names = EVENING_TIMES if num_slots == len(EVENING_TIMES) else [
+                f"{slot + 1}º horário" for slot in range(num_slots)
+            ]
+        self.day_names = list(day_names)
+        self.slot_names = list(slot_names)
+
+    @staticmethod
+    def default_slot_weights(num_slots):
+        """
+        Bônus de 5 para vago no primeiro ou no último horário, penalidade de 10 nos demais.
+        """
+        return tuple(5 if slot in (0, num_slots - 1) else -10 for slot in range(num_slots))
+
+    @staticmethod
+    def default_slot_pair_weights(num_slots):
+        """
+        Bônus de 15 para vagos seguidos no começo ou no fim do dia, penalidade
+        de 20 para vagos seguidos no meio do dia.
+        """
+        if num_slots < 2:
+            return {}
+        weights = {(0, 1): 15, (num_slots - 2, num_slots - 1): 15}
+        for slot in range(1, num_slots - 2):
+            weights[(slot, slot + 1)] = -20
+        return weights
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Cria a grade a partir de um dicionário (ex.: a chave "grid" de um
+        catálogo JSON), com slot_pair_weights como lista [horário, horário, peso].
+        """
+        pairs = data.get("slot_pair_weights")
+        if pairs is not None:
+            pairs = {(int(first), int(second)): weight for first, second, weight in pairs}
+        return cls(
+            num_days=int(data.get("num_days", 5)),
+            num_slots=int(data.get("num_slots", 4)),
+            slot_weights=data.get("slot_weights"),
+            slot_pair_weights=pairs,
+            day_names=data.get("day_names"),
+            slot_names=data.get("slot_names"),
+        )
+
+    def as_dict(self):
+        """
+        Representação em dicionário, compatível com JSON (ver from_dict).
+        """
+        return {
+            "num_days": self.num_days,
+            "num_slots": self.num_slots,
+            "slot_weights": list(self.slot_weights),
+            "slot_pair_weights": [[first, second, weight] for (first, second), weight in self.slot_pair_weights.items()],
+            "day_names": self.day_names,
+            "slot_names": self.slot_names,
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, Grid) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f"Grid({self.num_days} dias x {self.num_slots} aulas)"
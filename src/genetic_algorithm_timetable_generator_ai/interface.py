@@ -1,14 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
 import os
 import numpy as np
-from GeneticAlgorithm import GeneticAlgorithm
-from mock_data import subjects  # Importa aqui para evitar import circular
+from .GeneticAlgorithm import GeneticAlgorithm
+from .observers import QueueObserver
+from .grid import Grid
 
 class Interface:
+    # Taxa máxima de atualização da tela (quadros por segundo)
+    MAX_FPS = 10
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Gerador de Grade Horária - Algoritmo Genético")
@@ -21,6 +23,7 @@ class Interface:
         self.ga = None
         self.best_generation = 0
         self.best_timetable = None
+        self.progress = None  # Fila com os registros publicados pelo algoritmo
 
         self.setup_styles()
         self.create_frames()
@@ -95,25 +98,15 @@ class Interface:
         self.root.grid_columnconfigure(0, weight=0)
         self.root.grid_columnconfigure(1, weight=1)
 
+    # Acima deste número de células alteradas em uma linha, a linha é reescrita inteira
+    MAX_CELL_UPDATES = 8
+
     def create_timetable_view(self):
-        dias = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta"]
-        horarios = [
-            "19h00 à 19h50",
-            "19h50 à 20h40",
-            "20h50 à 21h40",
-            "21h40 à 22h30"
-        ]
-        periods = [f"Período {i+1}" for i in range(6)]
-        columns = periods
         self.timetable_tree = ttk.Treeview(self.frame_timetable, height=20)
-        self.timetable_tree["columns"] = columns
-        self.timetable_tree.column("#0", width=180, minwidth=180, anchor="w")
-        for col in columns:
-            self.timetable_tree.column(col, width=140, minwidth=100, anchor="w")
-            self.timetable_tree.heading(col, text=col)
-        # Limpa linhas antigas se houver
-        for item in self.timetable_tree.get_children():
-            self.timetable_tree.delete(item)
+        # Configura zebra striping e borda cinza fina
+        self.timetable_tree.tag_configure('evenrow', background='#f0f0f0')
+        self.timetable_tree.tag_configure('oddrow', background='#ffffff')
+        self.timetable_tree.tag_configure('dayborder', background='#b0b0b0')
         # Adiciona scrollbars
         scrollbar_y = ttk.Scrollbar(self.frame_timetable, orient="vertical", command=self.timetable_tree.yview)
         scrollbar_x = ttk.Scrollbar(self.frame_timetable, orient="horizontal", command=self.timetable_tree.xview)
@@ -122,93 +115,177 @@ class Interface:
         scrollbar_y.pack(side="right", fill="y")
         scrollbar_x.pack(side="bottom", fill="x")
 
-    def update_timetable(self, timetable):
-        if timetable is None:
-            return
+        self.subject_labels = None  # Rótulo de cada id de disciplina (ver build_subject_labels)
+        self.shown_schedule = None  # Grade exibida atualmente na tabela
+        self.build_timetable_rows(6, Grid())
 
-        from mock_data import subjects
+    def build_timetable_rows(self, num_periods, grid):
+        """
+        Cria as colunas (uma por período) e as linhas (uma por dia e horário)
+        da tabela, com ids fixos: "slot-<índice do horário>" para as aulas e
+        "day-<dia>" para as linhas que separam os dias.
 
-        # Limpa a tabela atual
-        for item in self.timetable_tree.get_children():
-            self.timetable_tree.delete(item)
+        :param num_periods: Número de períodos (colunas).
+        :param grid: Grade do catálogo (Grid), com os nomes dos dias e horários.
+        """
+        self.shown_grid = grid
+        self.timetable_tree.delete(*self.timetable_tree.get_children())
+
+        columns = [f"Período {i+1}" for i in range(num_periods)]
+        self.timetable_tree["columns"] = columns
+        self.timetable_tree.column("#0", width=180, minwidth=180, anchor="w")
+        for col in columns:
+            self.timetable_tree.column(col, width=140, minwidth=100, anchor="w")
+            self.timetable_tree.heading(col, text=col)
 
-        dias = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta"]
-        horarios = [
-            "19h00 à 19h50",
-            "19h50 à 20h40",
-            "20h50 à 21h40",
-            "21h40 à 22h30"
-        ]
-        # Configura zebra striping e borda cinza fina
-        self.timetable_tree.tag_configure('evenrow', background='#f0f0f0')
-        self.timetable_tree.tag_configure('oddrow', background='#ffffff')
-        self.timetable_tree.tag_configure('dayborder', background='#b0b0b0')
         row_index = 0
-        # Para cada dia e slot (linha)
-        for day in range(len(dias)):
+        empty_row = ["" for _ in range(num_periods)]
+        for day in range(grid.num_days):
             if day > 0:
                 # Insere uma linha cinza fina para separar os dias
-                self.timetable_tree.insert("", "end", text="", values=["" for _ in range(6)], tags=('dayborder',))
+                self.timetable_tree.insert("", "end", iid=f"day-{day}", text="", values=empty_row,
+                                           tags=('dayborder',))
                 row_index += 1
-            for slot in range(len(horarios)):
-                row_label = f"{dias[day]} - {horarios[slot]}"
-                values = []
-                for period in range(6):
-                    subject_id = timetable.get_subject_at(period, day, slot)
-                    if subject_id == 0:
-                        values.append("Vazio")
-                    else:
-                        subject = next((s for s in subjects if s.id == subject_id), None)
-                        if subject:
-                            values.append(f"{subject.name}\n{subject.teacher}")
-                        else:
-                            values.append(f"ID {subject_id}")
+            for slot in range(grid.num_slots):
                 tag = 'evenrow' if row_index % 2 == 0 else 'oddrow'
-                self.timetable_tree.insert("", "end", text=row_label, values=values, tags=(tag,))
+                self.timetable_tree.insert("", "end", iid=f"slot-{day * grid.num_slots + slot}",
+                                           text=f"{grid.day_names[day]} - {grid.slot_names[slot]}",
+                                           values=empty_row, tags=(tag,))
                 row_index += 1
 
+        self.shown_schedule = None
+
+    @staticmethod
+    def build_subject_labels(catalog):
+        """
+        Tabela id da disciplina → texto exibido na célula, montada uma única vez
+        por execução.
+        """
+        labels = np.array([f"ID {subject_id}" for subject_id in range(catalog.max_id + 1)], dtype=object)
+        labels[0] = "Vazio"
+        for subject in catalog.subjects:
+            if subject.id != 0:
+                labels[subject.id] = f"{subject.name}\n{subject.teacher}"
+        return labels
+
+    def update_timetable(self, timetable):
+        """
+        Mostra a grade na tabela, alterando só as células diferentes da grade
+        exibida atualmente.
+        """
+        if timetable is None:
+            return
+
+        schedule = np.array(timetable.schedule)
+        if self.subject_labels is None:
+            self.subject_labels = self.build_subject_labels(self.ga.catalog)
+        if len(self.timetable_tree["columns"]) != schedule.shape[0] or self.shown_grid != self.ga.grid:
+            self.build_timetable_rows(schedule.shape[0], self.ga.grid)
+
+        if self.shown_schedule is None:
+            changed = np.ones(schedule.shape, dtype=bool)
+        else:
+            changed = schedule != self.shown_schedule
+
+        columns = self.timetable_tree["columns"]
+        for slot_index in np.flatnonzero(changed.any(axis=0)):
+            iid = f"slot-{slot_index}"
+            periods = np.flatnonzero(changed[:, slot_index])
+            if len(periods) > self.MAX_CELL_UPDATES:
+                self.timetable_tree.item(iid, values=list(self.subject_labels[schedule[:, slot_index]]))
+            else:
+                for period in periods:
+                    self.timetable_tree.set(iid, columns[period], self.subject_labels[schedule[period, slot_index]])
+
+        self.shown_schedule = schedule
+
     def create_graphs(self):
+        # O matplotlib só é carregado quando a interface monta o gráfico
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Gráfico da aptidão (menor)
         self.fig, self.ax = plt.subplots(figsize=(6, 4))
         self.ax.set_title("Evolução da Aptidão")
         self.ax.set_xlabel("Geração")
         self.ax.set_ylabel("Aptidão")
+        self.ax.grid(True)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame_graph)
         self.canvas.get_tk_widget().pack()
 
+        # Linha única, atualizada com set_data em vez de redesenhar o gráfico
+        self.line, = self.ax.plot([], [], 'b-')
+
         # Lista para armazenar os dados do gráfico
         self.generations = []
         self.fitness_values = []
 
-    def update_display(self, generation, best_individual, best_fitness):
+    def poll_progress(self, progress):
+        """
+        Consome a fila de progresso na thread da interface (chamado com root.after).
+
+        Todos os registros pendentes entram no histórico do gráfico, mas só o
+        mais recente é desenhado, no máximo MAX_FPS vezes por segundo. A
+        melhor aptidão exibida é a maior entre todos os registros pendentes.
+
+        :param progress: QueueObserver da execução; o consumo para se outra
+                         execução tiver sido iniciada.
+        """
+        if progress is not self.progress:
+            return
+
+        latest = None
+        best = None
+        finished = False
+        for item in progress.drain():
+            if isinstance(item, tuple) and item[0] == QueueObserver.FINISHED:
+                finished = True
+                continue
+            self.generations.append(item.generation)
+            self.fitness_values.append(item.best_fitness)
+            if best is None or item.best_fitness > best.best_fitness:
+                best = item
+            latest = item
+
+        if latest is not None:
+            self.update_display(latest.generation, best)
+            self.update_graph()
+
+        if finished:
+            self.is_running = False
+            self.progress = None
+        else:
+            self.root.after(1000 // self.MAX_FPS, self.poll_progress, progress)
+
+    def update_graph(self):
+        """
+        Atualiza a linha do gráfico com o histórico e agenda o redesenho.
+        """
+        self.line.set_data(self.generations, self.fitness_values)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def update_display(self, generation, best):
+        """
+        Atualiza as labels e a tabela. Deve ser chamado na thread da interface
+        (ver poll_progress).
+
+        :param generation: Geração do registro mais recente.
+        :param best: Registro com a maior aptidão entre os consumidos (GenerationRecord).
+        """
         # Atualiza as labels
         self.generation_label.config(text=f"Geração Atual: {generation}")
 
         # Mantém a exibição da melhor aptidão e da geração em que ela foi encontrada
-        if best_fitness > getattr(self, 'best_fitness', float('-inf')):
-            self.best_fitness = best_fitness
-            self.best_generation = generation
-            self.best_timetable = best_individual
-            self.best_generation_label.config(text=f"Melhor Geração: {generation}")
-            self.best_fitness_label.config(text=f"Melhor Aptidão: {best_fitness:.4f}")
+        if best.best_fitness > getattr(self, 'best_fitness', float('-inf')):
+            self.best_fitness = best.best_fitness
+            self.best_generation = best.generation
+            self.best_timetable = best.best_individual
+            self.best_generation_label.config(text=f"Melhor Geração: {best.generation}")
+            self.best_fitness_label.config(text=f"Melhor Aptidão: {best.best_fitness:.4f}")
             # Atualiza a tabela de horário
-            self.update_timetable(best_individual)
-        else:
-            # Garante que os labels continuam visíveis mesmo se não houver atualização
-            self.best_generation_label.config(text=f"Melhor Geração: {getattr(self, 'best_generation', 0)}")
-            self.best_fitness_label.config(text=f"Melhor Aptidão: {getattr(self, 'best_fitness', 0):.4f}")
-
-        # Atualiza o gráfico
-        self.generations.append(generation)
-        self.fitness_values.append(best_fitness)
-        self.ax.clear()
-        self.ax.set_title("Evolução da Aptidão")
-        self.ax.set_xlabel("Geração")
-        self.ax.set_ylabel("Aptidão")
-        self.ax.plot(self.generations, self.fitness_values, 'b-')
-        self.ax.grid(True)
-        self.canvas.draw()
-        self.root.update_idletasks()
+            self.update_timetable(best.best_individual)
 
     def start_algorithm(self):
         if self.is_running:
@@ -219,6 +296,7 @@ class Interface:
         self.best_fitness = float('-inf')
         self.generations = []
         self.fitness_values = []
+        self.line.set_data([], [])
         
         # Lê os parâmetros
         population_size = int(self.entries["Tamanho da População:"].get())
@@ -239,16 +317,22 @@ class Interface:
             selection_method=selection_method
         )
 
+        # Tabela de rótulos do catálogo desta execução
+        self.subject_labels = self.build_subject_labels(self.ga.catalog)
+
         # Configura o callback de parada
         self.ga.stop = lambda: self.stop_flag
 
-        # Inicia o algoritmo em uma thread separada
+        # Inicia o algoritmo em uma thread separada; o progresso chega pela fila
+        self.progress = QueueObserver()
         self.algorithm_thread = threading.Thread(
             target=self.ga.run,
-            args=(generations, self.update_display),
+            args=(generations,),
+            kwargs={"observers": [self.progress]},
             daemon=True
         )
         self.algorithm_thread.start()
+        self.root.after(1000 // self.MAX_FPS, self.poll_progress, self.progress)
 
     def create_controls(self):
         # Parâmetros do AG
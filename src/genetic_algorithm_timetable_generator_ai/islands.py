@@ -0,0 +1,176 @@
+import multiprocessing
+import numpy as np
+from .GeneticAlgorithm import GeneticAlgorithm
+from .timetable import Timetable
+
+def _island_worker(connection, parameters):
+    """
+    Processo de uma ilha: mantém um GeneticAlgorithm próprio e atende aos
+    comandos enviados pelo IslandRunner.
+
+    :param connection: Extremidade do Pipe usada para falar com o processo principal.
+    :param parameters: Parâmetros do GeneticAlgorithm desta ilha.
+    """
+    ga = GeneticAlgorithm(**parameters)
+    fitness_values = ga.start()
+    generations = 0
+    immigrants = 0
+    history = [ga.best_fitness]
+
+    while True:
+        command, argument = connection.recv()
+
+        if command == "evolve":
+            for _ in range(argument):
+                fitness_values = ga.step()
+            generations += argument
+            history.append(ga.best_fitness)
+            connection.send(ga.best_fitness)
+        elif command == "emigrants":
+            connection.send([individual.schedule for individual in ga.best_individuals(argument)])
+        elif command == "immigrants":
+            individuals = []
+            for schedule in argument:
+                individual = Timetable(ga.num_periods, ga.num_days, ga.num_slots)
+                individual.schedule[:] = schedule
+                individuals.append(individual)
+            fitness_values = ga.replace_worst(individuals)
+            immigrants += len(individuals)
+            connection.send(None)
+        elif command == "result":
+            connection.send({
+                "best_schedule": ga.best_individual.schedule,
+                "num_days": ga.num_days,
+                "num_slots": ga.num_slots,
+                "best_fitness": ga.best_fitness,
+                "mean_fitness": float(np.mean(fitness_values)),
+                "worst_fitness": fitness_values.min(),
+                "generations": generations,
+                "immigrants": immigrants,
+                "history": history,
+            })
+        elif command == "close":
+            connection.close()
+            return
+
+class IslandRunner:
+    TOPOLOGIES = ("ring", "full")
+
+    def __init__(self, islands, migration_interval, migration_size=1, topology="ring",
+                 catalog=None, seed=None):
+        """
+        Executa várias populações (ilhas) independentes em processos separados,
+        trocando os melhores indivíduos entre elas periodicamente.
+
+        Cada ilha é um GeneticAlgorithm comum, então seleção, cruzamento e
+        mutação são os mesmos operadores da execução com uma única população.
+
+        :param islands: Lista com os parâmetros do GeneticAlgorithm de cada ilha
+                        (population_size, mutation_rate, crossover_rate,
+                        selection_method, ...).
+        :param migration_interval: Número de gerações entre migrações.
+        :param migration_size: Número de indivíduos enviados por cada ilha a cada migração.
+        :param topology: Topologia da migração (ring ou full).
+        :param catalog: Catálogo compilado das disciplinas, compartilhado por todas as ilhas.
+        :param seed: Semente base; a ilha i usa seed + i.
+        """
+        if not islands:
+            raise ValueError("É preciso definir pelo menos uma ilha")
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Topologia desconhecida: {topology}")
+        if migration_interval < 1:
+            raise ValueError("O intervalo de migração deve ser pelo menos 1")
+
+        self.islands = [dict(parameters) for parameters in islands]
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.catalog = catalog
+        self.seed = seed
+
+        for index, parameters in enumerate(self.islands):
+            if catalog is not None:
+                parameters.setdefault("catalog", catalog)
+            if seed is not None:
+                parameters.setdefault("seed", seed + index)
+
+    def destinations(self, index):
+        """
+        Retorna as ilhas que recebem os migrantes da ilha informada.
+        """
+        count = len(self.islands)
+        if count == 1:
+            return []
+        if self.topology == "ring":
+            return [(index + 1) % count]
+        return [other for other in range(count) if other != index]
+
+    def run(self, generations):
+        """
+        Executa as ilhas por um número definido de gerações.
+
+        :param generations: Número de gerações de cada ilha.
+        :return: O melhor indivíduo global, sua aptidão e as estatísticas de cada ilha.
+        """
+        connections = []
+        processes = []
+        for parameters in self.islands:
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_island_worker, args=(child_connection, parameters)
+            )
+            process.start()
+            child_connection.close()
+            connections.append(parent_connection)
+            processes.append(process)
+
+        try:
+            remaining = generations
+            while remaining > 0:
+                epoch = min(self.migration_interval, remaining)
+                for connection in connections:
+                    connection.send(("evolve", epoch))
+                for connection in connections:
+                    connection.recv()
+                remaining -= epoch
+
+                if remaining > 0 and self.migration_size > 0:
+                    self._migrate(connections)
+
+            for connection in connections:
+                connection.send(("result", None))
+            statistics = [connection.recv() for connection in connections]
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(("close", None))
+                except (BrokenPipeError, OSError):
+                    pass
+                connection.close()
+            for process in processes:
+                process.join()
+
+        best = max(statistics, key=lambda island: island["best_fitness"])
+        best_individual = Timetable(len(best["best_schedule"]), best["num_days"], best["num_slots"])
+        best_individual.schedule[:] = best["best_schedule"]
+
+        return best_individual, best["best_fitness"], statistics
+
+    def _migrate(self, connections):
+        """
+        Envia os melhores indivíduos de cada ilha para as ilhas de destino,
+        onde eles substituem os piores.
+        """
+        for connection in connections:
+            connection.send(("emigrants", self.migration_size))
+        emigrants = [connection.recv() for connection in connections]
+
+        incoming = [[] for _ in connections]
+        for index, schedules in enumerate(emigrants):
+            for destination in self.destinations(index):
+                incoming[destination].extend(schedules)
+
+        for connection, schedules in zip(connections, incoming):
+            connection.send(("immigrants", schedules))
+        for connection in connections:
+            connection.recv()
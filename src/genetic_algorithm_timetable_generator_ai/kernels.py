@@ -0,0 +1,105 @@
+import importlib.util
+import os
+import numpy as np
+
+# Numba é opcional: sem ele (ou com TIMETABLE_FITNESS_BACKEND=numpy), os
+# kernels vetorizados do NumPy em constraints.py são usados. O Numba só é
+# importado (e os kernels compilados) na primeira avaliação, para não pesar
+# na importação do motor.
+REQUESTED_BACKEND = os.environ.get("TIMETABLE_FITNESS_BACKEND", "numba")
+if REQUESTED_BACKEND == "numba" and importlib.util.find_spec("numba") is not None:
+    BACKEND = "numba"
+else:
+    BACKEND = "numpy"
+
+_compiled = {}  # Kernels compilados pelo Numba, por nome
+
+def _gap_score(days, slot_weights, pair_first, pair_second, pair_weight):
+    """
+    Pontuação dos horários vagos de um tensor (tamanho, dias, num_slots), em
+    um único laço por indivíduo, sem arrays temporários.
+    """
+    size, num_days, num_slots = days.shape
+    scores = np.zeros(size, dtype=np.int64)
+    for individual in range(size):
+        score = 0
+        for day in range(num_days):
+            for slot in range(num_slots):
+                if days[individual, day, slot] == 0:
+                    score += slot_weights[slot]
+            for pair in range(len(pair_weight)):
+                if days[individual, day, pair_first[pair]] == 0 and days[individual, day, pair_second[pair]] == 0:
+                    score += pair_weight[pair]
+        scores[individual] = score
+    return scores
+
+def _consecutive_classes(days, is_empty):
+    """
+    Número de aulas consecutivas de um tensor (tamanho, dias, num_slots),
+    ignorando horários vagos, em um único laço por indivíduo.
+    """
+    size, num_days, num_slots = days.shape
+    counts = np.zeros(size, dtype=np.int64)
+    for individual in range(size):
+        count = 0
+        for day in range(num_days):
+            previous = -1
+            for slot in range(num_slots):
+                subject = days[individual, day, slot]
+                if is_empty[subject]:
+                    continue
+                if subject == previous:
+                    count += 1
+                previous = subject
+        counts[individual] = count
+    return counts
+
+def compiled(kernel):
+    """
+    Versão compilada pelo Numba de um kernel, compilada na primeira chamada.
+
+    Se o Numba não puder ser importado (instalação quebrada ou incompatível
+    com o NumPy), o backend passa a ser o NumPy e retorna None.
+    """
+    global BACKEND
+    if kernel.__name__ not in _compiled:
+        try:
+            import numba
+        except ImportError:
+            BACKEND = "numpy"
+            return None
+        _compiled[kernel.__name__] = numba.njit(cache=True, nogil=True)(kernel)
+    return _compiled[kernel.__name__]
+
+def pair_arrays(pair_weights):
+    """
+    Converte o dicionário (horário, horário) → peso em três arrays para os kernels.
+    """
+    pairs = list(pair_weights.items())
+    first = np.array([pair[0] for pair, _ in pairs], dtype=np.int64)
+    second = np.array([pair[1] for pair, _ in pairs], dtype=np.int64)
+    weight = np.array([weight for _, weight in pairs], dtype=np.int64)
+    return first, second, weight
+
+def gap_score(days, slot_weights, pair_weights):
+    """
+    Kernel compilado equivalente a constraints.gap_score (ou a versão do
+    NumPy, se o Numba não puder ser importado).
+    """
+    kernel = compiled(_gap_score)
+    if kernel is None:
+        from .constraints import numpy_gap_score
+        return numpy_gap_score(days, slot_weights, pair_weights)
+    return kernel(np.ascontiguousarray(days), np.asarray(slot_weights, dtype=np.int64),
+                  *pair_arrays(pair_weights))
+
+def consecutive_classes(days, is_empty):
+    """
+    Kernel compilado equivalente a constraints.consecutive_classes (ou a
+    versão do NumPy, se o Numba não puder ser importado).
+    """
+    kernel = compiled(_consecutive_classes)
+    if kernel is None:
+        from .constraints import numpy_consecutive_classes
+        return numpy_consecutive_classes(days, is_empty)
+    return kernel(np.ascontiguousarray(days), is_empty)
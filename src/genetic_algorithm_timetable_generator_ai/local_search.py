@@ -0,0 +1,272 @@
+import numpy as np
+from .occupancy import TeacherOccupancy
+
+class SwapNeighborhood:
+    # Número máximo de células das vizinhas avaliadas de uma vez na avaliação completa
+    CHUNK_CELLS = 1 << 22
+    # Número máximo de trocas sorteadas por iteração quando há regras sem índice incremental
+    MAX_SAMPLED_MOVES = 1024
+
+    def __init__(self, evaluator, schedule, rng=None):
+        """
+        Vizinhança de trocas de dois horários dentro de uma linha de período de
+        uma grade, com a variação da aptidão de todas as trocas.
+
+        Mantém o índice de ocupação dos professores (num_teachers, total_slots),
+        a pontuação local (gaps e aulas consecutivas) de cada dia de cada
+        período e a variação de cada troca. Ao aplicar uma troca, só são
+        recalculadas as trocas afetadas por ela: as que envolvem os mesmos
+        horários (conflitos) e as do mesmo período que envolvem os mesmos dias
+        (gaps e aulas consecutivas).
+
+        As demais regras ativas com índice incremental (Constraint.swap_index)
+        entram na mesma variação em cache, recalculada nas trocas que envolvem
+        os grupos de horários (horários ou dias) alterados. As regras sem
+        índice são avaliadas por completo, em blocos de até CHUNK_CELLS
+        células, em uma amostra de até MAX_SAMPLED_MOVES trocas sorteada a
+        cada iteração; só as trocas da amostra ficam em candidates.
+
+        :param evaluator: FitnessEvaluator usado na execução.
+        :param schedule: Grade (num_periods, total_slots), alterada no próprio array.
+        :param rng: Gerador aleatório do sorteio das trocas avaliadas por completo.
+        """
+        self.evaluator = evaluator
+        self.schedule = schedule
+        self.catalog = evaluator.catalog
+        self.num_slots = evaluator.num_slots
+        num_periods, total_slots = schedule.shape
+
+        # Todas as trocas possíveis (período, primeiro, segundo) com primeiro < segundo
+        first, second = np.triu_indices(total_slots, k=1)
+        self.moves_per_period = len(first)
+        self.period = np.repeat(np.arange(num_periods), len(first))
+        self.first = np.tile(first, num_periods)
+        self.second = np.tile(second, num_periods)
+        self.first_day = self.first // self.num_slots
+        self.second_day = self.second // self.num_slots
+
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.conflict_weight = evaluator.registry.weight("conflicts")
+
+        # Regras além de conflitos, gaps e aulas consecutivas: com índice
+        # incremental (peso, índice) ou avaliadas por completo
+        context = evaluator.context(schedule[np.newaxis])
+        self.indexes, self.complete = [], []
+        for constraint in evaluator.registry.active():
+            if constraint.name in evaluator.LOCAL_CONSTRAINTS:
+                continue
+            index = constraint.swap_index(context, schedule)
+            if index is None:
+                self.complete.append(constraint)
+            else:
+                self.indexes.append((constraint.weight, index))
+        self.candidates = np.ones(len(self.period), dtype=bool)
+
+        self.occupancy = TeacherOccupancy(self.catalog, schedule[np.newaxis])
+
+        self.day_scores = evaluator.day_scores(schedule.reshape(-1, self.num_slots)).reshape(num_periods, -1)
+
+        # Variação de cada troca e máscara das que precisam ser recalculadas
+        self._deltas = np.zeros(len(self.period), dtype=np.int64)
+        self._stale = np.ones(len(self.period), dtype=bool)
+
+    def __len__(self):
+        return len(self.period)
+
+    def deltas(self):
+        """
+        Variação da aptidão de cada troca da vizinhança (mesma ordem de
+        self.period, self.first e self.second).
+        """
+        moves = np.flatnonzero(self._stale)
+        if len(moves):
+            self._deltas[moves] = self.conflict_weight * self._conflict_deltas(moves) + self._day_deltas(moves)
+            period, first, second = self.period[moves], self.first[moves], self.second[moves]
+            for weight, index in self.indexes:
+                self._deltas[moves] += weight * index.deltas(period, first, second)
+            self._stale[moves] = False
+
+        if not self.complete:
+            return self._deltas
+        return self._complete_deltas()
+
+    def _complete_deltas(self):
+        """
+        Variação da aptidão de uma amostra das trocas (marcada em candidates),
+        somando a das regras sem índice incremental, avaliadas por completo em blocos.
+        """
+        schedule = self.schedule
+        sample = np.arange(len(self.period))
+        if len(sample) > self.MAX_SAMPLED_MOVES:
+            sample = np.sort(self.rng.choice(len(sample), self.MAX_SAMPLED_MOVES, replace=False))
+        self.candidates[:] = False
+        self.candidates[sample] = True
+
+        deltas = self._deltas.copy()
+        current = self._complete_score(schedule[np.newaxis])[0]
+        chunk = max(1, self.CHUNK_CELLS // schedule.size)
+
+        for start in range(0, len(sample), chunk):
+            moves = sample[start:start + chunk]
+            period, first, second = self.period[moves], self.first[moves], self.second[moves]
+            neighbors = np.repeat(schedule[np.newaxis], len(moves), axis=0)
+            index = np.arange(len(moves))
+            neighbors[index, period, first] = schedule[period, second]
+            neighbors[index, period, second] = schedule[period, first]
+            deltas[moves] += self._complete_score(neighbors) - current
+
+        return deltas
+
+    def _complete_score(self, population):
+        """
+        Soma ponderada das contagens das regras sem índice incremental.
+        """
+        context = self.evaluator.context(population)
+        return sum(constraint.weight * constraint.count(context) for constraint in self.complete)
+
+    def _conflict_deltas(self, moves):
+        """
+        Variação do número de conflitos das trocas informadas, lida do índice de ocupação.
+        """
+        return self.occupancy.swap_conflict_delta(0, self.period[moves], self.first[moves], self.second[moves])
+
+    def _day_deltas(self, moves):
+        """
+        Variação da pontuação local (gaps e aulas consecutivas) dos dias
+        afetados pelas trocas informadas.
+        """
+        schedule, num_slots = self.schedule, self.num_slots
+        period, first, second = self.period[moves], self.first[moves], self.second[moves]
+        first_day, second_day = self.first_day[moves], self.second_day[moves]
+        other_day = first_day != second_day
+
+        rows = schedule[period]
+        index = np.arange(len(moves))
+        rows[index, first], rows[index, second] = schedule[period, second], schedule[period, first]
+        rows = rows.reshape(len(moves), -1, num_slots)
+
+        blocks = np.stack([rows[index, first_day], rows[index, second_day]], axis=1)
+        after = self.evaluator.day_scores(blocks.reshape(-1, num_slots)).reshape(-1, 2)
+        before = np.stack([self.day_scores[period, first_day], self.day_scores[period, second_day]], axis=1)
+
+        return (after[:, 0] - before[:, 0]) + np.where(other_day, after[:, 1] - before[:, 1], 0)
+
+    def apply(self, move):
+        """
+        Aplica a troca de índice move, atualiza o índice de ocupação e a
+        pontuação dos dias afetados e marca as trocas afetadas para recálculo.
+        """
+        period, first, second = self.period[move], self.first[move], self.second[move]
+        for _, index in self.indexes:
+            index.swap(period, first, second)
+        self.occupancy.swap(0, period, first, second)
+
+        row = self.schedule[period]
+        days = np.unique([first // self.num_slots, second // self.num_slots])
+        blocks = row.reshape(-1, self.num_slots)[days]
+        self.day_scores[period, days] = self.evaluator.day_scores(blocks)
+
+        # Conflitos mudam nas trocas que envolvem os horários trocados (em
+        # qualquer período); gaps e aulas consecutivas, nas trocas do mesmo
+        # período que envolvem os dias alterados
+        self._stale |= (self.first == first) | (self.first == second)
+        self._stale |= (self.second == first) | (self.second == second)
+        same_period = slice(period * self.moves_per_period, (period + 1) * self.moves_per_period)
+        self._stale[same_period] |= np.isin(self.first_day[same_period], days) | np.isin(self.second_day[same_period], days)
+
+        # Regras com índice: trocas (em qualquer período) que envolvem os grupos alterados
+        for _, index in self.indexes:
+            groups = index.bins[[first, second]]
+            self._stale |= np.isin(index.bins[self.first], groups) | np.isin(index.bins[self.second], groups)
+
+class LocalSearch:
+    METHODS = ("hill_climbing", "tabu")
+
+    def __init__(self, method="hill_climbing", top_k=2, max_iterations=20, tabu_tenure=10):
+        """
+        Busca local (fase memética) aplicada aos melhores indivíduos.
+
+        - hill_climbing: a cada iteração aplica a troca de maior ganho da
+          vizinhança (subida mais íngreme), parando quando nenhuma melhora;
+        - tabu: aplica a melhor troca não proibida, mesmo que piore a grade;
+          trocas recentes ficam proibidas por tabu_tenure iterações, a não
+          ser que levem a uma aptidão melhor que a melhor já vista. Ao final,
+          fica a melhor grade encontrada.
+
+        :param method: Método da busca (hill_climbing ou tabu).
+        :param top_k: Número de melhores indivíduos refinados a cada geração.
+        :param max_iterations: Número máximo de trocas por indivíduo.
+        :param tabu_tenure: Número de iterações em que uma troca fica proibida (tabu).
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método de busca local desconhecido: {method}")
+        self.method = method
+        self.top_k = top_k
+        self.max_iterations = max_iterations
+        self.tabu_tenure = tabu_tenure
+
+    def improve(self, evaluator, schedule, fitness, rng=None):
+        """
+        Refina uma grade no próprio array.
+
+        :param evaluator: FitnessEvaluator usado na execução.
+        :param schedule: Grade (num_periods, total_slots).
+        :param fitness: Aptidão atual da grade.
+        :param rng: Gerador aleatório (amostra das trocas com regras sem índice incremental).
+        :return: Aptidão da grade refinada.
+        """
+        neighborhood = SwapNeighborhood(evaluator, schedule, rng)
+        if len(neighborhood) == 0:
+            return fitness
+        if self.method == "hill_climbing":
+            return self._hill_climbing(neighborhood, fitness)
+        return self._tabu(neighborhood, fitness)
+
+    def _hill_climbing(self, neighborhood, fitness):
+        for _ in range(self.max_iterations):
+            deltas = neighborhood.deltas()
+            candidates = np.flatnonzero(neighborhood.candidates)
+            move = candidates[np.argmax(deltas[candidates])]
+            if deltas[move] <= 0:
+                break
+            neighborhood.apply(move)
+            fitness += deltas[move]
+        return fitness
+
+    def _tabu(self, neighborhood, fitness):
+        schedule = neighborhood.schedule
+        best_schedule, best_fitness = schedule.copy(), fitness
+        tabu_until = np.zeros(len(neighborhood.period), dtype=np.int64)
+
+        for iteration in range(1, self.max_iterations + 1):
+            deltas = neighborhood.deltas()
+            # Trocas entre disciplinas iguais não mudam a grade
+            same = schedule[neighborhood.period, neighborhood.first] == schedule[neighborhood.period, neighborhood.second]
+            allowed = neighborhood.candidates & ~same & ((tabu_until < iteration) | (fitness + deltas > best_fitness))
+            if not allowed.any():
+                break
+
+            move = np.flatnonzero(allowed)[np.argmax(deltas[allowed])]
+            neighborhood.apply(move)
+            fitness += deltas[move]
+            tabu_until[move] = iteration + self.tabu_tenure
+
+            if fitness > best_fitness:
+                best_schedule[:], best_fitness = schedule, fitness
+
+        schedule[:] = best_schedule
+        return best_fitness
+
+    def apply(self, population, evaluator, rng=None):
+        """
+        Refina os top_k melhores indivíduos da população (já avaliada), no
+        próprio array dos genes, e atualiza a aptidão em cache.
+
+        :param rng: Gerador aleatório repassado a improve.
+        :return: Índices dos indivíduos refinados.
+        """
+        best = np.argsort(population.fitness, kind="stable")[::-1][:self.top_k]
+        for index in best:
+            population.fitness[index] = self.improve(evaluator, population.genes[index],
+                                                     int(population.fitness[index]), rng)
+        return best
@@ -1,6 +1,7 @@
-from interface import Interface
-
 def main():
+    # A interface (Tkinter e matplotlib) só é importada ao abrir a janela
+    from .interface import Interface
+
     interface = Interface()
     interface.run()
 
@@ -1,4 +1,5 @@
-from subject import Subject
+from .subject import Subject
+from .catalog import group_by_period
 
 # Lista de disciplinas mockadas
 subjects = [
@@ -48,14 +49,7 @@ subjects = [
 ]
 
 # Mapeamento de períodos para disciplinas
-period_subjects = {
-    1: [subject.id for subject in subjects if subject.period == 1],
-    2: [subject.id for subject in subjects if subject.period == 2],
-    3: [subject.id for subject in subjects if subject.period == 3],
-    4: [subject.id for subject in subjects if subject.period == 4],
-    5: [subject.id for subject in subjects if subject.period == 5],
-    6: [subject.id for subject in subjects if subject.period == 6],
-} 
+period_subjects = group_by_period(subjects)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+import numpy as np
+from .occupancy import TeacherOccupancy
+
+class Mutation:
+    METHODS = ("swap", "day_block", "conflict")
+
+    def __init__(self, method="swap", rate=0.1, swaps=1):
+        """
+        Mutação de toda a população de uma vez, sobre o tensor dos genes.
+
+        Cada linha de período de cada indivíduo sofre mutação com probabilidade
+        rate. Todas as decisões e posições vêm de uma única chamada ao gerador
+        aleatório e as trocas são aplicadas por indexação sobre todas as linhas
+        sorteadas ao mesmo tempo. As trocas acontecem dentro da linha, então a
+        carga horária de cada período é preservada.
+
+        Operadores:
+        - swap: troca dois horários sorteados da linha;
+        - day_block: troca os horários de dois dias inteiros da linha;
+        - conflict: troca um horário em conflito de professor (sorteado entre
+          os horários em conflito da linha) com outro horário qualquer; linhas
+          sem conflito não mudam.
+
+        :param method: Operador de mutação (swap, day_block ou conflict).
+        :param rate: Probabilidade de mutação de cada linha de período.
+        :param swaps: Número de trocas em cada linha sorteada.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método de mutação desconhecido: {method}")
+        self.method = method
+        self.rate = rate
+        self.swaps = swaps
+
+    def apply(self, population, rng, catalog=None, evaluator=None):
+        """
+        Aplica a mutação nos genes da população.
+
+        Com um avaliador cujas regras são todas locais (ver
+        FitnessEvaluator.incremental), a aptidão em cache dos indivíduos
+        alterados é atualizada recalculando só os horários e os dias tocados
+        pelas trocas; caso contrário, ela é descartada e os indivíduos são
+        reavaliados por completo.
+
+        :param population: Population a ser alterada.
+        :param rng: Gerador aleatório (np.random.Generator).
+        :param catalog: Catálogo das disciplinas (obrigatório para o operador conflict).
+        :param evaluator: FitnessEvaluator para a atualização incremental da aptidão.
+        :return: Índices dos indivíduos alterados.
+        """
+        genes = population.genes
+        size, num_periods, total_slots = genes.shape
+
+        # Uma única chamada ao gerador: decisão de cada linha e duas posições por troca
+        draws = rng.random((1 + 2 * self.swaps, size, num_periods))
+        individual, period = np.nonzero(draws[0] < self.rate)
+        if len(individual) == 0:
+            return individual
+
+        conflicting = None
+        if self.method == "conflict":
+            conflicting = TeacherOccupancy(catalog, genes).conflicting_cells()
+
+        # Posições de todas as trocas, calculadas antes de alterar os genes
+        swaps = []
+        for swap in range(self.swaps):
+            first_draw = draws[1 + 2 * swap, individual, period]
+            second_draw = draws[2 + 2 * swap, individual, period]
+
+            if self.method == "day_block":
+                first, second = self._block_columns(first_draw, second_draw, population.num_days,
+                                                    population.num_slots)
+            else:
+                if self.method == "conflict":
+                    first, valid = self._pick_conflicting(conflicting[individual, period], first_draw)
+                else:
+                    first = (first_draw * total_slots).astype(np.intp)
+                    valid = None
+                # Segundo horário diferente do primeiro
+                second = (first + 1 + (second_draw * (total_slots - 1)).astype(np.intp)) % total_slots
+                if valid is not None:
+                    second = np.where(valid, second, first)
+                first, second = first[:, np.newaxis], second[:, np.newaxis]
+            swaps.append((first, second))
+
+        mutated = np.unique(individual)
+        incremental = evaluator is not None and evaluator.incremental
+        if incremental:
+            # Só os indivíduos já avaliados são atualizados; os demais serão avaliados por completo
+            scored = population.evaluated[individual]
+            columns, blocks = self._touched(individual[scored], period[scored],
+                                            [(first[scored], second[scored]) for first, second in swaps],
+                                            population.num_slots, num_periods, total_slots)
+            before = evaluator.local_fitness(genes, columns, blocks)
+
+        rows = individual[:, np.newaxis], period[:, np.newaxis]
+        for first, second in swaps:
+            values = genes[rows[0], rows[1], first]
+            genes[rows[0], rows[1], first] = genes[rows[0], rows[1], second]
+            genes[rows[0], rows[1], second] = values
+
+        if incremental:
+            population.fitness += evaluator.local_fitness(genes, columns, blocks) - before
+        else:
+            population.invalidate(mutated)
+        return mutated
+
+    @staticmethod
+    def _touched(individual, period, swaps, num_slots, num_periods, total_slots):
+        """
+        Horários (indivíduo, coluna) e dias (indivíduo, período, dia) tocados
+        pelas trocas, sem repetição.
+        """
+        cells = np.concatenate([np.concatenate([first, second], axis=1) for first, second in swaps], axis=1)
+        num_days = total_slots // num_slots
+
+        columns = np.unique(individual[:, np.newaxis] * total_slots + cells)
+        blocks = np.unique((individual[:, np.newaxis] * num_periods + period[:, np.newaxis]) * num_days
+                           + cells // num_slots)
+        return np.divmod(columns, total_slots), (
+            blocks // (num_periods * num_days), blocks // num_days % num_periods, blocks % num_days
+        )
+
+    @staticmethod
+    def _pick_conflicting(mask, draw):
+        """
+        Sorteia, em cada linha da máscara, uma das células marcadas.
+
+        :return: Índice da célula sorteada e se a linha tinha alguma célula marcada.
+        """
+        counts = mask.sum(axis=1)
+        valid = counts > 0
+        target = (draw * counts).astype(np.intp)  # k-ésima célula marcada da linha
+        position = np.cumsum(mask, axis=1) - 1
+        first = np.argmax(mask & (position == target[:, np.newaxis]), axis=1)
+        return first, valid
+
+    @staticmethod
+    def _block_columns(first_draw, second_draw, num_days, num_slots):
+        """
+        Colunas dos dois dias (diferentes) cujos horários serão trocados.
+        """
+        first_day = (first_draw * num_days).astype(np.intp)
+        second_day = (first_day + 1 + (second_draw * (num_days - 1)).astype(np.intp)) % num_days
+        offsets = np.arange(num_slots)
+        return (first_day[:, np.newaxis] * num_slots + offsets,
+                second_day[:, np.newaxis] * num_slots + offsets)
@@ -0,0 +1,205 @@
+import queue
+import sys
+
+class GenerationRecord:
+    __slots__ = ("generation", "best_fitness", "mean_fitness", "worst_fitness",
+                 "diversity", "timings", "elapsed", "best_individual")
+
+    def __init__(self, generation, best_fitness, mean_fitness, worst_fitness, diversity,
+                 timings, elapsed, best_individual):
+        """
+        Resumo de uma geração, produzido por GeneticAlgorithm.evolve.
+
+        :param generation: Número da geração (0 para a população inicial).
+        :param best_fitness: Melhor aptidão da população.
+        :param mean_fitness: Aptidão média da população.
+        :param worst_fitness: Pior aptidão da população.
+        :param diversity: Fração média de genes diferentes do melhor indivíduo (0 a 1).
+        :param timings: Tempo gasto em cada fase da geração, em segundos.
+        :param elapsed: Tempo total desde o início da execução, em segundos.
+        :param best_individual: Melhor indivíduo da população (Timetable).
+        """
+        self.generation = generation
+        self.best_fitness = best_fitness
+        self.mean_fitness = mean_fitness
+        self.worst_fitness = worst_fitness
+        self.diversity = diversity
+        self.timings = timings
+        self.elapsed = elapsed
+        self.best_individual = best_individual
+
+    def as_dict(self):
+        """
+        Retorna o registro como dicionário, sem o melhor indivíduo.
+        """
+        return {
+            "generation": self.generation,
+            "best_fitness": float(self.best_fitness),
+            "mean_fitness": float(self.mean_fitness),
+            "worst_fitness": float(self.worst_fitness),
+            "diversity": float(self.diversity),
+            "timings": dict(self.timings),
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self):
+        return (f"GenerationRecord(generation={self.generation}, best={self.best_fitness}, "
+                f"mean={self.mean_fitness:.2f}, worst={self.worst_fitness}, "
+                f"diversity={self.diversity:.3f})")
+
+class Observer:
+    """
+    Base dos observadores de GeneticAlgorithm.run. Todos os métodos são
+    opcionais e não fazem nada por padrão.
+    """
+
+    def on_start(self, ga):
+        """
+        Chamado antes da primeira geração, com a população inicial já criada.
+        """
+
+    def on_generation(self, record):
+        """
+        Chamado ao final de cada geração com o GenerationRecord correspondente.
+        """
+
+    def on_finish(self, ga, record):
+        """
+        Chamado ao final da execução com o último registro (o da população
+        inicial se nenhuma geração foi executada).
+        """
+
+class CallbackObserver(Observer):
+    def __init__(self, callback):
+        """
+        Adapta o update_callback(generation, best_individual, best_fitness)
+        usado pela interface gráfica.
+        """
+        self.callback = callback
+
+    def on_generation(self, record):
+        self.callback(
+            generation=record.generation,
+            best_individual=record.best_individual,
+            best_fitness=record.best_fitness
+        )
+
+class QueueObserver(Observer):
+    FINISHED = "finished"  # Marca o fim da execução na fila
+
+    def __init__(self, maxsize=1000):
+        """
+        Publica os registros das gerações em uma fila limitada, para que outra
+        thread (por exemplo, a da interface gráfica) os consuma no seu ritmo.
+
+        O algoritmo nunca espera pela fila: se ela estiver cheia, o registro
+        mais antigo é descartado. Ao final, a fila recebe a tupla
+        (QueueObserver.FINISHED, motivo da parada).
+
+        :param maxsize: Número máximo de registros na fila.
+        """
+        self.queue = queue.Queue(maxsize=maxsize)
+
+    def _put(self, item):
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def on_generation(self, record):
+        self._put(record)
+
+    def on_finish(self, ga, record):
+        self._put((self.FINISHED, ga.stop_reason))
+
+    def drain(self):
+        """
+        Retira todos os itens disponíveis na fila, sem esperar.
+        """
+        items = []
+        while True:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                return items
+
+class LoggingObserver(Observer):
+    def __init__(self, stream=None, every=1):
+        """
+        Escreve um resumo de cada geração.
+
+        :param stream: Arquivo de saída (sys.stdout se omitido).
+        :param every: Intervalo, em gerações, entre as linhas escritas.
+        """
+        self.stream = stream
+        self.every = every
+
+    def _write(self, text):
+        print(text, file=self.stream or sys.stdout)
+
+    def on_start(self, ga):
+        self._write(f"População inicial: {ga.current_population} - melhor aptidão {ga.best_fitness}")
+
+    def on_generation(self, record):
+        if record.generation % self.every == 0:
+            self._write(
+                f"Geração {record.generation}: melhor {record.best_fitness}, "
+                f"média {record.mean_fitness:.2f}, pior {record.worst_fitness}, "
+                f"diversidade {record.diversity:.3f} ({sum(record.timings.values()) * 1000:.1f} ms)"
+            )
+
+    def on_finish(self, ga, record):
+        self._write(f"Melhor aptidão final: {ga.best_fitness} (parada: {ga.stop_reason})")
+
+class PlotObserver(Observer):
+    def __init__(self, path=None):
+        """
+        Guarda a evolução da aptidão e, ao final, desenha o gráfico.
+
+        O matplotlib só é importado ao desenhar.
+
+        :param path: Arquivo onde o gráfico é salvo ao final da execução
+                     (se omitido, apenas guarda o histórico).
+        """
+        self.path = path
+        self.generations = []
+        self.best = []
+        self.mean = []
+
+    def on_generation(self, record):
+        self.generations.append(record.generation)
+        self.best.append(record.best_fitness)
+        self.mean.append(record.mean_fitness)
+
+    def on_finish(self, ga, record):
+        if self.path is not None:
+            figure = self.plot()
+            figure.savefig(self.path)
+
+    def plot(self, ax=None):
+        """
+        Desenha a melhor aptidão e a aptidão média por geração.
+
+        :param ax: Eixos do matplotlib (cria uma figura nova se omitido).
+        :return: Figura do gráfico.
+        """
+        if ax is None:
+            from matplotlib.figure import Figure
+            figure = Figure(figsize=(6, 4))
+            ax = figure.subplots()
+        else:
+            figure = ax.figure
+
+        ax.set_title("Evolução da Aptidão")
+        ax.set_xlabel("Geração")
+        ax.set_ylabel("Aptidão")
+        ax.plot(self.generations, self.best, 'b-', label="Melhor")
+        ax.plot(self.generations, self.mean, 'g--', label="Média")
+        ax.grid(True)
+        ax.legend()
+        return figure
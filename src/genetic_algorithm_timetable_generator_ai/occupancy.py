@@ -0,0 +1,199 @@
+import numpy as np
+
+def occupancy(values, num_values):
+    """
+    Conta quantas vezes cada valor aparece em cada horário (coluna) de cada indivíduo.
+
+    :param values: Tensor (tamanho, num_periods, total_slots) de índices (-1 é ignorado).
+    :param num_values: Número de valores possíveis.
+    :return: Tensor (tamanho, total_slots, num_values).
+    """
+    size, _, total_slots = values.shape
+    valid = values >= 0
+    individual, _, slot = np.nonzero(valid)
+
+    index = (individual * total_slots + slot) * num_values + values[valid]
+    counts = np.bincount(index, minlength=size * total_slots * num_values)
+    return counts.reshape(size, total_slots, num_values)
+
+def excess(counts):
+    """
+    Conflitos de uma contagem de ocupação: cada aula além da primeira do
+    mesmo professor no mesmo horário conta como um conflito.
+    """
+    return np.maximum(counts - 1, 0)
+
+class TeacherOccupancy:
+    def __init__(self, catalog, genes):
+        """
+        Índice de ocupação dos professores: quantas aulas cada professor tem em
+        cada horário de cada indivíduo, tensor (tamanho, num_teachers, total_slots).
+
+        Com o índice, os conflitos de um indivíduo são soma(max(0, contagem - 1)),
+        a troca de dois horários de uma linha atualiza no máximo quatro
+        contagens, e as células em conflito saem de uma consulta direta,
+        sem comparar os períodos entre si.
+
+        :param catalog: Catálogo compilado das disciplinas (Catalog).
+        :param genes: Tensor (tamanho, num_periods, total_slots), mantido em
+                      sincronia pelas trocas feitas com swap.
+        """
+        self.catalog = catalog
+        self.genes = genes
+        teachers = catalog.teacher[genes]
+        self.counts = np.ascontiguousarray(
+            occupancy(teachers, catalog.num_teachers).transpose(0, 2, 1)
+        )
+
+    def conflicts(self):
+        """
+        Número de conflitos de cada indivíduo.
+        """
+        return np.sum(excess(self.counts), axis=(1, 2))
+
+    def swap(self, individual, period, first, second):
+        """
+        Troca dois horários de uma linha de período nos genes e atualiza o
+        índice em O(1).
+        """
+        row = self.genes[individual, period]
+        for slot, other in ((first, second), (second, first)):
+            teacher = self.catalog.teacher[row[slot]]
+            if teacher >= 0:
+                self.counts[individual, teacher, slot] -= 1
+                self.counts[individual, teacher, other] += 1
+        row[first], row[second] = row[second], row[first]
+
+    def swap_conflict_delta(self, individual, period, first, second):
+        """
+        Variação do número de conflitos de cada troca (vetorizado nos índices).
+
+        :param individual: Índice(s) do indivíduo de cada troca.
+        :param period: Linha de período de cada troca.
+        :param first: Primeiro horário de cada troca.
+        :param second: Segundo horário de cada troca.
+        """
+        genes, counts = self.genes, self.counts
+        first_teacher = self.catalog.teacher[genes[individual, period, first]]
+        second_teacher = self.catalog.teacher[genes[individual, period, second]]
+
+        # Tirar um professor de um horário com c aulas só reduz os conflitos se
+        # c > 1; colocar em um horário com c aulas só aumenta se c > 0
+        delta = np.zeros(np.shape(first_teacher), dtype=np.int64)
+        for teacher, source, target in ((first_teacher, first, second), (second_teacher, second, first)):
+            valid = teacher >= 0
+            row = np.maximum(teacher, 0)
+            moved = (counts[individual, row, target] > 0).astype(np.int64) - (counts[individual, row, source] > 1)
+            delta += np.where(valid, moved, 0)
+
+        return np.where(first_teacher == second_teacher, 0, delta)
+
+    def conflicting_cells(self):
+        """
+        Máscara (tamanho, num_periods, total_slots) das células cujo professor
+        dá outra aula no mesmo horário.
+        """
+        teachers = self.catalog.teacher[self.genes]
+        size, _, total_slots = self.genes.shape
+        clashes = self.counts[
+            np.arange(size)[:, np.newaxis, np.newaxis],
+            np.maximum(teachers, 0),
+            np.arange(total_slots)
+        ]
+        return (teachers >= 0) & (clashes > 1)
+
+    def clashes(self, individual):
+        """
+        Conflitos de um indivíduo: pares (índice do professor, horário) com
+        mais de uma aula.
+        """
+        teacher, slot = np.nonzero(self.counts[individual] > 1)
+        return list(zip(teacher.tolist(), slot.tolist()))
+
+class SwapCounts:
+    def __init__(self, table, schedule, bins, num_bins, capacity):
+        """
+        Variação, em trocas de dois horários de uma grade, de uma penalidade
+        do tipo soma(max(0, contagem - capacidade)) sobre contagens por
+        (classe, grupo de horários): por exemplo, aulas de cada professor por
+        dia ou aulas de cada tipo de sala por horário.
+
+        :param table: Vetor id da disciplina → classe (-1 para ignorar a célula).
+        :param schedule: Grade (num_periods, total_slots), lida a cada chamada.
+        :param bins: Vetor horário → grupo (o próprio horário, o dia, ...).
+        :param num_bins: Número de grupos.
+        :param capacity: Capacidade de cada classe (escalar ou vetor).
+        """
+        self.table = table
+        self.schedule = schedule
+        self.bins = bins
+        num_classes = max(int(table.max(initial=-1)) + 1, np.size(capacity))
+        self.capacity = np.broadcast_to(np.asarray(capacity, dtype=np.int64), (num_classes,))
+
+        labels = table[schedule]
+        period, slot = np.nonzero(labels >= 0)
+        self.counts = np.zeros((num_classes, num_bins), dtype=np.int64)
+        np.add.at(self.counts, (labels[period, slot], bins[slot]), 1)
+
+    def deltas(self, period, first, second):
+        """
+        Variação da penalidade de cada troca (vetorizado nos índices).
+        """
+        first_label = self.table[self.schedule[period, first]]
+        second_label = self.table[self.schedule[period, second]]
+        first_bin, second_bin = self.bins[first], self.bins[second]
+
+        # Tirar uma aula de um grupo com c aulas só reduz a penalidade se
+        # c > capacidade; colocar em um grupo com c aulas só aumenta se c >= capacidade
+        delta = np.zeros(np.shape(first_label), dtype=np.int64)
+        for label, source, target in ((first_label, first_bin, second_bin), (second_label, second_bin, first_bin)):
+            row = np.maximum(label, 0)
+            capacity = self.capacity[row]
+            moved = ((self.counts[row, target] >= capacity).astype(np.int64)
+                     - (self.counts[row, source] > capacity))
+            delta += np.where(label >= 0, moved, 0)
+
+        return np.where((first_label == second_label) | (first_bin == second_bin), 0, delta)
+
+    def swap(self, period, first, second):
+        """
+        Atualiza as contagens para uma troca (chamado antes de trocar os genes).
+        """
+        row = self.schedule[period]
+        for slot, other in ((first, second), (second, first)):
+            label = self.table[row[slot]]
+            if label >= 0:
+                self.counts[label, self.bins[slot]] -= 1
+                self.counts[label, self.bins[other]] += 1
+
+class SwapCellCosts:
+    def __init__(self, table, schedule, costs):
+        """
+        Variação, em trocas de dois horários de uma grade, de uma penalidade
+        que soma um custo por (classe, horário) de cada célula: por exemplo,
+        aulas de professores em horários indisponíveis.
+
+        :param table: Vetor id da disciplina → classe (-1 para ignorar a célula).
+        :param schedule: Grade (num_periods, total_slots), lida a cada chamada.
+        :param costs: Matriz (num_classes, total_slots) com o custo de cada célula.
+        """
+        self.table = table
+        self.schedule = schedule
+        self.costs = costs
+        self.bins = np.arange(schedule.shape[1])
+
+    def deltas(self, period, first, second):
+        """
+        Variação da penalidade de cada troca (vetorizado nos índices).
+        """
+        delta = np.zeros(np.shape(period), dtype=np.int64)
+        for source, target in ((first, second), (second, first)):
+            label = self.table[self.schedule[period, source]]
+            row = np.maximum(label, 0)
+            delta += np.where(label >= 0, self.costs[row, target] - self.costs[row, source], 0)
+        return delta
+
+    def swap(self, period, first, second):
+        """
+        Os custos não dependem das outras células: nada a atualizar.
+        """
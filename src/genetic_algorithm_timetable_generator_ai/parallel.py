@@ -0,0 +1,162 @@
+import math
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+# Estado de cada processo trabalhador (definido em _init_worker)
+_worker_evaluator = None
+_worker_segments = {}
+
+def _init_worker(evaluator):
+    """
+    Inicializa um processo trabalhador com o avaliador de aptidão.
+    O avaliador é serializado uma única vez, na criação do pool.
+    """
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+def _attach(name):
+    """
+    Abre (e mantém aberto) o segmento de memória compartilhada da população.
+    """
+    segment = _worker_segments.get(name)
+    if segment is None:
+        # Libera os segmentos antigos: o processo principal troca de segmento
+        # quando o tamanho da população muda
+        for old in _worker_segments.values():
+            old.close()
+        _worker_segments.clear()
+
+        # O rastreador de recursos é o do processo principal (ver start), que é
+        # quem remove o segmento (unlink)
+        segment = shared_memory.SharedMemory(name=name)
+        _worker_segments[name] = segment
+    return segment
+
+def _evaluate_chunk(task):
+    """
+    Avalia uma fatia [start, stop) da população guardada em memória compartilhada.
+    """
+    name, shape, dtype, start, stop = task
+    segment = _attach(name)
+    population = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+    return _worker_evaluator.evaluate(population[start:stop])
+
+class ParallelEvaluator:
+    def __init__(self, evaluator, workers, capacity=None):
+        """
+        Avalia a aptidão da população em paralelo com um pool de processos.
+
+        Os indivíduos a avaliar são copiados (uma única vez) para um segmento
+        de multiprocessing.shared_memory; cada trabalhador recebe apenas o nome
+        do segmento e a fatia que deve avaliar, sem serializar as grades
+        horárias. O segmento é alocado para capacity indivíduos e só é
+        recriado quando precisa crescer ou quando o formato das grades muda.
+
+        :param evaluator: Avaliador vetorizado (FitnessEvaluator).
+        :param workers: Número de processos trabalhadores.
+        :param capacity: Número de indivíduos reservado no segmento (ex.: o tamanho da população).
+        """
+        if workers < 1:
+            raise ValueError("O número de trabalhadores deve ser pelo menos 1")
+
+        self.evaluator = evaluator
+        self.workers = workers
+        self.capacity = capacity or 0
+        self.segments_created = 0  # Número de segmentos alocados (para medir o reaproveitamento)
+        self._pool = None
+        self._segment = None
+        self._shape = None
+        self._dtype = None
+
+    def start(self):
+        """
+        Cria o pool de processos, se ainda não existir.
+        """
+        if self._pool is None:
+            # Garante que os trabalhadores herdem o rastreador de recursos do
+            # processo principal, em vez de criarem um próprio que removeria os
+            # segmentos de memória compartilhada ao encerrar
+            resource_tracker.ensure_running()
+            self._pool = multiprocessing.Pool(
+                self.workers, initializer=_init_worker, initargs=(self.evaluator,)
+            )
+
+    def evaluate(self, population, rows=None):
+        """
+        Calcula a aptidão de cada indivíduo do tensor da população.
+
+        Os indivíduos são divididos em fatias contíguas, uma por trabalhador, e
+        os resultados são concatenados na ordem original, então o resultado é
+        idêntico ao da avaliação serial.
+
+        :param population: Tensor (tamanho_da_população, num_periods, total_slots).
+        :param rows: Índices dos indivíduos a avaliar (por padrão, todos).
+        :return: Vetor com a aptidão de cada indivíduo avaliado.
+        """
+        population = np.asarray(population)
+        size = len(population) if rows is None else len(rows)
+        if size == 0:
+            return self.evaluator.evaluate(population[:0])
+
+        self.start()
+        shared = self._share(population, rows, size)
+
+        chunk = math.ceil(size / self.workers)
+        tasks = [
+            (self._segment.name, shared.shape, shared.dtype.str, start, min(start + chunk, size))
+            for start in range(0, size, chunk)
+        ]
+        results = self._pool.map(_evaluate_chunk, tasks)
+
+        return np.concatenate(results)
+
+    def _share(self, population, rows, size):
+        """
+        Copia os indivíduos a avaliar para o início do segmento de memória
+        compartilhada, recriando o segmento apenas quando ele precisa crescer
+        ou quando o formato das grades ou o tipo mudam.
+        """
+        row_shape = population.shape[1:]
+        if (self._shape is None or self._shape[1:] != row_shape or self._dtype != population.dtype
+                or self._shape[0] < size):
+            self._release_segment()
+            self.capacity = max(self.capacity, size)
+            shape = (self.capacity,) + row_shape
+            nbytes = int(np.prod(shape)) * population.dtype.itemsize
+            self._segment = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            self.segments_created += 1
+            self._shape = shape
+            self._dtype = population.dtype
+
+        shared = np.ndarray(self._shape, dtype=self._dtype, buffer=self._segment.buf)
+        if rows is None:
+            np.copyto(shared[:size], population)
+        else:
+            np.take(population, rows, axis=0, out=shared[:size])
+        return shared
+
+    def _release_segment(self):
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+            self._shape = None
+            self._dtype = None
+
+    def close(self):
+        """
+        Encerra o pool de processos e libera a memória compartilhada.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._release_segment()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
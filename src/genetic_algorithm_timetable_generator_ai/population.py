@@ -0,0 +1,144 @@
+import numpy as np
+from .timetable import Timetable
+
+class Population:
+    def __init__(self, genes, num_days, num_slots, fitness=None, evaluated=None):
+        """
+        População guardada em um único array contíguo.
+
+        Cada indivíduo é uma fatia genes[i] com formato (num_periods, total_slots),
+        com os ids das disciplinas no menor tipo inteiro que os comporta. A aptidão
+        em cache fica em um vetor separado, junto de uma máscara que indica quais
+        indivíduos já foram avaliados.
+
+        :param genes: Tensor (tamanho_da_população, num_periods, total_slots).
+        :param num_days: Número de dias na semana.
+        :param num_slots: Número de aulas por dia.
+        :param fitness: Vetor com a aptidão em cache de cada indivíduo.
+        :param evaluated: Máscara dos indivíduos cuja aptidão em cache é válida.
+        """
+        self.genes = genes
+        self.num_periods = genes.shape[1]
+        self.num_days = num_days
+        self.num_slots = num_slots
+        self.total_slots = num_days * num_slots
+        self.fitness = fitness if fitness is not None else np.zeros(len(genes), dtype=np.int64)
+        self.evaluated = evaluated if evaluated is not None else np.zeros(len(genes), dtype=bool)
+        self._spare = None  # Buffer reserva com o formato dos genes (ver spare e commit)
+
+    @classmethod
+    def empty(cls, size, num_periods, num_days, num_slots, max_subject_id):
+        """
+        Cria uma população com todas as grades vazias.
+
+        :param max_subject_id: Maior id de disciplina, usado para escolher o tipo
+                               dos genes (uint8, uint16, ...).
+        """
+        dtype = cls.dtype_for(max_subject_id)
+        genes = np.zeros((size, num_periods, num_days * num_slots), dtype=dtype)
+        return cls(genes, num_days, num_slots)
+
+    @staticmethod
+    def dtype_for(max_subject_id):
+        """
+        Menor tipo inteiro sem sinal capaz de guardar os ids das disciplinas.
+        """
+        return np.min_scalar_type(max(int(max_subject_id), 1))
+
+    def __len__(self):
+        return len(self.genes)
+
+    def __iter__(self):
+        for index in range(len(self.genes)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        """
+        Com um índice inteiro, retorna uma visão (sem cópia) do indivíduo como
+        Timetable; com uma fatia ou um vetor de índices, retorna uma nova
+        população (ver take).
+        """
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self.genes)
+            return Timetable.from_population(self, index)
+        return self.take(index)
+
+    def __setitem__(self, index, timetable):
+        """
+        Copia a grade (e a aptidão em cache) de um Timetable para a posição informada.
+        """
+        self.genes[index] = timetable.schedule
+        if timetable.fitness is None:
+            self.evaluated[index] = False
+        else:
+            self.fitness[index] = timetable.fitness
+            self.evaluated[index] = True
+
+    def take(self, indices):
+        """
+        Retorna uma nova população com os indivíduos dos índices informados
+        (usado na seleção; índices repetidos geram cópias independentes).
+        """
+        return Population(
+            self.genes[indices], self.num_days, self.num_slots,
+            fitness=self.fitness[indices], evaluated=self.evaluated[indices]
+        )
+
+    def spare(self, size=None):
+        """
+        Buffer reserva, do mesmo formato e tipo dos genes, para escrever a
+        próxima geração sem alocar memória nem sobrescrever a atual.
+
+        :param size: Número de indivíduos da próxima geração (por padrão, o atual).
+        """
+        shape = (len(self.genes) if size is None else size,) + self.genes.shape[1:]
+        if self._spare is None or self._spare.shape != shape or self._spare.dtype != self.genes.dtype:
+            self._spare = np.empty(shape, dtype=self.genes.dtype)
+        return self._spare
+
+    def commit(self, fitness, evaluated):
+        """
+        Troca os genes pelo buffer reserva (já preenchido com a nova geração);
+        os genes antigos passam a ser o buffer reserva.
+
+        :param fitness: Aptidão em cache dos novos indivíduos.
+        :param evaluated: Máscara dos novos indivíduos cuja aptidão em cache é válida.
+        """
+        self.genes, self._spare = self._spare, self.genes
+        self.fitness = fitness
+        self.evaluated = evaluated
+
+    def replace(self, indices, source):
+        """
+        Substitui os indivíduos dos índices informados pelos indivíduos de outra
+        população, na mesma ordem (usado no elitismo).
+        """
+        self.genes[indices] = source.genes
+        self.fitness[indices] = source.fitness
+        self.evaluated[indices] = source.evaluated
+
+    def invalidate(self, indices=None):
+        """
+        Descarta a aptidão em cache dos indivíduos informados (ou de todos).
+        """
+        if indices is None:
+            self.evaluated[:] = False
+        else:
+            self.evaluated[indices] = False
+
+    def stale(self):
+        """
+        Índices dos indivíduos que precisam ser avaliados.
+        """
+        return np.flatnonzero(~self.evaluated)
+
+    @property
+    def nbytes(self):
+        """
+        Memória ocupada pela população, em bytes.
+        """
+        return self.genes.nbytes + self.fitness.nbytes + self.evaluated.nbytes
+
+    def __repr__(self):
+        return f"Population(size={len(self.genes)}, dtype={self.genes.dtype}, evaluated={int(self.evaluated.sum())})"
@@ -0,0 +1,98 @@
+import numpy as np
+
+def selection_weights(fitness_values):
+    """
+    Pesos não negativos para as seleções proporcionais à aptidão.
+
+    A aptidão pode ser negativa, então os valores são deslocados para que o
+    pior indivíduo tenha peso 0. Se todos tiverem a mesma aptidão, os pesos
+    ficam iguais.
+    """
+    fitness_values = np.asarray(fitness_values, dtype=np.float64)
+    weights = fitness_values - fitness_values.min()
+    if weights.sum() <= 0:
+        return np.ones_like(weights)
+    return weights
+
+def roulette(fitness_values, count, rng):
+    """
+    Seleção por roleta: cada sorteio é independente, com probabilidade
+    proporcional à aptidão deslocada.
+    """
+    weights = selection_weights(fitness_values)
+    return rng.choice(len(weights), size=count, p=weights / weights.sum())
+
+def stochastic_universal(fitness_values, count, rng):
+    """
+    Amostragem universal estocástica: count ponteiros igualmente espaçados
+    sobre a roleta, com um único deslocamento aleatório. Cada indivíduo é
+    escolhido um número de vezes tão próximo quanto possível do esperado.
+    """
+    weights = selection_weights(fitness_values)
+    cumulative = np.cumsum(weights)
+    pointers = (rng.random() + np.arange(count)) * (cumulative[-1] / count)
+    indices = np.searchsorted(cumulative, pointers, side="right")
+    return np.minimum(indices, len(weights) - 1)
+
+def tournament(fitness_values, count, rng, size=3):
+    """
+    Seleção por torneio: todos os torneios vêm de um único sorteio
+    (count, size) de índices, e o vencedor de cada linha é escolhido com
+    argmax. Os participantes são sorteados com reposição.
+
+    :param size: Número de participantes de cada torneio (pelo menos 1).
+    """
+    if size is None or size < 1:
+        raise ValueError(f"O tamanho do torneio deve ser pelo menos 1, recebido {size!r}")
+    fitness_values = np.asarray(fitness_values)
+    participants = rng.integers(0, len(fitness_values), size=(count, size))
+    winners = np.argmax(fitness_values[participants], axis=1)
+    return participants[np.arange(count), winners]
+
+def rank(fitness_values, count, rng, pressure=1.5):
+    """
+    Seleção por ranking linear: a probabilidade depende só da posição na
+    ordenação, de (2 - pressure) / n para o pior a pressure / n para o melhor.
+
+    :param pressure: Pressão seletiva, entre 1 (uniforme) e 2.
+    """
+    n = len(fitness_values)
+    if n == 1:
+        return np.zeros(count, dtype=np.int64)
+
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[np.argsort(fitness_values, kind="stable")] = np.arange(n)
+    probabilities = ((2 - pressure) + 2 * (pressure - 1) * ranks / (n - 1)) / n
+    return rng.choice(n, size=count, p=probabilities / probabilities.sum())
+
+def truncation(fitness_values, count, rng, fraction=0.5):
+    """
+    Seleção por truncamento: sorteia uniformemente entre a fração dos
+    melhores indivíduos.
+    """
+    n = len(fitness_values)
+    best = np.argsort(fitness_values, kind="stable")[::-1][:max(1, int(round(n * fraction)))]
+    return best[rng.integers(0, len(best), size=count)]
+
+METHODS = {
+    "roulette": roulette,
+    "sus": stochastic_universal,
+    "tournament": tournament,
+    "rank": rank,
+    "truncation": truncation,
+}
+
+def select(method, fitness_values, count, rng, **options):
+    """
+    Seleciona os pais da próxima geração.
+
+    :param method: Método de seleção (roulette, sus, tournament, rank ou truncation).
+    :param fitness_values: Aptidão de cada indivíduo da população.
+    :param count: Número de indivíduos selecionados.
+    :param rng: Gerador aleatório (np.random.Generator).
+    :param options: Opções do método (ex.: size do torneio).
+    :return: Vetor com os índices dos indivíduos selecionados.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Método de seleção desconhecido: {method}")
+    return METHODS[method](fitness_values, count, rng, **options)
@@ -0,0 +1,78 @@
+class StoppingCriteria:
+    # Motivos de parada reportados em GeneticAlgorithm.stop_reason
+    MAX_GENERATIONS = "max_generations"
+    STOPPED = "stopped"
+    STAGNATION = "stagnation"
+    TARGET_FITNESS = "target_fitness"
+    FEASIBLE = "no_hard_violations"
+    TIME_LIMIT = "time_limit"
+    DIVERSITY_COLLAPSE = "diversity_collapse"
+
+    def __init__(self, stagnation=None, min_improvement=0, target_fitness=None,
+                 stop_when_feasible=False, time_limit=None, min_diversity=None):
+        """
+        Critérios de parada antecipada, verificados ao final de cada geração.
+
+        Cada critério é opcional (None ou False desativa); a execução para no
+        primeiro critério atendido, e o motivo fica em GeneticAlgorithm.stop_reason.
+
+        :param stagnation: Número de gerações sem melhora da melhor aptidão.
+        :param min_improvement: Ganho mínimo da melhor aptidão para contar como melhora.
+        :param target_fitness: Aptidão alvo.
+        :param stop_when_feasible: Para quando o melhor indivíduo não viola
+                                   nenhuma restrição forte (ex.: conflitos de professores).
+        :param time_limit: Tempo máximo de execução, em segundos.
+        :param min_diversity: Diversidade mínima da população (0 a 1).
+        """
+        self.stagnation = stagnation
+        self.min_improvement = min_improvement
+        self.target_fitness = target_fitness
+        self.stop_when_feasible = stop_when_feasible
+        self.time_limit = time_limit
+        self.min_diversity = min_diversity
+        self.reset()
+
+    def reset(self):
+        """
+        Reinicia o acompanhamento da estagnação (chamado no início de cada execução nova).
+        """
+        self.best_fitness = None
+        self.improved_at = None
+
+    def state(self):
+        """
+        Estado do acompanhamento da estagnação (para checkpoints).
+        """
+        best_fitness = None if self.best_fitness is None else int(self.best_fitness)
+        return {"best_fitness": best_fitness, "improved_at": self.improved_at}
+
+    def restore(self, state):
+        """
+        Restaura o estado gravado por state(), para continuar uma execução.
+        """
+        self.best_fitness = state["best_fitness"]
+        self.improved_at = state["improved_at"]
+
+    def check(self, ga, record):
+        """
+        Verifica os critérios para o registro de uma geração.
+
+        :param ga: GeneticAlgorithm em execução.
+        :param record: GenerationRecord da geração.
+        :return: Motivo da parada ou None para continuar.
+        """
+        if self.best_fitness is None or record.best_fitness > self.best_fitness + self.min_improvement:
+            self.best_fitness = record.best_fitness
+            self.improved_at = record.generation
+
+        if self.target_fitness is not None and record.best_fitness >= self.target_fitness:
+            return self.TARGET_FITNESS
+        if self.stop_when_feasible and ga.evaluator.hard_violations(record.best_individual.schedule) == 0:
+            return self.FEASIBLE
+        if self.stagnation is not None and record.generation - self.improved_at >= self.stagnation:
+            return self.STAGNATION
+        if self.min_diversity is not None and record.diversity < self.min_diversity:
+            return self.DIVERSITY_COLLAPSE
+        if self.time_limit is not None and record.elapsed >= self.time_limit:
+            return self.TIME_LIMIT
+        return None
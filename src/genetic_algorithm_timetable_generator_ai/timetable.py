@@ -1,21 +1,69 @@
 import numpy as np
-from subject import Subject
+from .subject import Subject
+from .grid import Grid
 
 class Timetable:
-    def __init__(self, num_periods=6, num_days=5, num_slots=4):
+    def __init__(self, num_periods=6, num_days=5, num_slots=4, schedule=None):
         """
         Inicializa uma grade horária vazia.
         
         :param num_periods: Número de períodos
         :param num_days: Número de dias na semana
         :param num_slots: Número de aulas por dia
+        :param schedule: Array (num_periods, total_slots) já existente, usado sem cópia
         """
         self.num_periods = num_periods
         self.num_days = num_days
         self.num_slots = num_slots
         self.total_slots = num_days * num_slots
-        self.schedule = np.zeros((num_periods, self.total_slots), dtype=int)
-        
+        if schedule is None:
+            schedule = np.zeros((num_periods, self.total_slots), dtype=int)
+        self.schedule = schedule
+        self._fitness = None  # Aptidão em cache (None quando precisa ser recalculada)
+        self._population = None
+        self._index = None
+
+    @classmethod
+    def from_population(cls, population, index):
+        """
+        Cria uma visão (sem cópia) do indivíduo de uma Population. Alterações na
+        grade e na aptidão em cache são feitas diretamente na população.
+        """
+        timetable = cls(population.num_periods, population.num_days, population.num_slots,
+                        schedule=population.genes[index])
+        timetable._population = population
+        timetable._index = index
+        return timetable
+
+    @property
+    def fitness(self):
+        """
+        Aptidão em cache (None quando precisa ser recalculada).
+        """
+        if self._population is not None:
+            if not self._population.evaluated[self._index]:
+                return None
+            return self._population.fitness[self._index]
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, value):
+        if self._population is not None:
+            if value is not None:
+                self._population.fitness[self._index] = value
+            self._population.evaluated[self._index] = value is not None
+        else:
+            self._fitness = value
+
+    def copy(self):
+        """
+        Retorna uma cópia independente da grade horária.
+        """
+        timetable = Timetable(self.num_periods, self.num_days, self.num_slots,
+                              schedule=self.schedule.copy())
+        timetable.fitness = self.fitness
+        return timetable
+
     def get_subject_at(self, period, day, slot):
         """
         Retorna a disciplina em um determinado horário.
@@ -29,6 +77,7 @@ class Timetable:
         """
         slot_index = self._get_slot_index(day, slot)
         self.schedule[period, slot_index] = subject_id
+        self.fitness = None
     
     def _get_slot_index(self, day, slot):
         """
@@ -62,24 +111,36 @@ class Timetable:
         """
         return np.sum(self.schedule[period] == 0)
     
-    def __str__(self):
+    def format(self, grid=None):
         """
-        Retorna uma representação em string da grade horária.
+        Retorna uma representação em texto da grade horária.
+
+        :param grid: Grade (Grid) com os nomes dos dias e dos horários; por
+                     padrão, os nomes padrão para as dimensões desta grade.
         """
-        days = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta"]
-        slots = ["1º", "2º", "3º", "4º"]
-        
+        if grid is None:
+            grid = Grid(self.num_days, self.num_slots)
+        slots = grid.slot_names
+        width = max(len("Horário"), *(len(name) for name in slots))
+
         result = []
         for period in range(self.num_periods):
+            header = f"{'Horário':<{width}} | " + " | ".join(f"{day:^8}" for day in grid.day_names)
             result.append(f"\nPeríodo {period + 1}:")
-            result.append("Horário | " + " | ".join(days))
-            result.append("-" * 50)
-            
+            result.append(header)
+            result.append("-" * len(header))
+
             for slot in range(self.num_slots):
-                row = [f"{slots[slot]}"]
+                row = [f"{slots[slot]:<{width}}"]
                 for day in range(self.num_days):
                     subject_id = self.get_subject_at(period, day, slot)
                     row.append(f"{subject_id:^8}")
                 result.append(" | ".join(row))
-        
-        return "\n".join(result) 
\ No newline at end of file
+
+        return "\n".join(result)
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da grade horária.
+        """
+        return self.format()
@@ -0,0 +1,49 @@
+import pytest
+from genetic_algorithm_timetable_generator_ai import catalog as catalog_module
+from genetic_algorithm_timetable_generator_ai.catalog import Catalog
+
+HEADER = "id,name,teacher,workload,period\n"
+ROWS = ["1,Cálculo,Ana,8,1", "2,Física,Bruno,6,1", "3,Química,Ana,4,2"]
+
+def write_csv(path, rows):
+    path.write_text(HEADER + "\n".join(rows) + "\n", encoding="utf-8")
+    return str(path)
+
+@pytest.mark.parametrize("rows, message", [
+    (ROWS + ["2,Biologia,Carla,2,2"], "ids repetidos: [2]"),
+    (ROWS + ["-4,Biologia,Carla,2,2"], "ids não positivos nas disciplinas [-4]"),
+    (ROWS + ["4,Biologia,,2,2"], "professor vazio nas disciplinas [4]"),
+    (ROWS + ["4,Biologia,Carla,7,1"], "a carga horária do período 1 (21 aulas) excede o número de horários (20)"),
+])
+def test_invalid_records_are_rejected(tmp_path, rows, message):
+    path = write_csv(tmp_path / "catalog.csv", rows)
+    with pytest.raises(ValueError, match="Catálogo inválido") as error:
+        Catalog.load(path)
+    assert message in str(error.value)
+
+def test_second_load_reads_the_compiled_cache(tmp_path, monkeypatch):
+    path = write_csv(tmp_path / "catalog.csv", ROWS)
+    cache_dir = tmp_path / "cache"
+    first = Catalog.load(path, cache_dir=str(cache_dir))
+    cached = list(cache_dir.glob("catalog.v*.npy"))
+    assert len(cached) == 1
+
+    def read_records(path):
+        raise AssertionError("o arquivo de origem foi lido novamente")
+
+    monkeypatch.setattr(catalog_module, "read_records", read_records)
+    second = Catalog.load(path, cache_dir=str(cache_dir))
+
+    assert [vars(subject) for subject in second.subjects] == [vars(subject) for subject in first.subjects]
+    assert second.teacher.tolist() == first.teacher.tolist()
+
+def test_editing_the_file_invalidates_the_cache(tmp_path):
+    path = write_csv(tmp_path / "catalog.csv", ROWS)
+    cache_dir = tmp_path / "cache"
+    Catalog.load(path, cache_dir=str(cache_dir))
+
+    write_csv(tmp_path / "catalog.csv", ROWS + ["4,Biologia,Carla,2,2"])
+    edited = Catalog.load(path, cache_dir=str(cache_dir))
+
+    assert len(list(cache_dir.glob("catalog.v*.npy"))) == 2
+    assert edited.get(4).name == "Biologia"
@@ -0,0 +1,88 @@
+import random
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.checkpoint import load_checkpoint, save_checkpoint
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.stopping import StoppingCriteria
+
+PARAMETERS = {
+    "population_size": 60,
+    "mutation_rate": 0.2,
+    "crossover_rate": 0.85,
+    "elitism_count": 2,
+    "selection_method": "tournament",
+    "tournament_size": 3,
+    "seed": 1,
+}
+
+def checkpoint_at(path, generation, generations, stopping=None, **parameters):
+    """
+    Executa até a geração informada e grava um checkpoint (como o
+    CheckpointObserver, antes de verificar os critérios de parada).
+    """
+    ga = GeneticAlgorithm(stopping=stopping, **{**PARAMETERS, **parameters})
+    for record in ga.evolve(generations):
+        if record.generation == generation:
+            save_checkpoint(path, ga)
+            return
+    raise AssertionError(f"A execução terminou antes da geração {generation}")
+
+def assert_same_state(resumed, original):
+    assert resumed.generation == original.generation
+    assert resumed.stop_reason == original.stop_reason
+    assert np.array_equal(resumed.current_population.genes, original.current_population.genes)
+    assert np.array_equal(resumed.current_population.fitness, original.current_population.fitness)
+    assert resumed.rng.bit_generator.state == original.rng.bit_generator.state
+
+def rng_states():
+    """
+    Estado dos geradores globais (random e np.random) no momento da chamada.
+    """
+    numpy_state = np.random.get_state()
+    return random.getstate(), (numpy_state[0], numpy_state[1].tolist(), *numpy_state[2:])
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"local_search": "hill_climbing", "local_search_top_k": 2},
+    {"local_search": "tabu", "mutation_method": "conflict"},
+    {"workers": 2},
+], ids=["default", "hill_climbing", "tabu", "workers"])
+def test_resume_reproduces_the_uninterrupted_run(tmp_path, options):
+    workers = options.pop("workers", None)
+    original = GeneticAlgorithm(**{**PARAMETERS, **options})
+    original.run(12)
+    original_rng = rng_states()
+
+    path = tmp_path / "checkpoint.npz"
+    checkpoint_at(path, 5, 12, **options)
+    resumed = load_checkpoint(path, workers=workers)
+    resumed.run(12, resume=True)
+
+    assert_same_state(resumed, original)
+    assert resumed.best_fitness == original.best_fitness
+    assert np.array_equal(resumed.best_individual.schedule, original.best_individual.schedule)
+    assert rng_states() == original_rng
+
+def test_resume_keeps_stagnation_window(tmp_path):
+    original = GeneticAlgorithm(stopping=StoppingCriteria(stagnation=5), **PARAMETERS)
+    original.run(200)
+    assert original.stop_reason == StoppingCriteria.STAGNATION
+    assert original.generation > 2
+
+    path = tmp_path / "checkpoint.npz"
+    checkpoint_at(path, original.generation - 2, 200, stopping=StoppingCriteria(stagnation=5))
+    resumed = load_checkpoint(path, stopping=StoppingCriteria(stagnation=5))
+    resumed.run(200, resume=True)
+
+    assert_same_state(resumed, original)
+
+def test_resume_keeps_elapsed_time(tmp_path):
+    path = tmp_path / "checkpoint.npz"
+    checkpoint_at(path, 3, 10)
+    ga = load_checkpoint(path)
+    elapsed = ga.elapsed
+
+    records = list(ga.evolve(5, resume=True))
+
+    assert elapsed > 0
+    assert all(record.elapsed >= elapsed for record in records)
@@ -0,0 +1,20 @@
+import csv
+import json
+from genetic_algorithm_timetable_generator_ai import cli
+
+def test_csv_identifies_runs_and_includes_statistics(tmp_path):
+    sweep = tmp_path / "sweep.json"
+    sweep.write_text(json.dumps([{"mutation_rate": 0.1}, {"mutation_rate": 0.3}]))
+    output = tmp_path / "runs.csv"
+
+    cli.main(["--generations", "3", "--population-size", "10", "--seeds", "7",
+              "--sweep", str(sweep), "--format", "csv", "--output", str(output)])
+
+    with open(output, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    assert set(cli.RUN_FIELDS) <= set(rows[0])
+    runs = {(row["run"], row["parameter_set"], row["seed"]) for row in rows}
+    assert runs == {("0", "0", "7"), ("1", "1", "7")}
+    assert all(row["generations"] == "3" and row["stop_reason"] == "max_generations" for row in rows)
+    assert all(int(row["evaluations"]) > 0 and float(row["seconds"]) > 0 for row in rows)
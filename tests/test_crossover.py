@@ -0,0 +1,47 @@
+import itertools
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.benchmark import scaled_catalog
+from genetic_algorithm_timetable_generator_ai.crossover import OPERATORS
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.selection import select
+
+def assert_independent_children(genes):
+    for first, second in itertools.combinations(range(len(genes)), 2):
+        assert not np.shares_memory(genes[first], genes[second])
+
+@pytest.mark.parametrize("method", OPERATORS)
+def test_crossover_with_duplicate_parents_leaves_parents_unchanged(method):
+    ga = GeneticAlgorithm(20, 0.0, 1.0, selection_method="truncation", catalog=scaled_catalog(1),
+                          seed=3, crossover_method=method)
+    fitness = ga.start()
+    parents_genes = ga.current_population.genes
+    snapshot = parents_genes.copy()
+
+    # Truncamento com fração pequena: cada pai é selecionado várias vezes
+    parents = select("truncation", fitness, len(fitness), ga.rng, fraction=0.1)
+    assert len(np.unique(parents)) <= 2
+    ga.crossover(parents)
+
+    children = ga.current_population.genes
+    assert np.array_equal(parents_genes, snapshot)
+    assert not np.shares_memory(children, parents_genes)
+    assert_independent_children(children)
+
+    # Alterar um filho não altera os outros filhos do mesmo pai
+    before = children.copy()
+    children[0] += 1
+    assert np.array_equal(children[1:], before[1:])
+
+def test_step_with_truncation_selection_keeps_previous_generation_intact():
+    ga = GeneticAlgorithm(20, 0.5, 1.0, elitism_count=2, selection_method="truncation",
+                          catalog=scaled_catalog(1), seed=5)
+    ga.start()
+    previous = ga.current_population.genes
+    snapshot = previous.copy()
+
+    ga.step()
+
+    assert np.array_equal(previous, snapshot)
+    assert not np.shares_memory(ga.current_population.genes, previous)
+    assert_independent_children(ga.current_population.genes)
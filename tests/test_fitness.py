@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.benchmark import grid_catalog, scaled_catalog
+from genetic_algorithm_timetable_generator_ai.constraints import (
+    ConsecutiveClasses, ConstraintRegistry, MaxDailyClasses, SlotGaps, TeacherConflicts
+)
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.population import Population
+
+CATALOGS = {
+    "mock": lambda: scaled_catalog(1),
+    "scale_10": lambda: scaled_catalog(10),
+    "grid_6x5": lambda: grid_catalog(8, 6, 5, seed=3),
+}
+
+def random_population(ga, size, seed):
+    """
+    Mistura indivíduos válidos (permutações da carga horária) com grades
+    totalmente aleatórias, que têm muito mais conflitos e gaps.
+    """
+    rng = np.random.default_rng(seed)
+    population = Population.empty(size, ga.num_periods, ga.num_days, ga.num_slots, ga.catalog.max_id)
+    population.genes[:] = ga.base_schedule()
+    rng.permuted(population.genes, axis=-1, out=population.genes)
+    population.genes[size // 2:] = rng.integers(0, ga.catalog.max_id + 1,
+                                                size=population.genes[size // 2:].shape)
+    return population
+
+@pytest.mark.parametrize("name", CATALOGS)
+def test_batch_evaluation_matches_individual_fitness(name):
+    ga = GeneticAlgorithm(10, 0.1, 0.8, catalog=CATALOGS[name]())
+    population = random_population(ga, 12, seed=len(name))
+
+    fitness = ga.evaluator.evaluate(population.genes)
+    expected = [ga.individual_fitness(population[index]) for index in range(len(population))]
+
+    assert fitness.tolist() == expected
+
+def test_individual_fitness_uses_registry_weights():
+    registry = ConstraintRegistry([TeacherConflicts(-7), SlotGaps(-3), ConsecutiveClasses(4),
+                                   MaxDailyClasses(-2, limit=1)], base=100)
+    ga = GeneticAlgorithm(10, 0.1, 0.8, catalog=scaled_catalog(1), constraints=registry)
+    population = random_population(ga, 8, seed=5)
+
+    fitness = ga.evaluator.evaluate(population.genes)
+    expected = [ga.individual_fitness(population[index]) for index in range(len(population))]
+
+    assert fitness.tolist() == expected
+
+@pytest.mark.parametrize("weight", [-0.5, 2.25, "3", None])
+def test_fractional_or_non_numeric_weights_are_rejected(weight):
+    with pytest.raises(ValueError, match="peso da regra max_daily_classes"):
+        MaxDailyClasses(weight, limit=2)
+
+def test_integral_float_weights_are_converted():
+    constraint = MaxDailyClasses(-2.0, limit=2)
+    assert constraint.weight == -2 and isinstance(constraint.weight, int)
+    with pytest.raises(ValueError):
+        constraint.weight = 0.5
+    with pytest.raises(ValueError, match="aptidão base"):
+        ConstraintRegistry(base=499.5)
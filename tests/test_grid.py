@@ -0,0 +1,50 @@
+import json
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.benchmark import grid_catalog
+from genetic_algorithm_timetable_generator_ai.catalog import Catalog
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.grid import Grid
+from genetic_algorithm_timetable_generator_ai.timetable import Timetable
+
+def test_large_grid_runs_with_day_block_mutation_and_local_search():
+    catalog = grid_catalog(200, 6, 10, seed=0)
+    ga = GeneticAlgorithm(6, 0.3, 0.85, elitism_count=1, selection_method="tournament", tournament_size=2,
+                          catalog=catalog, seed=0, mutation_method="day_block",
+                          local_search="hill_climbing", local_search_top_k=1, local_search_iterations=3)
+
+    best_individual, best_fitness = ga.run(2)
+
+    genes = ga.current_population.genes
+    assert genes.shape == (6, 200, 60)
+    # Mutação e busca local só trocam horários dentro de cada linha de período
+    assert np.array_equal(np.sort(genes, axis=-1), np.sort(np.broadcast_to(ga.base_schedule(), genes.shape), axis=-1))
+    assert best_fitness == ga.evaluator.evaluate(best_individual.schedule[np.newaxis])[0]
+
+def test_format_uses_grid_names():
+    grid = Grid(3, 2, day_names=["Seg", "Qua", "Sex"], slot_names=["Manhã", "Tarde"])
+    timetable = Timetable(1, 3, 2)
+    timetable.set_subject_at(0, 2, 1, 7)
+
+    lines = timetable.format(grid).splitlines()
+
+    assert "Seg" in lines[2] and "Sex" in lines[2]
+    assert len(lines[3]) == len(lines[2])
+    assert lines[5].startswith("Tarde") and lines[5].split("|")[3].strip() == "7"
+
+def test_fractional_slot_weights_are_rejected():
+    with pytest.raises(ValueError, match=r"slot_weights\[1\].*2\.5"):
+        Grid(2, 3, slot_weights=[5, 2.5, 5])
+
+    grid = Grid(2, 3, slot_weights=[5.0, -10, 5], slot_pair_weights={(0, 1): 15.0})
+    assert grid.slot_weights == (5, -10, 5) and type(grid.slot_pair_weights[(0, 1)]) is int
+
+def test_catalog_with_fractional_pair_weight_is_rejected(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({
+        "grid": {"num_days": 2, "num_slots": 3, "slot_pair_weights": [[0, 1, 7.5]]},
+        "subjects": [{"id": 1, "name": "Cálculo", "teacher": "Ana", "workload": 2, "period": 1}],
+    }), encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"slot_pair_weights\(0, 1\).*7\.5"):
+        Catalog.load(str(path))
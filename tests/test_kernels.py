@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai import constraints, kernels
+from genetic_algorithm_timetable_generator_ai.constraints import numpy_consecutive_classes, numpy_gap_score
+from genetic_algorithm_timetable_generator_ai.grid import Grid
+
+SHAPES = [(5, 4), (6, 10), (3, 7), (1, 1)]
+DTYPES = [np.uint8, np.uint16]
+
+def random_days(num_days, num_slots, dtype, seed, size=40, periods=6):
+    """
+    Tensor (tamanho, periods * num_days, num_slots) com muitos horários vagos
+    e ids que usam toda a faixa do tipo, e a máscara dos ids vagos.
+    """
+    rng = np.random.default_rng(seed)
+    max_id = np.iinfo(dtype).max
+    ids = np.concatenate([[0] * 8, rng.integers(1, max_id + 1, size=8)])
+    days = rng.choice(ids, size=(size, periods * num_days, num_slots)).astype(dtype)
+    is_empty = np.zeros(max_id + 1, dtype=bool)
+    is_empty[0] = True
+    is_empty[ids[-2:]] = True  # Disciplinas vazias de outros períodos
+    return days, is_empty
+
+def assert_parity(gap_score, consecutive_classes, num_days, num_slots, dtype):
+    grid = Grid(num_days, num_slots)
+    days, is_empty = random_days(num_days, num_slots, dtype, seed=num_days * num_slots)
+    pairs = kernels.pair_arrays(grid.slot_pair_weights)
+
+    expected_gaps = numpy_gap_score(days, grid.slot_weights, grid.slot_pair_weights)
+    assert np.array_equal(gap_score(days, np.asarray(grid.slot_weights, dtype=np.int64), *pairs), expected_gaps)
+    assert np.array_equal(consecutive_classes(days, is_empty), numpy_consecutive_classes(days, is_empty))
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("num_days, num_slots", SHAPES)
+def test_kernel_loops_match_numpy(num_days, num_slots, dtype):
+    assert_parity(kernels._gap_score, kernels._consecutive_classes, num_days, num_slots, dtype)
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("num_days, num_slots", SHAPES)
+def test_compiled_kernels_match_numpy(num_days, num_slots, dtype):
+    pytest.importorskip("numba")
+    assert_parity(kernels.compiled(kernels._gap_score), kernels.compiled(kernels._consecutive_classes),
+                  num_days, num_slots, dtype)
+
+def test_engine_import_does_not_load_numba():
+    probe = "import sys, genetic_algorithm_timetable_generator_ai.GeneticAlgorithm; print('numba' in sys.modules)"
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(kernels.__file__)))
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": package_root})
+    assert result.stdout.strip() == "False"
+
+def test_broken_numba_falls_back_to_numpy(monkeypatch):
+    # Um None em sys.modules faz o import levantar ImportError
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.setattr(kernels, "BACKEND", "numba")
+    monkeypatch.setattr(kernels, "_compiled", {})
+    grid = Grid(5, 4)
+    days, is_empty = random_days(5, 4, np.uint8, seed=0)
+
+    gaps = constraints.gap_score(days, grid.slot_weights, grid.slot_pair_weights)
+
+    assert kernels.BACKEND == "numpy"
+    assert np.array_equal(gaps, numpy_gap_score(days, grid.slot_weights, grid.slot_pair_weights))
+    assert np.array_equal(kernels.consecutive_classes(days, is_empty), numpy_consecutive_classes(days, is_empty))
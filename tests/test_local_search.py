@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.benchmark import grid_catalog, scaled_catalog
+from genetic_algorithm_timetable_generator_ai.catalog import Catalog
+from genetic_algorithm_timetable_generator_ai.constraints import (Constraint, ConstraintRegistry, MaxDailyClasses,
+                                                               RoomCapacity, TeacherUnavailability)
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.grid import Grid
+from genetic_algorithm_timetable_generator_ai.local_search import SwapNeighborhood
+from genetic_algorithm_timetable_generator_ai.subject import Subject
+
+def swapped(schedule, neighborhood, move):
+    schedule = schedule.copy()
+    period, first, second = neighborhood.period[move], neighborhood.first[move], neighborhood.second[move]
+    schedule[period, first], schedule[period, second] = schedule[period, second], schedule[period, first]
+    return schedule
+
+@pytest.mark.parametrize("catalog", [scaled_catalog(1), grid_catalog(10, 6, 5, seed=1)])
+def test_cached_deltas_match_a_fresh_neighborhood(catalog):
+    ga = GeneticAlgorithm(4, 0.1, 0.8, catalog=catalog, seed=2)
+    ga.start()
+    schedule = ga.current_population.genes[0].copy()
+    neighborhood = SwapNeighborhood(ga.evaluator, schedule)
+    rng = np.random.default_rng(0)
+
+    for _ in range(20):
+        deltas = neighborhood.deltas().copy()
+        assert np.array_equal(deltas, SwapNeighborhood(ga.evaluator, schedule.copy()).deltas())
+
+        move = rng.integers(len(neighborhood))
+        before = ga.evaluator.evaluate(schedule[np.newaxis])[0]
+        neighborhood.apply(move)
+        assert ga.evaluator.evaluate(schedule[np.newaxis])[0] - before == deltas[move]
+
+def extra_rule(name, catalog):
+    if name == "max_daily":
+        return MaxDailyClasses(-3, limit=1)
+    if name == "unavailability":
+        return TeacherUnavailability(-5, {teacher: range(0, catalog.grid.total_slots, 3) for teacher in catalog.teachers})
+    subjects = np.flatnonzero(catalog.teacher >= 0)
+    return RoomCapacity(-2, {int(subject): "lab" if subject % 2 else "sala" for subject in subjects},
+                        {"lab": 1, "sala": 2})
+
+@pytest.mark.parametrize("rule", ["max_daily", "unavailability", "room_capacity"])
+def test_rule_swap_index_matches_a_complete_evaluation(rule):
+    catalog = scaled_catalog(1)
+    registry = ConstraintRegistry.default()
+    registry.register(extra_rule(rule, catalog))
+    ga = GeneticAlgorithm(4, 0.1, 0.8, catalog=catalog, constraints=registry, seed=2)
+    ga.start()
+    schedule = ga.current_population.genes[0].copy()
+    neighborhood = SwapNeighborhood(ga.evaluator, schedule)
+    assert not neighborhood.complete
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        deltas = neighborhood.deltas()
+        assert neighborhood.candidates.all()
+        current = ga.evaluator.evaluate(schedule[np.newaxis])[0]
+        neighbors = np.stack([swapped(schedule, neighborhood, move) for move in range(len(neighborhood))])
+        assert np.array_equal(deltas, ga.evaluator.evaluate(neighbors) - current)
+        neighborhood.apply(rng.integers(len(neighborhood)))
+
+class DistinctSubjectsPerDay(Constraint):
+    name = "distinct_subjects"
+
+    def count(self, context):
+        days = np.sort(context.days, axis=-1)
+        return np.sum(days[..., 1:] != days[..., :-1], axis=(1, 2))
+
+def test_rules_without_index_are_sampled_and_evaluated_in_chunks():
+    registry = ConstraintRegistry.default()
+    registry.register(DistinctSubjectsPerDay(-1))
+    ga = GeneticAlgorithm(4, 0.1, 0.8, catalog=scaled_catalog(1), constraints=registry, seed=2)
+    ga.start()
+    schedule = ga.current_population.genes[0].copy()
+    neighborhood = SwapNeighborhood(ga.evaluator, schedule, np.random.default_rng(0))
+    neighborhood.CHUNK_CELLS = 10 * schedule.size
+    neighborhood.MAX_SAMPLED_MOVES = 50
+
+    deltas = neighborhood.deltas()
+    sample = np.flatnonzero(neighborhood.candidates)
+    assert len(sample) == 50
+    current = ga.evaluator.evaluate(schedule[np.newaxis])[0]
+    neighbors = np.stack([swapped(schedule, neighborhood, move) for move in sample])
+    assert np.array_equal(deltas[sample], ga.evaluator.evaluate(neighbors) - current)
+
+@pytest.mark.parametrize("method", ["hill_climbing", "tabu"])
+def test_single_slot_grid_has_no_moves(method):
+    catalog = Catalog([Subject(1, "Disciplina", "Professor", 1, 1)], {1: [1]}, Grid(1, 1))
+    ga = GeneticAlgorithm(6, 0.2, 0.8, catalog=catalog, seed=0, local_search=method)
+
+    _, best_fitness = ga.run(3)
+
+    assert best_fitness == ga.evaluator.evaluate(ga.best_individual.schedule[np.newaxis])[0]
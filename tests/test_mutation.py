@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.benchmark import grid_catalog, scaled_catalog
+from genetic_algorithm_timetable_generator_ai.constraints import ConstraintRegistry, MaxDailyClasses
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.mutation import Mutation
+
+@pytest.mark.parametrize("catalog", [scaled_catalog(1), grid_catalog(10, 6, 5, seed=1)], ids=["mock", "grid_6x5"])
+@pytest.mark.parametrize("method", Mutation.METHODS)
+def test_incremental_mutation_fitness_matches_full_evaluation(catalog, method):
+    ga = GeneticAlgorithm(30, 0.0, 0.0, catalog=catalog, seed=4)
+    ga.start()
+    population = ga.current_population
+    operator = Mutation(method, rate=0.5, swaps=3)
+
+    for _ in range(3):
+        mutated = operator.apply(population, ga.rng, ga.catalog, ga.evaluator)
+        assert len(mutated) > 0
+        assert population.evaluated.all()
+        assert np.array_equal(population.fitness, ga.evaluator.evaluate(population.genes))
+
+def test_mutation_invalidates_with_non_local_rules():
+    registry = ConstraintRegistry.default()
+    registry.register(MaxDailyClasses(-1, limit=1))
+    ga = GeneticAlgorithm(20, 0.0, 0.0, catalog=scaled_catalog(1), constraints=registry, seed=4)
+    ga.start()
+
+    mutated = Mutation("swap", rate=0.5).apply(ga.current_population, ga.rng, ga.catalog, ga.evaluator)
+
+    assert np.array_equal(ga.current_population.stale(), mutated)
+
+@pytest.mark.parametrize("method", Mutation.METHODS)
+def test_debug_run_checks_mutated_individuals(method):
+    ga = GeneticAlgorithm(20, 0.4, 0.8, elitism_count=2, catalog=scaled_catalog(1), seed=1, debug=True,
+                          mutation_method=method, mutation_swaps=2)
+    ga.run(5)
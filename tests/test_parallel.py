@@ -0,0 +1,20 @@
+import numpy as np
+from genetic_algorithm_timetable_generator_ai.benchmark import scaled_catalog
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.parallel import ParallelEvaluator
+
+def test_parallel_rows_match_serial_and_reuse_the_segment():
+    ga = GeneticAlgorithm(40, 0.0, 0.0, catalog=scaled_catalog(1), seed=0)
+    genes = ga.initialize_population().genes
+    rng = np.random.default_rng(0)
+
+    with ParallelEvaluator(ga.evaluator, 2, capacity=len(genes)) as evaluator:
+        for size in (40, 7, 23, 1, 40):
+            rows = np.sort(rng.choice(len(genes), size=size, replace=False))
+            assert np.array_equal(evaluator.evaluate(genes, rows), ga.evaluator.evaluate(genes[rows]))
+        assert evaluator.segments_created == 1
+
+        bigger = np.concatenate([genes, genes])
+        assert np.array_equal(evaluator.evaluate(bigger), ga.evaluator.evaluate(bigger))
+        assert evaluator.segments_created == 2
+        assert evaluator.capacity == len(bigger)
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+from genetic_algorithm_timetable_generator_ai.GeneticAlgorithm import GeneticAlgorithm
+from genetic_algorithm_timetable_generator_ai.selection import select
+
+@pytest.mark.parametrize("size", [None, 0, -1])
+def test_tournament_requires_a_size(size):
+    with pytest.raises(ValueError, match="tamanho do torneio"):
+        select("tournament", np.arange(10), 10, np.random.default_rng(0), size=size)
+
+def test_tournament_without_size_fails_loudly():
+    ga = GeneticAlgorithm(10, 0.1, 0.8, selection_method="tournament", seed=0)
+    with pytest.raises(ValueError, match="tamanho do torneio"):
+        ga.run(1)
+
+def test_tournament_picks_the_best_participant():
+    fitness = np.arange(50)
+    parents = select("tournament", fitness, 2000, np.random.default_rng(0), size=4)
+    # Com torneios de 4, a média dos vencedores fica bem acima da média da população
+    assert fitness[parents].mean() > 35